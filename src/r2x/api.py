@@ -1,17 +1,26 @@
 """R2X API for data model."""
 
 import csv
+import hashlib
+from collections import defaultdict
 from collections.abc import Callable
 from os import PathLike
 from pathlib import Path
+from uuid import UUID
 from collections.abc import Iterable
 from loguru import logger
 
 import inspect
+import numpy as np
 from infrasys.component import Component
 from infrasys.system import System as ISSystem
+from infrasys.time_series_models import SingleTimeSeries, TimeSeriesData
+from pint import Quantity
 
 from .__version__ import __data_model_version__
+from .models import Reserve
+
+DICT_WRITER_ARGS = frozenset(inspect.getfullargspec(csv.DictWriter).args)
 
 
 class System(ISSystem):
@@ -20,6 +29,8 @@ class System(ISSystem):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.data_format_version = __data_model_version__
+        # Only the uuid is kept, the data of the stored time series lives in the time series storage.
+        self._time_series_uuids: dict[str, UUID] = {}
 
     def __str__(self) -> str:
         return f"System(name={self.name}, DataModel Version={self.version})"
@@ -39,6 +50,36 @@ class System(ISSystem):
     def from_json(cls, filename: Path | str, upgrade_handler: Callable | None = None, **kwargs) -> "System":  # noqa: D102
         return super().from_json(filename=filename, upgrade_handler=upgrade_handler, **kwargs)  # type: ignore
 
+    def add_time_series(self, time_series: TimeSeriesData, *owners, **user_attributes):
+        """Attach a time series to the owners, storing identical series only once.
+
+        A `SingleTimeSeries` with the same variable name, start, resolution, units and values as one
+        already added takes the uuid of the stored one, so every owner references the same data and the
+        duplicated array is not written to the time series storage.
+        """
+        if isinstance(time_series, SingleTimeSeries):
+            ts_hash = _hash_single_time_series(time_series)
+            ts_uuid = self._time_series_uuids.setdefault(ts_hash, time_series.uuid)
+            if ts_uuid != time_series.uuid:
+                logger.trace("Reusing time series {} for {}", ts_uuid, owners)
+                time_series.uuid = ts_uuid
+        return super().add_time_series(time_series, *owners, **user_attributes)
+
+    def get_reserves_by_region(self, filter_func: Callable | None = None) -> dict[str, list[Reserve]]:
+        """Return the reserves of the system indexed by the name of their region.
+
+        Use it instead of filtering the reserves by region for every device. Reserves without a region
+        are not included.
+
+        filter_func:
+            Optional filter applied to the reserves.
+        """
+        reserves_by_region: dict[str, list[Reserve]] = defaultdict(list)
+        for reserve in self.get_components(Reserve, filter_func=filter_func):
+            if reserve.region is not None:
+                reserves_by_region[reserve.region.name].append(reserve)
+        return dict(reserves_by_region)
+
     def export_component_to_csv(
         self,
         component: type[Component],
@@ -87,19 +128,41 @@ class System(ISSystem):
         **dict_writer_kwargs,
     ):
         dict_writer_kwargs = {
-            key: value
-            for key, value in dict_writer_kwargs.items()
-            if key in inspect.getfullargspec(csv.DictWriter).args
+            key: value for key, value in dict_writer_kwargs.items() if key in DICT_WRITER_ARGS
         }
 
         with open(str(fpath), "w", newline="") as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fields, extrasaction="ignore", **dict_writer_kwargs)  # type: ignore
             writer.writeheader()
-            for row in data:
-                writer.writerow(row)
+            writer.writerows(data)
         return
 
 
+def _hash_single_time_series(time_series: SingleTimeSeries) -> str:
+    """Return a digest of the content of a time series."""
+    data = time_series.data
+    units = ""
+    if isinstance(data, Quantity):
+        units = str(data.units)
+        data = data.magnitude
+    array = np.ascontiguousarray(data)
+    digest = hashlib.blake2b(array.view(np.uint8).data, digest_size=16)
+    digest.update(
+        repr(
+            (
+                type(time_series).__name__,
+                time_series.variable_name,
+                time_series.initial_time,
+                time_series.resolution,
+                units,
+                array.dtype.str,
+                array.shape,
+            )
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
 if __name__ == "__main__":
     from .logger import setup_logging
     from rich.console import Console
@@ -96,6 +96,13 @@ def base_cli() -> argparse.ArgumentParser:
     group_run = run_command.add_argument_group("Options for running the code")
     group_run.add_argument("--inspect", action="store_true", help="Inspect resulting infrasys system.")
     group_run.add_argument("--upgrade", action="store_true", help="Run upgrader logic.")
+    group_run.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        dest="jobs",
+        help="Number of scenarios to translate in parallel. Each scenario runs on its own process.",
+    )
     group = group_run.add_mutually_exclusive_group(required=True)
     group.add_argument(
         "-i",
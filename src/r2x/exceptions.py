@@ -32,3 +32,7 @@ class ParserError(Exception):
 
 class FieldRemovalError(Exception):
     pass
+
+
+class ScenarioRunError(Exception):
+    pass
@@ -1,21 +1,23 @@
 """Exporter base class."""
 
 from abc import ABC, abstractmethod
+import gzip
 import string
 from collections import defaultdict
 from collections.abc import Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import pandas as pd
 import numpy as np
+import polars as pl
 import infrasys
 from loguru import logger
 from pint import Quantity
 
 from r2x.api import System
 from r2x.config_scenario import Scenario
-from r2x.exporter.utils import modify_components
+from r2x.exporter.utils import apply_export_pipeline, compile_export_pipeline
 from r2x.parser.handler import file_handler
 
 OUTPUT_FNAME = "{self.weather_year}"
@@ -59,6 +61,8 @@ class BaseExporter(ABC):
         self.ts_directory = Path(ts_directory)
         self.time_series_objects: dict[str, list[Any]] = defaultdict(list)
         self.time_series_name_by_type: dict[str, list[Any]] = defaultdict(list)
+        # Path of the file written for each component type by `export_data_files`.
+        self.time_series_files: dict[str, Path] = {}
         self._handle_data_folder(config.output_folder, self.ts_directory)
 
     def _handle_data_folder(self, output_folder: str | Path, folder_name: str | Path) -> None:
@@ -100,15 +104,37 @@ class BaseExporter(ABC):
                 data = func(data, **kwargs)
         return data
 
-    def export_data_files(self, year: int, time_series_folder: str = "Data") -> None:
+    def export_data_files(
+        self,
+        year: int,
+        time_series_folder: str = "Data",
+        file_format: Literal["csv", "parquet"] | None = None,
+        float_precision: int | None = None,
+        compression: str | None = None,
+    ) -> None:
         """Export all time series objects attached to components.
 
         This method assumes that `self.config.weather_year and `self.output_folder` exist.
 
+        The path of each written file is stored in `self.time_series_files`, since the suffix depends on the
+        file format and the compression.
+
         Parameters
         ----------
+        year: int
+            Year of the first timestamp of the time series.
         time_series_folder: str
             Folder name to save time series data
+        file_format: str, optional
+            Either csv or parquet. Defaults to the `time-series-format` feature flag or csv.
+        float_precision: int, optional
+            Number of decimals of the exported values. Defaults to the `time-series-precision` feature flag.
+        compression: str, optional
+            Compression codec. Defaults to the `time-series-compression` feature flag.
+
+        See Also
+        --------
+        write_time_series_table
         """
         assert year is not None
         config_dict = self.config.__dict__
@@ -141,14 +167,11 @@ class BaseExporter(ABC):
 
         datetime_arrays = {
             component_type: (
-                np.datetime_as_string(
-                    pd.date_range(
-                        start=f"1/1/{year}",
-                        periods=ts.length,
-                        freq=f"{int(ts.resolution.total_seconds() / 60)}min",  # Convert resolution to minutes
-                    ),
-                    unit="m",
-                ),
+                pd.date_range(
+                    start=f"1/1/{year}",
+                    periods=ts.length,
+                    freq=f"{int(ts.resolution.total_seconds() / 60)}min",  # Convert resolution to minutes
+                ).to_numpy(),
                 time_series,
             )
             for component_type, time_series in self.time_series_objects.items()
@@ -161,29 +184,149 @@ class BaseExporter(ABC):
         logger.trace("Using {} as time_series name", csv_fname)
         string_template = string.Template(csv_fname)
 
+        feature_flags = self.config.feature_flags
+        file_format = file_format or feature_flags.get("time-series-format", "csv")
+        if float_precision is None and (precision := feature_flags.get("time-series-precision")) is not None:
+            float_precision = int(precision)
+        compression = compression or feature_flags.get("time-series-compression")
+
         for component_type, (datetime_array, time_series) in datetime_arrays.items():
             time_series_arrays = list(
                 map(lambda x: x.data.magnitude if isinstance(x.data, Quantity) else x.data, time_series)
             )
             config_dict["component_type"] = component_type
             csv_fname = string_template.safe_substitute(config_dict)
-            csv_table = np.column_stack([datetime_array, *time_series_arrays])
-            header = '"DateTime",' + ",".join(
-                [f'"{name}"' for name in self.time_series_name_by_type[component_type]]
-            )
-
-            np.savetxt(
+            self.time_series_files[component_type] = write_time_series_table(
                 csv_fpath / csv_fname,
-                csv_table,
-                header=header,
-                delimiter=",",
-                comments="",
-                fmt="%s",
+                datetime_array,
+                self.time_series_name_by_type[component_type],
+                time_series_arrays,
+                file_format=file_format,
+                float_precision=float_precision,
+                compression=compression,
             )
 
         return
 
 
+def write_time_series_table(
+    fpath: Path,
+    datetime_array: np.ndarray,
+    names: list[str],
+    arrays: list[np.ndarray],
+    file_format: Literal["csv", "parquet"] = "csv",
+    float_precision: int | None = None,
+    compression: str | None = None,
+) -> Path:
+    """Write the time series of a component type as a single table.
+
+    Each array becomes a column of a Polars frame without copying the data, and the frame is written with
+    the native CSV or Parquet writer. The CSV output has a header with `DateTime` followed by the component
+    names, quoted only when necessary, and the timestamps formatted as `%Y-%m-%dT%H:%M`.
+
+    Parameters
+    ----------
+    fpath : Path
+        Output file path. For Parquet files the suffix is replaced with `.parquet`.
+    datetime_array : np.ndarray
+        Timestamps of the time series.
+    names : list[str]
+        Names of the components, in the same order as `arrays`.
+    arrays : list[np.ndarray]
+        Values of each time series.
+    file_format : {"csv", "parquet"}, optional
+        Output format (default is "csv").
+    float_precision : int | None, optional
+        Number of decimals of the floats. Uses the shortest representation if None.
+    compression : str | None, optional
+        Compression codec. CSV files only support "gzip", which appends `.gz` to the file name. Parquet
+        files accept any codec supported by Polars (e.g., "zstd" or "snappy").
+
+    Returns
+    -------
+    Path
+        Path of the written file.
+
+    Raises
+    ------
+    ValueError
+        If the file format or the CSV compression is not supported.
+    """
+    columns = [pl.Series("DateTime", datetime_array)]
+    columns.extend(pl.Series(f"column_{idx}", array) for idx, array in enumerate(arrays))
+    table = pl.DataFrame(columns)
+    table.columns = ["DateTime", *names]
+
+    match file_format:
+        case "csv":
+            if compression not in (None, "gzip"):
+                raise ValueError(f"Compression {compression} not supported for csv files. Use gzip.")
+            if compression == "gzip":
+                fpath = fpath.with_name(f"{fpath.name}.gz")
+            csv_options: dict[str, Any] = {
+                "datetime_format": "%Y-%m-%dT%H:%M",
+                "float_precision": float_precision,
+            }
+            if compression == "gzip":
+                with gzip.open(fpath, "wb") as f:
+                    f.write(table.write_csv(**csv_options).encode())
+            else:
+                table.write_csv(fpath, **csv_options)
+        case "parquet":
+            if float_precision is not None:
+                table = table.with_columns(pl.selectors.float().round(float_precision))
+            fpath = fpath.with_suffix(".parquet")
+            table.write_parquet(fpath, compression=compression or "zstd")
+        case _:
+            raise ValueError(f"Time series format {file_format} not supported. Use csv or parquet.")
+    return fpath
+
+
+def write_records_table(
+    fpath: Path, table: pl.DataFrame, file_format: Literal["csv", "parquet"] = "csv"
+) -> Path:
+    """Write a table of component records with the native CSV or Parquet writer.
+
+    CSV files keep the format of `csv.DictWriter`: CRLF line endings and booleans written as `True` and
+    `False`.
+
+    Parameters
+    ----------
+    fpath : Path
+        Output file path. For Parquet files the suffix is replaced with `.parquet`.
+    table : pl.DataFrame
+        Records to write. Typically created with `records_to_frame`.
+    file_format : {"csv", "parquet"}, optional
+        Output format (default is "csv").
+
+    Returns
+    -------
+    Path
+        Path of the written file.
+
+    Raises
+    ------
+    ValueError
+        If the file format is not supported.
+
+    See Also
+    --------
+    records_to_frame
+    """
+    match file_format:
+        case "csv":
+            table = table.with_columns(
+                pl.selectors.boolean().replace_strict({True: "True", False: "False"}, return_dtype=pl.String)
+            )
+            table.write_csv(fpath, line_terminator="\r\n")
+        case "parquet":
+            fpath = fpath.with_suffix(".parquet")
+            table.write_parquet(fpath)
+        case _:
+            raise ValueError(f"Table format {file_format} not supported. Use csv or parquet.")
+    return fpath
+
+
 def get_export_records(component_list: list[dict[str, Any]], *update_funcs: Callable) -> list[dict[str, Any]]:
     """Apply update functions to a list of components and return the modified list.
 
@@ -212,8 +355,7 @@ def get_export_records(component_list: list[dict[str, Any]], *update_funcs: Call
     >>> updated_components
     [{'id': 'PREFIX_001', 'name': 'COMPONENT A'}, {'id': 'PREFIX_002', 'name': 'COMPONENT B'}]
     """
-    update_functions = modify_components(*update_funcs)
-    return [update_functions(component) for component in component_list]
+    return apply_export_pipeline(list(component_list), compile_export_pipeline(*update_funcs))
 
 
 def get_export_properties(component, *update_funcs: Callable) -> dict[str, Any]:
@@ -246,8 +388,7 @@ def get_export_properties(component, *update_funcs: Callable) -> dict[str, Any]:
     >>> updated_component
     {'id': '003', 'name': 'Component C', 'status': 'active', 'last_updated': '2024-09-27T10:30'}
     """
-    update_functions = modify_components(*update_funcs)
-    return update_functions(component)
+    return compile_export_pipeline(*update_funcs)(component)
 
 
 def get_exporter(
@@ -1,12 +1,14 @@
 """Create PLEXOS model from translated ReEDS data."""
 
 from argparse import ArgumentParser
-from functools import partial
+from collections import defaultdict
+from contextlib import contextmanager
 from importlib.resources import files
+import sqlite3
 from typing import Any
 import uuid
 import string
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 
 
 from infrasys.component import Component
@@ -14,15 +16,12 @@ from loguru import logger
 
 from r2x.config_models import PlexosConfig, ReEDSConfig
 from r2x.enums import ReserveType
-from r2x.exporter.handler import BaseExporter, get_export_properties, get_export_records
+from r2x.exporter.handler import BaseExporter
 from plexosdb import PlexosSQLite
 from plexosdb.enums import ClassEnum, CollectionEnum
 from r2x.exporter.utils import (
-    apply_extract_key,
-    apply_flatten_key,
-    apply_pint_deconstruction,
-    apply_property_map,
-    apply_valid_properties,
+    apply_export_pipeline,
+    compile_export_pipeline,
     get_reserve_type,
 )
 from r2x.models import (
@@ -128,7 +127,17 @@ class PlexosExporter(BaseExporter):
         """Run the exporter."""
         logger.info("Starting {}", self.__class__.__name__)
 
-        self.export_data_files(year=self.weather_year)
+        # PLEXOS only reads uncompressed csv data files.
+        feature_flags = self.config.feature_flags
+        if feature_flags.get("time-series-format", "csv") != "csv" or feature_flags.get(
+            "time-series-compression"
+        ):
+            msg = (
+                "PLEXOS data files must be uncompressed csv files. The `time-series-format` and "
+                "`time-series-compression` feature flags are only supported by the Sienna exporter."
+            )
+            raise ValueError(msg)
+        self.export_data_files(year=self.weather_year, file_format="csv")
 
         # If starting w/o a reference file we add our custom models and objects
         if new_database:
@@ -169,6 +178,9 @@ class PlexosExporter(BaseExporter):
         config_dict["component_type"] = f"{component.__class__.__name__}_{ts_metadata.variable_name}"
         config_dict["weather_year"] = self.weather_year
         csv_fname = string_template.safe_substitute(config_dict)
+        # Point to the file written by `export_data_files`, which has the suffix of the time series format.
+        if (ts_fpath := self.time_series_files.get(config_dict["component_type"])) is not None:
+            csv_fname = ts_fpath.name
         csv_fpath = self.ts_directory / csv_fname
         time_series_property: dict[str, Any] = {"Data File": str(csv_fpath)}
 
@@ -214,6 +226,22 @@ class PlexosExporter(BaseExporter):
                 raise NotImplementedError(f"Time Series for {component.label} not supported yet.")
         return time_series_property
 
+    def _get_time_series_records(self, component, name: str | None = None) -> list[dict[str, Any]]:
+        """Return the time series properties of a component as records for `bulk_add_properties`."""
+        time_series_properties = self._get_time_series_properties(component)
+        if not time_series_properties:
+            return []
+        text = time_series_properties.pop("Data File")
+        return [
+            {
+                "name": name or component.name,
+                "property": property_name,
+                "value": property_value,
+                "text": {"Data File": text},
+            }
+            for property_name, property_value in time_series_properties.items()
+        ]
+
     def insert_component_properties(
         self,
         component_type: type["Component"],
@@ -256,15 +284,17 @@ class PlexosExporter(BaseExporter):
                 custom_map = {}
         property_map = self.property_map | custom_map
 
-        export_records = get_export_records(
-            records,
-            partial(apply_operation_cost),
-            partial(apply_extract_key, key="ext", keys_to_extract=EXT_PROPERTIES),
-            partial(apply_flatten_key, keys_to_flatten={"active_power_limits", "active_power_flow_limits"}),
-            partial(apply_property_map, property_map=property_map),
-            partial(apply_pint_deconstruction, unit_map=self.default_units),
-            partial(apply_valid_properties, valid_properties=collection_properties, add_name=True),
+        export_pipeline = compile_export_pipeline(
+            apply_operation_cost,
+            extract_key="ext",
+            keys_to_extract=EXT_PROPERTIES,
+            keys_to_flatten={"active_power_limits", "active_power_flow_limits"},
+            property_map=property_map,
+            unit_map=self.default_units,
+            valid_properties=collection_properties,
+            add_name=True,
         )
+        export_records = apply_export_pipeline(records, export_pipeline)
         self._db_mgr.add_property_from_records(
             export_records,
             parent_class=parent_class,
@@ -296,8 +326,7 @@ class PlexosExporter(BaseExporter):
         ]
 
         # Maybe replace `t_category` with right schema.
-        with self._db_mgr._conn as conn:
-            conn.executemany("INSERT into t_category(class_id, rank, name) values (?,?,?)", categories)
+        self._executemany("INSERT into t_category(class_id, rank, name) values (?,?,?)", categories)
         return
 
     def bulk_insert_objects(
@@ -341,10 +370,7 @@ class PlexosExporter(BaseExporter):
         if not objects:
             logger.warning("No components found for type' {}", component_type)
             return
-        with self._db_mgr._conn as conn:
-            conn.executemany(
-                "INSERT into t_object(class_id, name, category_id, GUID) values (?,?,?,?)", objects
-            )
+        self._executemany("INSERT into t_object(class_id, name, category_id, GUID) values (?,?,?,?)", objects)
 
         # Add system membership
         system_object_id = self._db_mgr.get_object_id("System", class_name=ClassEnum.System)
@@ -385,6 +411,228 @@ class PlexosExporter(BaseExporter):
         self._db_mgr.execute_query(f"UPDATE t_class SET is_enabled=1 WHERE t_class.name='{class_enum}'")
         return
 
+    def _get_object_ids(self, class_enum: ClassEnum) -> dict[str, int]:
+        """Return a mapping of object name to object id for all the objects of a class."""
+        class_id = self._db_mgr.get_class_id(class_enum)
+        return {
+            name: object_id
+            for name, object_id in self._db_mgr.query(
+                "SELECT name, object_id FROM t_object WHERE class_id = ?", (class_id,)
+            )
+        }
+
+    def bulk_add_memberships(
+        self,
+        memberships: list[tuple[str, str]],
+        /,
+        *,
+        parent_class: ClassEnum,
+        child_class: ClassEnum,
+        collection: CollectionEnum,
+    ) -> None:
+        """Bulk insert memberships between objects that already exist on the database.
+
+        Parameters
+        ----------
+        memberships
+            List of `(parent_object_name, child_object_name)` pairs.
+        parent_class
+            Class of the parent objects.
+        child_class
+            Class of the child objects.
+        collection
+            Collection of the memberships.
+
+        Raises
+        ------
+        KeyError
+            If any of the parent or child objects does not exist on the database.
+        """
+        if not memberships:
+            return
+
+        parent_class_id = self._db_mgr.get_class_id(parent_class)
+        child_class_id = self._db_mgr.get_class_id(child_class)
+        collection_id = self._db_mgr.get_collection_id(
+            collection, parent_class=parent_class, child_class=child_class
+        )
+        parent_ids = self._get_object_ids(parent_class)
+        child_ids = parent_ids if child_class == parent_class else self._get_object_ids(child_class)
+
+        rows = []
+        for parent_name, child_name in memberships:
+            if parent_name not in parent_ids or child_name not in child_ids:
+                msg = (
+                    f"Membership {parent_class}:{parent_name} -> {child_class}:{child_name} "
+                    "references an object that does not exist on the database."
+                )
+                raise KeyError(msg)
+            parent_object_id = parent_ids[parent_name]
+            child_object_id = child_ids[child_name]
+            rows.append((parent_class_id, parent_object_id, child_class_id, child_object_id, collection_id))
+
+        logger.trace("Adding {} {} memberships", len(rows), collection)
+        self._executemany(
+            """
+            INSERT into t_membership(
+              parent_class_id, parent_object_id,
+              child_class_id, child_object_id, collection_id
+            )
+            values (?,?,?,?,?)
+            """,
+            rows,
+        )
+        return
+
+    def bulk_add_properties(
+        self,
+        records: list[dict[str, Any]],
+        /,
+        *,
+        object_class: ClassEnum,
+        collection: CollectionEnum,
+        parent_class: ClassEnum = ClassEnum.System,
+        scenario: str | None = None,
+    ) -> None:
+        """Bulk insert properties for objects that already have a membership on the database.
+
+        This is the bulk version of :meth:`PlexosSQLite.add_property`. All the ids are resolved with one
+        query per table and the data, tag and text rows are inserted in a single transaction.
+
+        Parameters
+        ----------
+        records
+            List of properties to add. Each record requires the keys `name`, `property` and `value`.
+            Optional keys are `parent`, the name of the parent object (defaults to `System`), and `text`,
+            a dictionary of text class to value (e.g., `{"Data File": fpath}`).
+        object_class
+            Class of the objects that hold the properties.
+        collection
+            Collection of the properties.
+        parent_class
+            Class of the parent objects. Defaults to `ClassEnum.System`.
+        scenario
+            Scenario tag to add to the properties. Defaults to the exporter scenario.
+
+        Raises
+        ------
+        KeyError
+            If a property is not valid for the collection or the membership does not exist.
+        """
+        if not records:
+            return
+        scenario = scenario or self.plexos_scenario
+        scenario_id = (
+            self.plexos_scenario_id
+            if scenario == self.plexos_scenario
+            else self._db_mgr.get_scenario_id(scenario_name=scenario)
+        )
+
+        collection_id = self._db_mgr.get_collection_id(
+            collection, parent_class=parent_class, child_class=object_class
+        )
+        property_ids = {
+            name: property_id
+            for name, property_id in self._db_mgr.query(
+                "SELECT name, property_id FROM t_property WHERE collection_id = ?", (collection_id,)
+            )
+        }
+        membership_query = """
+        SELECT
+            parent_object.name
+            ,child_object.name
+            ,t_membership.membership_id
+        FROM
+            t_membership
+        INNER JOIN
+            t_object AS parent_object ON t_membership.parent_object_id = parent_object.object_id
+        INNER JOIN
+            t_object AS child_object ON t_membership.child_object_id = child_object.object_id
+        WHERE
+            t_membership.collection_id = ?
+        """
+        membership_ids = {
+            (parent_name, child_name): membership_id
+            for parent_name, child_name, membership_id in self._db_mgr.query(
+                membership_query, (collection_id,)
+            )
+        }
+        text_class_ids = {
+            name: class_id for name, class_id in self._db_mgr.query("SELECT name, class_id FROM t_class")
+        }
+
+        data_rows = []
+        for record in records:
+            property_name = record["property"]
+            if property_name not in property_ids:
+                msg = (
+                    f"Property {property_name} does not exist for collection: {collection}. "
+                    f"Run `self.get_valid_properties({collection}) to verify valid properties."
+                )
+                raise KeyError(msg)
+            membership_key = (record.get("parent", "System"), record["name"])
+            if membership_key not in membership_ids:
+                msg = f"No membership found for {membership_key} on collection {collection}."
+                raise KeyError(msg)
+            data_rows.append((membership_ids[membership_key], property_ids[property_name], record["value"]))
+
+        logger.trace("Adding {} {} properties", len(data_rows), collection)
+        with self._transaction() as conn:
+            # Data ids are assigned in insertion order, so the new ids map one to one to the records.
+            (last_data_id,) = conn.execute("SELECT COALESCE(MAX(data_id), 0) FROM t_data").fetchone()
+            conn.executemany(
+                "INSERT into t_data(membership_id, property_id, value) values (?,?,?)", data_rows
+            )
+            data_ids = [
+                data_id
+                for (data_id,) in conn.execute(
+                    "SELECT data_id FROM t_data WHERE data_id > ? ORDER BY data_id", (last_data_id,)
+                )
+            ]
+            if len(data_ids) != len(records):
+                msg = (
+                    f"Inserted {len(records)} properties for collection {collection} "
+                    f"but found {len(data_ids)} new rows on t_data."
+                )
+                raise ValueError(msg)
+
+            # Enable properties if disabled.
+            used_property_ids = [(property_id,) for property_id in {row[1] for row in data_rows}]
+            conn.executemany("UPDATE t_property set is_dynamic=1 where property_id = ?", used_property_ids)
+            conn.executemany("UPDATE t_property set is_enabled=1 where property_id = ?", used_property_ids)
+
+            conn.executemany(
+                "INSERT into t_tag(object_id,data_id) values (?,?)",
+                [(scenario_id, data_id) for data_id in data_ids],
+            )
+            text_rows = [
+                (text_class_ids[text_class], data_id, text_value)
+                for record, data_id in zip(records, data_ids)
+                for text_class, text_value in (record.get("text") or {}).items()
+            ]
+            if text_rows:
+                conn.executemany("INSERT into t_text(class_id,data_id,value) VALUES(?,?,?)", text_rows)
+        return
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Yield the connection of the database inside a single transaction.
+
+        `PlexosSQLite` only exposes `execute_query` for a single set of parameters, so this is the only place
+        where the exporter uses the connection of the database directly. The transaction is committed once on
+        exit. Note that `PlexosSQLite` disables the rollback journal, so a failed transaction is not undone.
+        """
+        with self._db_mgr._conn as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN")
+            yield conn
+
+    def _executemany(self, query: str, rows: list[tuple]) -> None:
+        """Execute a query once for each row in a single transaction."""
+        with self._transaction() as conn:
+            conn.executemany(query, rows)
+        return
+
     def add_topology(self) -> None:
         """Create network topology on Plexos."""
         # Adding Regions
@@ -398,26 +646,24 @@ class PlexosExporter(BaseExporter):
         self.insert_component_properties(
             ACBus, parent_class=ClassEnum.System, collection=CollectionEnum.Regions
         )
+        collection_properties = self._db_mgr.get_valid_properties(
+            collection=CollectionEnum.Zones, parent_class=ClassEnum.System, child_class=ClassEnum.Zone
+        )
+        export_pipeline = compile_export_pipeline(
+            property_map=self.property_map,
+            unit_map=self.default_units,
+            valid_properties=collection_properties,
+        )
+        region_properties: list[dict[str, Any]] = []
         for bus in self.system.get_components(ACBus, filter_func=lambda x: x.ext):
-            collection_properties = self._db_mgr.get_valid_properties(
-                collection=CollectionEnum.Zones, parent_class=ClassEnum.System, child_class=ClassEnum.Zone
-            )
-            properties = get_export_properties(
-                bus.ext,
-                partial(apply_property_map, property_map=self.property_map),
-                partial(apply_pint_deconstruction, unit_map=self.default_units),
-                partial(apply_valid_properties, valid_properties=collection_properties),
+            properties = export_pipeline(bus.ext)
+            region_properties.extend(
+                {"name": bus.name, "property": property_name, "value": property_value}
+                for property_name, property_value in properties.items()
             )
-            if properties:
-                for property_name, property_value in properties.items():
-                    self._db_mgr.add_property(
-                        bus.name,
-                        property_name,
-                        property_value,
-                        object_class=ClassEnum.Region,
-                        collection=CollectionEnum.Regions,
-                        scenario=self.plexos_scenario,
-                    )
+        self.bulk_add_properties(
+            region_properties, object_class=ClassEnum.Region, collection=CollectionEnum.Regions
+        )
 
         # Adding Zones
         # self.add_component_category(LoadZone, class_enum=ClassEnum.Zone)
@@ -436,43 +682,30 @@ class PlexosExporter(BaseExporter):
 
         # Add node memberships to zone and regions.
         # On our default Plexos translation, both Zones and Regions are child of the Node class.
-        for bus in self.system.get_components(ACBus):
-            bus_load_zone = bus.load_zone
-            self._db_mgr.add_membership(
-                bus.name,
-                bus.name,  # Zone has the same name
-                parent_class=ClassEnum.Node,
-                child_class=ClassEnum.Region,
-                collection=CollectionEnum.Region,
-            )
-            if bus_load_zone is None:
-                continue
-            self._db_mgr.add_membership(
-                bus.name,
-                bus_load_zone.name,
-                parent_class=ClassEnum.Node,
-                child_class=ClassEnum.Zone,
-                collection=CollectionEnum.Zone,
-            )
+        buses = list(self.system.get_components(ACBus))
+        self.bulk_add_memberships(
+            [(bus.name, bus.name) for bus in buses],  # Region has the same name
+            parent_class=ClassEnum.Node,
+            child_class=ClassEnum.Region,
+            collection=CollectionEnum.Region,
+        )
+        self.bulk_add_memberships(
+            [(bus.name, bus.load_zone.name) for bus in buses if bus.load_zone is not None],
+            parent_class=ClassEnum.Node,
+            child_class=ClassEnum.Zone,
+            collection=CollectionEnum.Zone,
+        )
 
         # Adding load time series
         logger.debug("Adding load time series properties")
+        load_properties = []
         for component in self.system.get_components(
             PowerLoad, filter_func=lambda component: self.system.has_time_series(component)
         ):
-            time_series_properties = self._get_time_series_properties(component)
-            if time_series_properties:
-                text = time_series_properties.pop("Data File")
-                for property_name, property_value in time_series_properties.items():
-                    self._db_mgr.add_property(
-                        component.bus.name,
-                        property_name,
-                        property_value,
-                        object_class=ClassEnum.Region,
-                        collection=CollectionEnum.Regions,
-                        scenario=self.plexos_scenario,
-                        text={"Data File": text},
-                    )
+            load_properties.extend(self._get_time_series_records(component, name=component.bus.name))
+        self.bulk_add_properties(
+            load_properties, object_class=ClassEnum.Region, collection=CollectionEnum.Regions
+        )
         return
 
     def add_lines(self) -> None:
@@ -494,36 +727,34 @@ class PlexosExporter(BaseExporter):
         collection_properties = self._db_mgr.get_valid_properties(
             collection=CollectionEnum.Lines, parent_class=ClassEnum.System, child_class=ClassEnum.Line
         )
-        for line in self.system.get_components(MonitoredLine, Line):
-            properties = get_export_properties(
-                line.ext,
-                partial(apply_property_map, property_map=self.property_map),
-                partial(apply_pint_deconstruction, unit_map=self.default_units),
-                partial(apply_valid_properties, valid_properties=collection_properties),
-            )
-            for property_name, property_value in properties.items():
-                self._db_mgr.add_property(
-                    line.name,
-                    property_name,
-                    property_value,
-                    object_class=ClassEnum.Line,
-                    collection=CollectionEnum.Lines,
-                    scenario=self.plexos_scenario,
-                )
-            self._db_mgr.add_membership(
-                line.name,
-                line.from_bus.name,
-                parent_class=ClassEnum.Line,
-                child_class=ClassEnum.Node,
-                collection=CollectionEnum.NodeFrom,
-            )
-            self._db_mgr.add_membership(
-                line.name,
-                line.to_bus.name,
-                parent_class=ClassEnum.Line,
-                child_class=ClassEnum.Node,
-                collection=CollectionEnum.NodeTo,
+        export_pipeline = compile_export_pipeline(
+            property_map=self.property_map,
+            unit_map=self.default_units,
+            valid_properties=collection_properties,
+        )
+        lines = list(self.system.get_components(MonitoredLine, Line))
+        line_properties: list[dict[str, Any]] = []
+        for line in lines:
+            properties = export_pipeline(line.ext)
+            line_properties.extend(
+                {"name": line.name, "property": property_name, "value": property_value}
+                for property_name, property_value in properties.items()
             )
+        self.bulk_add_properties(
+            line_properties, object_class=ClassEnum.Line, collection=CollectionEnum.Lines
+        )
+        self.bulk_add_memberships(
+            [(line.name, line.from_bus.name) for line in lines],
+            parent_class=ClassEnum.Line,
+            child_class=ClassEnum.Node,
+            collection=CollectionEnum.NodeFrom,
+        )
+        self.bulk_add_memberships(
+            [(line.name, line.to_bus.name) for line in lines],
+            parent_class=ClassEnum.Line,
+            child_class=ClassEnum.Node,
+            collection=CollectionEnum.NodeTo,
+        )
         return
 
     def add_transformers(self) -> None:
@@ -535,21 +766,19 @@ class PlexosExporter(BaseExporter):
         self.insert_component_properties(
             Transformer2W, parent_class=ClassEnum.System, collection=CollectionEnum.Transformers
         )
-        for transformer in self.system.get_components(Transformer2W):
-            self._db_mgr.add_membership(
-                transformer.name,
-                transformer.from_bus.name,
-                parent_class=ClassEnum.Transformer,
-                child_class=ClassEnum.Node,
-                collection=CollectionEnum.NodeFrom,
-            )
-            self._db_mgr.add_membership(
-                transformer.name,
-                transformer.to_bus.name,
-                parent_class=ClassEnum.Transformer,
-                child_class=ClassEnum.Node,
-                collection=CollectionEnum.NodeTo,
-            )
+        transformers = list(self.system.get_components(Transformer2W))
+        self.bulk_add_memberships(
+            [(transformer.name, transformer.from_bus.name) for transformer in transformers],
+            parent_class=ClassEnum.Transformer,
+            child_class=ClassEnum.Node,
+            collection=CollectionEnum.NodeFrom,
+        )
+        self.bulk_add_memberships(
+            [(transformer.name, transformer.to_bus.name) for transformer in transformers],
+            parent_class=ClassEnum.Transformer,
+            child_class=ClassEnum.Node,
+            collection=CollectionEnum.NodeTo,
+        )
         return
 
     def add_interfaces(self) -> None:
@@ -575,25 +804,21 @@ class PlexosExporter(BaseExporter):
             parent_class=ClassEnum.System,
             child_class=ClassEnum.Constraint,
         )
+        export_pipeline = compile_export_pipeline(
+            property_map=self.property_map,
+            unit_map=self.default_units,
+            valid_properties=collection_properties,
+        )
+        constraint_properties: list[dict[str, Any]] = []
         for constraint in self.system.get_components(Constraint):
-            properties = get_export_properties(
-                constraint.ext,
-                partial(apply_property_map, property_map=self.property_map),
-                partial(apply_pint_deconstruction, unit_map=self.default_units),
-                partial(apply_valid_properties, valid_properties=collection_properties),
+            properties = export_pipeline(constraint.ext)
+            constraint_properties.extend(
+                {"name": constraint.name, "property": property_name, "value": property_value}
+                for property_name, property_value in properties.items()
             )
-
-            if properties:
-                for property_name, property_value in properties.items():
-                    self._db_mgr.add_property(
-                        constraint.name,
-                        property_name,
-                        property_value,
-                        object_class=ClassEnum.Constraint,
-                        collection=CollectionEnum.Constraints,
-                        scenario=self.plexos_scenario,
-                    )
-
+        self.bulk_add_properties(
+            constraint_properties, object_class=ClassEnum.Constraint, collection=CollectionEnum.Constraints
+        )
         return
 
     def add_emissions(self) -> None:
@@ -619,34 +844,40 @@ class PlexosExporter(BaseExporter):
                 parent_class=ClassEnum.Emission,
                 child_class=ClassEnum.Constraint,
             )
-            for constraint in self.system.get_components(
-                Constraint, filter_func=lambda x: x.name == emission_constraint_name
-            ):
-                self._db_mgr.add_membership(
-                    emission_type,
-                    constraint.name,
-                    parent_class=ClassEnum.Emission,
-                    child_class=ClassEnum.Constraint,
-                    collection=CollectionEnum.Constraints,
-                )
-                properties = get_export_properties(
-                    constraint.ext[emission_type],
-                    partial(apply_property_map, property_map=self.property_map),
-                    partial(apply_pint_deconstruction, unit_map=self.default_units),
-                    partial(apply_valid_properties, valid_properties=collection_properties),
+            export_pipeline = compile_export_pipeline(
+                property_map=self.property_map,
+                unit_map=self.default_units,
+                valid_properties=collection_properties,
+            )
+            constraints = [
+                constraint
+                for constraint in self.system.get_components(Constraint)
+                if constraint.name == emission_constraint_name
+            ]
+            self.bulk_add_memberships(
+                [(emission_type, constraint.name) for constraint in constraints],
+                parent_class=ClassEnum.Emission,
+                child_class=ClassEnum.Constraint,
+                collection=CollectionEnum.Constraints,
+            )
+            constraint_properties: list[dict[str, Any]] = []
+            for constraint in constraints:
+                properties = export_pipeline(constraint.ext[emission_type])
+                constraint_properties.extend(
+                    {
+                        "name": constraint.name,
+                        "parent": emission_type,
+                        "property": property_name,
+                        "value": property_value,
+                    }
+                    for property_name, property_value in properties.items()
                 )
-                if properties:
-                    for property_name, property_value in properties.items():
-                        self._db_mgr.add_property(
-                            constraint.name,
-                            property_name,
-                            property_value,
-                            object_class=ClassEnum.Constraint,
-                            parent_object_name=emission_type,
-                            parent_class=ClassEnum.Emission,
-                            collection=CollectionEnum.Constraints,
-                            scenario=self.plexos_scenario,
-                        )
+            self.bulk_add_properties(
+                constraint_properties,
+                object_class=ClassEnum.Constraint,
+                parent_class=ClassEnum.Emission,
+                collection=CollectionEnum.Constraints,
+            )
         return
 
     def add_reserves(self) -> None:
@@ -668,6 +899,25 @@ class PlexosExporter(BaseExporter):
             collection=CollectionEnum.Reserves,
             exclude_fields=NESTED_ATTRIBUTES | {"max_requirement"},
         )
+        collection_properties = self._db_mgr.get_valid_properties(
+            collection=CollectionEnum.Regions,
+            parent_class=ClassEnum.Reserve,
+            child_class=ClassEnum.Region,
+        )
+        export_pipeline = compile_export_pipeline(
+            property_map=self.property_map,
+            unit_map=self.default_units,
+            valid_properties=collection_properties,
+        )
+        reserve_properties: list[dict[str, Any]] = []
+        region_memberships = []
+        region_properties: list[dict[str, Any]] = []
+        reserves_by_region = self.system.get_reserves_by_region()
+        reserve_buses: defaultdict[str, list[ACBus]] = defaultdict(list)
+        for bus in self.system.get_components(ACBus):
+            if bus.load_zone is not None:
+                for reserve in reserves_by_region.get(bus.load_zone.name, []):
+                    reserve_buses[reserve.name].append(bus)
         for reserve in self.system.get_components(Reserve):
             properties: dict[str, Any] = {}
             properties["Type"] = get_reserve_type(
@@ -678,73 +928,46 @@ class PlexosExporter(BaseExporter):
             properties["Is Enabled"] = "-1" if reserve.available else "0"
             properties["Mutually Exclusive"] = True
 
-            for property, value in properties.items():
-                self._db_mgr.add_property(
-                    reserve.name,
-                    property,
-                    value,
-                    object_class=ClassEnum.Reserve,
-                    collection=CollectionEnum.Reserves,
-                    scenario=self.plexos_scenario,
-                )
-            time_series_properties = self._get_time_series_properties(reserve)
-            if time_series_properties:
-                text = time_series_properties.pop("Data File")
-                for property_name, property_value in time_series_properties.items():
-                    self._db_mgr.add_property(
-                        reserve.name,
-                        property_name,
-                        property_value,
-                        object_class=ClassEnum.Reserve,
-                        collection=CollectionEnum.Reserves,
-                        scenario=self.plexos_scenario,
-                        text={"Data File": text},
-                    )
+            reserve_properties.extend(
+                {"name": reserve.name, "property": property, "value": value}
+                for property, value in properties.items()
+            )
+            reserve_properties.extend(self._get_time_series_records(reserve))
 
             # Add Regions properties. Currently, we only add the load_risk
+            if not reserve.region:
+                continue
             component_dict = reserve.model_dump(
                 exclude_none=True, exclude=NESTED_ATTRIBUTES | {"max_requirement"}
             )
-
-            if not reserve.region:
-                return
-            reserve_region = reserve.region
-            assert reserve_region is not None
-            regions = self.system.get_components(
-                ACBus, filter_func=lambda x: x.load_zone.name == reserve_region.name
-            )
-
-            collection_properties = self._db_mgr.get_valid_properties(
-                collection=CollectionEnum.Regions,
-                parent_class=ClassEnum.Reserve,
-                child_class=ClassEnum.Region,
-            )
-            for region in regions:
-                self._db_mgr.add_membership(
-                    reserve.name,
-                    region.name,  # Zone has the same name
-                    parent_class=ClassEnum.Reserve,
-                    child_class=ClassEnum.Region,
-                    collection=CollectionEnum.Regions,
+            properties = export_pipeline(component_dict)
+            for region in reserve_buses.get(reserve.name, []):
+                region_memberships.append((reserve.name, region.name))  # Zone has the same name
+                region_properties.extend(
+                    {
+                        "name": region.name,
+                        "parent": reserve.name,
+                        "property": property_name,
+                        "value": property_value,
+                    }
+                    for property_name, property_value in properties.items()
                 )
-                properties = get_export_properties(
-                    component_dict,
-                    partial(apply_property_map, property_map=self.property_map),
-                    partial(apply_pint_deconstruction, unit_map=self.default_units),
-                    partial(apply_valid_properties, valid_properties=collection_properties),
-                )
-                if properties:
-                    for property_name, property_value in properties.items():
-                        self._db_mgr.add_property(
-                            region.name,
-                            property_name,
-                            property_value,
-                            object_class=ClassEnum.Region,
-                            parent_object_name=reserve.name,
-                            parent_class=ClassEnum.Reserve,
-                            collection=CollectionEnum.Regions,
-                            scenario=self.plexos_scenario,
-                        )
+
+        self.bulk_add_properties(
+            reserve_properties, object_class=ClassEnum.Reserve, collection=CollectionEnum.Reserves
+        )
+        self.bulk_add_memberships(
+            region_memberships,
+            parent_class=ClassEnum.Reserve,
+            child_class=ClassEnum.Region,
+            collection=CollectionEnum.Regions,
+        )
+        self.bulk_add_properties(
+            region_properties,
+            object_class=ClassEnum.Region,
+            parent_class=ClassEnum.Reserve,
+            collection=CollectionEnum.Regions,
+        )
         return
 
     def add_generators(self):
@@ -771,61 +994,56 @@ class PlexosExporter(BaseExporter):
 
         # Add generator memberships
         logger.debug("Adding generator memberships")
-        for generator in self.system.get_components(Generator, filter_func=exclude_battery):
-            self._db_mgr.add_membership(
-                generator.name,
-                generator.bus.name,
-                parent_class=ClassEnum.Generator,
-                child_class=ClassEnum.Node,
-                collection=CollectionEnum.Nodes,
-            )
-            properties = self._get_time_series_properties(generator)
-            if properties:
-                text = properties.pop("Data File")
-                for property_name, property_value in properties.items():
-                    self._db_mgr.add_property(
-                        generator.name,
-                        property_name,
-                        property_value,
-                        object_class=ClassEnum.Generator,
-                        collection=CollectionEnum.Generators,
-                        scenario=self.plexos_scenario,
-                        text={"Data File": text},
-                    )
+        generators = list(self.system.get_components(Generator, filter_func=exclude_battery))
+        self.bulk_add_memberships(
+            [(generator.name, generator.bus.name) for generator in generators],
+            parent_class=ClassEnum.Generator,
+            child_class=ClassEnum.Node,
+            collection=CollectionEnum.Nodes,
+        )
+        generator_properties = []
+        reserve_memberships = []
+        for generator in generators:
+            generator_properties.extend(self._get_time_series_records(generator))
             if generator.services:
                 for service in generator.services:
                     match service:
                         case Reserve():
-                            self._db_mgr.add_membership(
-                                service.name,
-                                generator.name,
-                                parent_class=ClassEnum.Reserve,
-                                child_class=ClassEnum.Generator,
-                                collection=CollectionEnum.Generators,
-                            )
+                            reserve_memberships.append((service.name, generator.name))
                         case _:
                             raise NotImplementedError(f"{service} not yet implemented for generator.")
+        self.bulk_add_properties(
+            generator_properties, object_class=ClassEnum.Generator, collection=CollectionEnum.Generators
+        )
+        self.bulk_add_memberships(
+            reserve_memberships,
+            parent_class=ClassEnum.Reserve,
+            child_class=ClassEnum.Generator,
+            collection=CollectionEnum.Generators,
+        )
 
-        # NOTE: This needs to be optimized. It is currently slow.
         logger.debug("Adding generator emisssions memberships")
-        for emission in self.system.get_components(Emission):
-            self._db_mgr.add_membership(
-                emission.emission_type,
-                emission.generator_name,
-                parent_class=ClassEnum.Emission,
-                child_class=ClassEnum.Generator,
-                collection=CollectionEnum.Generators,
-            )
-            self._db_mgr.add_property(
-                emission.generator_name,
-                self.property_map["rate"],
-                get_magnitude(emission.rate),
-                object_class=ClassEnum.Generator,
-                parent_class=ClassEnum.Emission,
-                parent_object_name=emission.emission_type,
-                collection=CollectionEnum.Generators,
-                scenario=self.plexos_scenario,
-            )
+        emissions = list(self.system.get_components(Emission))
+        self.bulk_add_memberships(
+            [(emission.emission_type, emission.generator_name) for emission in emissions],
+            parent_class=ClassEnum.Emission,
+            child_class=ClassEnum.Generator,
+            collection=CollectionEnum.Generators,
+        )
+        self.bulk_add_properties(
+            [
+                {
+                    "name": emission.generator_name,
+                    "parent": emission.emission_type,
+                    "property": self.property_map["rate"],
+                    "value": get_magnitude(emission.rate),
+                }
+                for emission in emissions
+            ],
+            object_class=ClassEnum.Generator,
+            parent_class=ClassEnum.Emission,
+            collection=CollectionEnum.Generators,
+        )
 
     def add_batteries(self):
         """Add battery objects to the database."""
@@ -840,27 +1058,28 @@ class PlexosExporter(BaseExporter):
             GenericBattery, parent_class=ClassEnum.System, collection=CollectionEnum.Batteries
         )
         # Add battery memberships
-        for battery in self.system.get_components(GenericBattery):
-            self._db_mgr.add_membership(
-                battery.name,
-                battery.bus.name,
-                parent_class=ClassEnum.Battery,
-                child_class=ClassEnum.Node,
-                collection=CollectionEnum.Nodes,
-            )
+        batteries = list(self.system.get_components(GenericBattery))
+        self.bulk_add_memberships(
+            [(battery.name, battery.bus.name) for battery in batteries],
+            parent_class=ClassEnum.Battery,
+            child_class=ClassEnum.Node,
+            collection=CollectionEnum.Nodes,
+        )
+        reserve_memberships = []
+        for battery in batteries:
             if battery.services:
                 for service in battery.services:
                     match service:
                         case Reserve():
-                            self._db_mgr.add_membership(
-                                service.name,
-                                battery.name,
-                                parent_class=ClassEnum.Reserve,
-                                child_class=ClassEnum.Battery,
-                                collection=CollectionEnum.Batteries,
-                            )
+                            reserve_memberships.append((service.name, battery.name))
                         case _:
                             raise NotImplementedError(f"{service} not yet implemented for generator.")
+        self.bulk_add_memberships(
+            reserve_memberships,
+            parent_class=ClassEnum.Reserve,
+            child_class=ClassEnum.Battery,
+            collection=CollectionEnum.Batteries,
+        )
 
     def add_storage(self):
         """Add storage objects to the database."""
@@ -911,23 +1130,19 @@ class PlexosExporter(BaseExporter):
             records=tail_storage,
         )
 
-        for phs in self.system.get_components(HydroPumpedStorage):
-            head_name = f"{phs.name}_head"
-            tail_name = f"{phs.name}_tail"
-            self._db_mgr.add_membership(
-                phs.name,
-                head_name,
-                parent_class=ClassEnum.Generator,
-                child_class=ClassEnum.Storage,
-                collection=CollectionEnum.HeadStorage,
-            )
-            self._db_mgr.add_membership(
-                phs.name,
-                tail_name,
-                parent_class=ClassEnum.Generator,
-                child_class=ClassEnum.Storage,
-                collection=CollectionEnum.TailStorage,
-            )
+        pumped_storage = list(self.system.get_components(HydroPumpedStorage))
+        self.bulk_add_memberships(
+            [(phs.name, f"{phs.name}_head") for phs in pumped_storage],
+            parent_class=ClassEnum.Generator,
+            child_class=ClassEnum.Storage,
+            collection=CollectionEnum.HeadStorage,
+        )
+        self.bulk_add_memberships(
+            [(phs.name, f"{phs.name}_tail") for phs in pumped_storage],
+            parent_class=ClassEnum.Generator,
+            child_class=ClassEnum.Storage,
+            collection=CollectionEnum.TailStorage,
+        )
         return
 
     def _add_simulation_objects(self):
@@ -2,9 +2,9 @@
 
 # System packages
 import json
+from functools import partial
 from operator import itemgetter
 import os
-from functools import partial
 from typing import Any
 from urllib.request import urlopen
 
@@ -13,13 +13,12 @@ from loguru import logger
 
 # Local imports
 from r2x.config_models import ReEDSConfig, SiennaConfig
-from r2x.exporter.handler import BaseExporter, get_export_records
+from r2x.exporter.handler import BaseExporter, write_records_table
 from r2x.exporter.utils import (
-    apply_default_value,
-    apply_flatten_key,
-    apply_pint_deconstruction,
+    apply_export_pipeline,
     apply_property_map,
-    apply_unnest_key,
+    compile_export_pipeline,
+    records_to_frame,
 )
 from r2x.models import (
     ACBranch,
@@ -95,6 +94,7 @@ class SiennaExporter(BaseExporter):
         self.output_fields = self.output_config.defaults["table_data"]
         self.year = self.output_config.model_year
         assert self.year is not None
+        self.table_format = self.config.feature_flags.get("table-format", "csv")
 
     def run(self, *args, path=None, **kwargs) -> "SiennaExporter":
         """Run sienna exporter workflow.
@@ -143,18 +143,15 @@ class SiennaExporter(BaseExporter):
         ]
 
         key_mapping = {"number": "bus_id", "load_zone": "zone"}
-        export_records = get_export_records(
+        table = records_to_frame(
             records,
-            partial(apply_property_map, property_map=self.property_map | key_mapping),
-            partial(apply_pint_deconstruction, unit_map=self.unit_map),
-            partial(apply_unnest_key, key_map={"zone": "name", "area": "name"}),
-        )
-        self.system._export_dict_to_csv(
-            export_records,
-            fpath=self.output_folder / fname,
+            property_map=self.property_map | key_mapping,
+            unit_map=self.unit_map,
+            unnest_key_map={"zone": "name", "area": "name"},
             fields=output_fields,
             restval="NA",
         )
+        write_records_table(self.output_folder / fname, table, file_format=self.table_format)
 
     def process_load_data(self, fname: str = "load.csv") -> None:
         """Create load.csv file.
@@ -180,18 +177,15 @@ class SiennaExporter(BaseExporter):
         key_mapping = {
             "bus": "bus_id",
         }
-        export_records = get_export_records(
+        table = records_to_frame(
             records,
-            partial(apply_property_map, property_map=self.property_map | key_mapping),
-            partial(apply_pint_deconstruction, unit_map=self.unit_map),
-            partial(apply_unnest_key, key_map={"bus_id": "number"}),
-        )
-        self.system._export_dict_to_csv(
-            export_records,
-            fpath=self.output_folder / fname,
+            property_map=self.property_map | key_mapping,
+            unit_map=self.unit_map,
+            unnest_key_map={"bus_id": "number"},
             fields=output_fields,
             restval="0.0",
         )
+        write_records_table(self.output_folder / fname, table, file_format=self.table_format)
         logger.info(f"File {fname} created.")
 
     def process_branch_data(self, fname: str = "branch.csv") -> None:
@@ -229,27 +223,20 @@ class SiennaExporter(BaseExporter):
             component.model_dump(exclude_none=True, mode="python", serialize_as_any=True)
             for component in self.system.get_components(ACBranch)
         ]
-        export_records = get_export_records(
+        # The transformer flag is derived from the branch type before selecting the output fields.
+        records = [
+            record | {"is_transformer": record["class_type"] == Transformer2W.__name__} for record in records
+        ]
+        table = records_to_frame(
             records,
-            partial(apply_property_map, property_map=self.property_map | key_mapping),
-            partial(apply_pint_deconstruction, unit_map=self.unit_map),
-            partial(
-                apply_unnest_key,
-                key_map={"connection_points_from": "number", "connection_points_to": "number"},
-            ),
-            partial(
-                lambda component, key, func: component.update({key: func(component)}) or component,
-                key="is_transformer",
-                func=lambda d: True if d["branch_type"] == Transformer2W.__name__ else False,
-            ),
-            partial(apply_default_value, default_value_map={"tap": 1.0}),
-        )
-        self.system._export_dict_to_csv(
-            export_records,
-            fpath=self.output_folder / fname,
+            property_map=self.property_map | key_mapping,
+            unit_map=self.unit_map,
+            unnest_key_map={"connection_points_from": "number", "connection_points_to": "number"},
+            default_value_map={"tap": 1.0},
             fields=output_fields,
             restval="NA",
         )
+        write_records_table(self.output_folder / fname, table, file_format=self.table_format)
         logger.info(f"File {fname} created.")
 
     def process_dc_branch_data(self, fname="dc_branch.csv") -> None:
@@ -268,19 +255,12 @@ class SiennaExporter(BaseExporter):
             "loss",
         ]
 
-        self.system.export_component_to_csv(
-            DCBranch,
-            fpath=self.output_folder / fname,
-            fields=output_fields,
-            unnest_key="number",
-            key_mapping={
-                "from_bus": "connection_points_from",
-                "to_bus": "connection_points_to",
-                "class_type": "branch_type",
-                "rating_up": "rate",
-            },
-            restval="NA",
-        )
+        records = [
+            component.model_dump(exclude_none=True, mode="json", context={"magnitude_only": True})
+            for component in self.system.get_components(DCBranch)
+        ]
+        table = records_to_frame(records, fields=output_fields, restval="NA")
+        write_records_table(self.output_folder / fname, table, file_format=self.table_format)
         logger.info(f"File {fname} created.")
         return
 
@@ -303,26 +283,18 @@ class SiennaExporter(BaseExporter):
             component.model_dump(exclude_none=True, mode="python", serialize_as_any=True)
             for component in self.system.get_components(Generator)
         ]
-        export_records = get_export_records(
+        records = sorted(map(apply_operation_table_data, records), key=itemgetter("name"), reverse=True)
+        table = records_to_frame(
             records,
-            partial(apply_operation_table_data),
-            partial(apply_flatten_key, keys_to_flatten={"active_power_limits"}),
-            partial(apply_property_map, property_map=self.property_map | key_mapping),
-            partial(apply_pint_deconstruction, unit_map=self.unit_map),
-            partial(apply_unnest_key, key_map={"bus_id": "number"}),
-            partial(
-                apply_default_value,
-                default_value_map={"fuel_price": 0.0, "power_factor": 1.0, "startup_cost": 0.0},
-            ),
-        )
-
-        sorted_records = sorted(export_records, key=itemgetter("name"), reverse=True)
-        self.system._export_dict_to_csv(
-            sorted_records,
-            fpath=self.output_folder / fname,
+            property_map=self.property_map | key_mapping,
+            unit_map=self.unit_map,
+            unnest_key_map={"bus_id": "number"},
+            keys_to_flatten={"active_power_limits"},
+            default_value_map={"fuel_price": 0.0, "power_factor": 1.0, "startup_cost": 0.0},
             fields=self.output_fields["generator"],
             restval="NA",
         )
+        write_records_table(self.output_folder / fname, table, file_format=self.table_format)
         logger.info(f"File {fname} created.")
 
     def process_reserves_data(self, fname="reserves.csv") -> None:
@@ -376,18 +348,15 @@ class SiennaExporter(BaseExporter):
 
         key_mapping = {"region": "eligible_region", "max_requirement": "requirement"} | self.property_map
 
-        export_records = get_export_records(
+        table = records_to_frame(
             output_data,
-            partial(apply_property_map, property_map=self.property_map | key_mapping),
-            partial(apply_pint_deconstruction, unit_map=self.unit_map),
-            partial(apply_unnest_key, key_map={"eligible_region": "name"}),
-        )
-        self.system._export_dict_to_csv(
-            export_records,
-            fpath=self.output_folder / fname,
+            property_map=self.property_map | key_mapping,
+            unit_map=self.unit_map,
+            unnest_key_map={"eligible_region": "name"},
             fields=output_fields,
             restval="NA",
         )
+        write_records_table(self.output_folder / fname, table, file_format=self.table_format)
         logger.info(f"File {fname} created.")
         return
 
@@ -418,16 +387,18 @@ class SiennaExporter(BaseExporter):
             "unit_type",
         ]
 
-        storage_list = get_export_records(
+        storage_pipeline = compile_export_pipeline(
+            partial(apply_property_map, property_map=self.property_map),
+            keys_to_flatten={"active_power_limits"},
+            unit_map=self.unit_map,
+        )
+        storage_list = apply_export_pipeline(
             list(
                 self.system.to_records(
                     Generator, filter_func=lambda x: isinstance(x, Storage | HydroPumpedStorage)
                 )
             ),
-            partial(apply_property_map, property_map=self.property_map),
-            partial(apply_flatten_key, keys_to_flatten={"active_power_limits"}),
-            partial(apply_pint_deconstruction, unit_map=self.unit_map),
-            # partial(apply_valid_properties, valid_properties=output_fields),
+            storage_pipeline,
         )
 
         if not storage_list:
@@ -465,15 +436,8 @@ class SiennaExporter(BaseExporter):
             output_dict["position"] = "tail"
             output_data.append(tail_copy)
 
-        key_mapping = self.property_map
-        self.system._export_dict_to_csv(
-            output_data,
-            fpath=self.output_folder / fname,
-            fields=output_fields,
-            key_mapping=key_mapping,
-            unnest_key="number",
-            restval="NA",
-        )
+        table = records_to_frame(output_data, fields=output_fields, restval="NA")
+        write_records_table(self.output_folder / fname, table, file_format=self.table_format)
 
         logger.info("File storage.csv created.")
 
@@ -488,7 +452,7 @@ class SiennaExporter(BaseExporter):
         ts_pointers_list = []
 
         for component_type, time_series in self.time_series_objects.items():
-            csv_fpath = self.ts_directory / (f"{component_type}_{self.config.name}_{self.year}.csv")
+            csv_fpath = self.ts_directory / self.time_series_files[component_type].name
             for i in range(len(time_series)):
                 component_name = self.time_series_name_by_type[component_type][i]
                 ts_instance = time_series[i]
@@ -1,14 +1,18 @@
 """Helper functions for the exporters."""
 
 from typing import Any
-from collections.abc import Callable
-import copy
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from functools import wraps
 from r2x.enums import ReserveType, ReserveDirection
 from r2x.exceptions import FieldRemovalError
+import numpy as np
 import pint
+import polars as pl
 from infrasys.base_quantity import BaseQuantity
 
+_MISSING = object()
+
 
 def get_reserve_type(
     reserve_type: ReserveType, reserve_direction: ReserveDirection, reserve_types: dict[str, dict[str, str]]
@@ -35,9 +39,9 @@ def required_fields(*fields: str | list[str] | set):
     ) -> Callable:
         @wraps(func)
         def wrapper(component_data, *args, **kwargs):
-            original_data = copy.deepcopy(component_data)
-            result = func(component_data)
-            removed_fields = set(original_data.keys()) - set(result.keys())
+            original_keys = set(component_data)
+            result = func(component_data, *args, **kwargs)
+            removed_fields = original_keys - result.keys()
             if removed_fields & set(fields):
                 removed_required = removed_fields & set(fields)
                 raise FieldRemovalError(
@@ -82,6 +86,144 @@ def modify_components(
     return compose(*transform_functions)
 
 
+def compile_export_pipeline(
+    *pre_transforms: Callable[[dict[str, Any]], dict[str, Any]],
+    extract_key: str | None = None,
+    keys_to_extract: set[str] | None = None,
+    keys_to_flatten: set[str] | None = None,
+    property_map: dict[str, str] | None = None,
+    unit_map: dict[str, str] | None = None,
+    unnest_key_map: dict[str, Any] | None = None,
+    default_value_map: dict[str, Any] | None = None,
+    valid_properties: Iterable[str] | None = None,
+    add_name: bool = False,
+) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    """Merge the export transformations into a single function that visits each key once.
+
+    The returned function is equivalent to composing `pre_transforms` with `apply_extract_key`,
+    `apply_flatten_key`, `apply_property_map`, `apply_pint_deconstruction`, `apply_unnest_key`,
+    `apply_default_value` and `apply_valid_properties`, in that order, but builds a single output
+    dictionary per record instead of one per transformation. The input record is not modified by the
+    merged transformations, so it is safe to pass dictionaries owned by components (e.g., `ext`).
+
+    Parameters
+    ----------
+    *pre_transforms : Callable[[dict[str, Any]], dict[str, Any]]
+        Record transformations applied before the merged ones.
+    extract_key : str, optional
+        Key of the nested dictionary to extract `keys_to_extract` from.
+    keys_to_extract : set[str], optional
+        Keys to extract from `extract_key`.
+    keys_to_flatten : set[str], optional
+        Keys whose nested dictionaries are flattened.
+    property_map : dict[str, str], optional
+        Mapping of the record keys to new keys.
+    unit_map : dict[str, str], optional
+        Units to convert each property to.
+    unnest_key_map : dict[str, Any], optional
+        Key to extract from the nested dictionary of each property.
+    default_value_map : dict[str, Any], optional
+        Default value of each property for missing or None values.
+    valid_properties : Iterable[str], optional
+        Properties to keep. Keeps every property if None.
+    add_name : bool, optional
+        Keep the `name` even if it is not a valid property (default is False).
+
+    Returns
+    -------
+    Callable[[dict[str, Any]], dict[str, Any]]
+        Function that transforms a record.
+
+    Examples
+    --------
+    >>> pipeline = compile_export_pipeline(property_map={"rating": "Max Flow"}, valid_properties=["Max Flow"])
+    >>> pipeline({"name": "line1", "rating": 100, "category": "ac"})
+    {'Max Flow': 100}
+    """
+    keys_to_extract = keys_to_extract or set()
+    keys_to_flatten = keys_to_flatten or set()
+    property_map = property_map or {}
+    unit_map = unit_map or {}
+    unnest_key_map = unnest_key_map or {}
+    default_value_map = default_value_map or {}
+    valid_keys = None
+    if valid_properties is not None:
+        valid_keys = set(valid_properties) | ({"name"} if add_name else set())
+
+    def transform(record: dict[str, Any]) -> dict[str, Any]:
+        for pre_transform in pre_transforms:
+            record = pre_transform(record)
+
+        output: dict[str, Any] = {}
+        for key, value in _get_record_items(record, extract_key, keys_to_extract):
+            for output_key, output_value in _flatten_item(key, value, keys_to_flatten):
+                output_key = property_map.get(output_key, output_key)
+                output_value = get_property_magnitude(output_value, to_unit=unit_map.get(output_key))
+                if (nested_key := unnest_key_map.get(output_key)) is not None and isinstance(
+                    output_value, dict
+                ):
+                    output_value = output_value.get(nested_key, output_value)
+                output[output_key] = output_value
+
+        for key, default_value in default_value_map.items():
+            if output.get(key) is None:
+                output[key] = default_value
+
+        if valid_keys is None:
+            return output
+        return {key: value for key, value in output.items() if key in valid_keys}
+
+    return transform
+
+
+def _get_record_items(
+    record: dict[str, Any], extract_key: str | None, keys_to_extract: set[str]
+) -> list[tuple[str, Any]]:
+    """Return the items of the record plus the keys extracted from its nested `extract_key` dictionary."""
+    items = list(record.items())
+    nested = record.get(extract_key) if extract_key is not None else None
+    if (
+        isinstance(nested, dict)
+        and not keys_to_extract.intersection(record)
+        and keys_to_extract.intersection(nested)
+    ):
+        items.extend((key, value) for key, value in nested.items() if key in keys_to_extract)
+    return items
+
+
+def _flatten_item(key: str, value: Any, keys_to_flatten: set[str]) -> list[tuple[str, Any]]:
+    """Return the item as a list of `key_subkey` items if it is a nested dictionary to flatten."""
+    if key in keys_to_flatten and isinstance(value, dict):
+        return [(f"{key}_{inner_key}", inner_value) for inner_key, inner_value in value.items()]
+    return [(key, value)]
+
+
+def apply_export_pipeline(
+    records: list[dict[str, Any]] | pl.DataFrame, pipeline: Callable[[dict[str, Any]], dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Apply a compiled export pipeline to a batch of records.
+
+    Lists are updated in place. Tables (e.g., from `records_to_frame`) are converted to records first.
+
+    Parameters
+    ----------
+    records : list[dict[str, Any]] | pl.DataFrame
+        Records to transform.
+    pipeline : Callable[[dict[str, Any]], dict[str, Any]]
+        Function created with `compile_export_pipeline`.
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        Transformed records.
+    """
+    if isinstance(records, pl.DataFrame):
+        records = records.to_dicts()
+    for idx, record in enumerate(records):
+        records[idx] = pipeline(record)
+    return records
+
+
 def apply_property_map(component: dict[str, Any], property_map: dict[str, str]) -> dict[str, Any]:
     """Apply a key mapping to component keys.
 
@@ -369,3 +511,125 @@ def apply_extract_key(d: dict[str, Any], key: str, keys_to_extract: set[str]) ->
 
     extracted_keys = {key: value for key, value in d[key].items() if key in keys_to_extract}
     return {**d, **extracted_keys}
+
+
+def records_to_frame(
+    records: Iterable[dict[str, Any]],
+    property_map: dict[str, str] | None = None,
+    unit_map: dict[str, str] | None = None,
+    unnest_key_map: dict[str, Any] | None = None,
+    keys_to_flatten: set[str] | None = None,
+    default_value_map: dict[str, Any] | None = None,
+    fields: list[str] | None = None,
+    restval: Any = None,
+) -> pl.DataFrame:
+    """Return the component records as a table, applying the export transformations per column.
+
+    The records are read once into columns and each transformation runs over a whole column. The result
+    is equivalent to applying `apply_flatten_key`, `apply_property_map`,
+    `apply_pint_deconstruction`, `apply_unnest_key` and `apply_default_value`, in that order, and
+    selecting `fields` like `csv.DictWriter` does.
+
+    Parameters
+    ----------
+    records : Iterable[dict[str, Any]]
+        Component records. Typically created with `.model_dump()`.
+    property_map : dict[str, str], optional
+        Mapping of the record keys to column names.
+    unit_map : dict[str, str], optional
+        Units to convert each column to.
+    unnest_key_map : dict[str, Any], optional
+        Key to extract from the nested dictionaries of each column.
+    keys_to_flatten : set[str], optional
+        Keys whose nested dictionaries become one column per sub-key.
+    default_value_map : dict[str, Any], optional
+        Default value of each column for missing or None values.
+    fields : list[str], optional
+        Columns to keep, in order. Keeps every column if None.
+    restval : Any, optional
+        Value of the fields that are missing from a record.
+
+    Returns
+    -------
+    pl.DataFrame
+        Table with one row per record. Columns with mixed or non-primitive values are converted to strings.
+
+    Examples
+    --------
+    >>> records = [{"name": "bus1", "zone": {"name": "z1"}}, {"name": "bus2"}]
+    >>> records_to_frame(records, unnest_key_map={"zone": "name"}, restval="NA").rows()
+    [('bus1', 'z1'), ('bus2', 'NA')]
+    """
+    records = list(records)
+    num_records = len(records)
+    property_map = property_map or {}
+    unit_map = unit_map or {}
+    unnest_key_map = unnest_key_map or {}
+    keys_to_flatten = keys_to_flatten or set()
+
+    columns: dict[str, list[Any]] = {}
+    for idx, record in enumerate(records):
+        for key, value in record.items():
+            if key in keys_to_flatten and isinstance(value, dict):
+                items = [(f"{key}_{inner_key}", inner_value) for inner_key, inner_value in value.items()]
+            else:
+                items = [(key, value)]
+            for column_name, column_value in items:
+                column_name = property_map.get(column_name, column_name)
+                if (column := columns.get(column_name)) is None:
+                    column = columns[column_name] = [_MISSING] * num_records
+                column[idx] = column_value
+
+    for column_name, column in columns.items():
+        _deconstruct_quantities(column, to_unit=unit_map.get(column_name))
+        if (nested_key := unnest_key_map.get(column_name)) is not None:
+            columns[column_name] = [
+                value.get(nested_key, value) if isinstance(value, dict) else value for value in column
+            ]
+
+    for column_name, default_value in (default_value_map or {}).items():
+        column = columns.get(column_name, [_MISSING] * num_records)
+        columns[column_name] = [
+            default_value if value is None or value is _MISSING else value for value in column
+        ]
+
+    if fields is None:
+        fields = list(columns)
+    return pl.DataFrame(
+        [
+            _to_series(field, [restval if value is _MISSING else value for value in columns[field]])
+            if field in columns
+            else _to_series(field, [restval] * num_records)
+            for field in fields
+        ]
+    )
+
+
+def _deconstruct_quantities(column: list[Any], to_unit: str | None = None) -> None:
+    """Replace the quantities of a column by their magnitude, converting each distinct unit once."""
+    indices_by_units: dict[Any, list[int]] = defaultdict(list)
+    for idx, value in enumerate(column):
+        if isinstance(value, pint.Quantity | BaseQuantity):
+            if to_unit and np.ndim(value.magnitude) == 0:
+                indices_by_units[value.units].append(idx)
+            else:
+                column[idx] = get_property_magnitude(value, to_unit=to_unit)
+
+    if not to_unit:
+        return
+    to_unit = to_unit.replace("$", "usd")
+    for indices in indices_by_units.values():
+        first_value = column[indices[0]]
+        magnitudes = np.array([column[idx].magnitude for idx in indices])
+        converted = type(first_value)(magnitudes, first_value.units).to(to_unit)
+        for idx, magnitude in zip(indices, converted.magnitude.tolist(), strict=True):
+            column[idx] = magnitude
+
+
+def _to_series(name: str, values: list[Any]) -> pl.Series:
+    value_types = {type(value) for value in values if value is not None}
+    if value_types and value_types <= {int, float}:
+        return pl.Series(name, values, dtype=pl.Float64 if float in value_types else pl.Int64)
+    if value_types in ({bool}, {str}):
+        return pl.Series(name, values)
+    return pl.Series(name, [None if value is None else str(value) for value in values], dtype=pl.String)
@@ -28,6 +28,7 @@ def setup_logging(
     filename=None,
     level="INFO",
     verbosity: int = 0,
+    console: bool = True,
 ):
     """Configure logging of file.
 
@@ -39,6 +40,8 @@ def setup_logging(
         change defualt level of logging.
     verbose :  bool
         returns additional logging information.
+    console : bool
+        If False, only log to `filename`.
     """
     match verbosity:
         case 0:
@@ -60,12 +63,13 @@ def setup_logging(
     # logger.enable("infrasys")
     # logger.enable("resource_monitor")
     level = os.environ["LOGURU_LEVEL"] if os.environ.get("LOGURU_LEVEL") else level
-    logger.add(
-        sys.stderr,
-        level=level,
-        enqueue=False,
-        format=Formatter().format if level == "DEBUG" or level == "TRACE" else DEFAULT_FORMAT,
-    )
+    if console:
+        logger.add(
+            sys.stderr,
+            level=level,
+            enqueue=False,
+            format=Formatter().format if level == "DEBUG" or level == "TRACE" else DEFAULT_FORMAT,
+        )
     if filename:
         logger.add(filename, level=level, enqueue=True)
 
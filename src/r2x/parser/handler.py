@@ -4,12 +4,18 @@ This module provides the abstract class to create parser objects.
 """
 
 # System packages
+import hashlib
 import inspect
 import json
+import os
+import time
+import uuid
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, MutableMapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
 from typing import Any, TypeVar
 
@@ -25,10 +31,65 @@ from pydantic import ValidationError
 from r2x.api import System
 from r2x.config_scenario import Scenario
 
-from ..utils import check_file_exists
+from ..utils import check_file_exists, get_max_workers, is_flag_enabled
 from .handler_utils import csv_handler, h5_handler
 from .polars_helpers import pl_filter_year, pl_rename
 
+DEFAULT_CACHE_FOLDER = ".r2x_cache"
+CACHEABLE_SUFFIXES = {".csv"}
+
+
+class ParsedData(MutableMapping):
+    """Mapping of parsed files that collects lazily scanned files on first access.
+
+    Files read with the `lazy-parse` feature flag are stored as `pl.LazyFrame` and only collected (once) when
+    a component constructor or plugin asks for them, so that the year filter and column selection are
+    pushed down into the CSV scan. The files are kept on a private dictionary, so every access (`get`,
+    `items`, `update`, `dict(data)`, etc.) goes through `__getitem__` and never returns a pending frame.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._data: dict[str, Any] = {}
+        self._pending: set[str] = set()
+        self.update(*args, **kwargs)
+
+    def set_lazy(self, key: str, value: pl.LazyFrame) -> None:
+        """Store a lazy frame that is collected the first time that it is accessed."""
+        self._data[key] = value
+        self._pending.add(key)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._data[key]
+        if key in self._pending:
+            logger.trace("Collecting lazy data for {}", key)
+            value = self._data[key] = value.collect()
+            self._pending.discard(key)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._pending.discard(key)
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        self._pending.discard(key)
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({list(self._data)})"
+
+    def copy(self) -> "ParsedData":
+        """Return a shallow copy that keeps the pending files lazy."""
+        data = ParsedData()
+        data._data = self._data.copy()
+        data._pending = self._pending.copy()
+        return data
+
 
 @dataclass
 class BaseParser(ABC):
@@ -56,7 +117,7 @@ class BaseParser(ABC):
     """
 
     config: Scenario
-    data: dict = field(default_factory=dict)
+    data: MutableMapping[str, Any] = field(default_factory=ParsedData)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(Files parsed: {len(self.data)})"
@@ -106,12 +167,65 @@ class BaseParser(ABC):
         filter_func: list[Callable] | None = None,
         **kwargs,
     ) -> None:
-        """Parse all the data for the given translation."""
-        _fmap = deepcopy(fmap)
+        """Parse all the data for the given translation.
+
+        The files are read sequentially unless the `parallel-parse` feature flag is set. With the flag, all
+        the files are read concurrently on a thread pool (`parallel-parse=true` uses the default number of
+        workers, an integer sets it). In both cases `self.data` keeps the order of the `fmap` and the first
+        missing mandatory file or reading error in `fmap` order is raised.
+
+        With the `lazy-parse` feature flag, CSV files are scanned lazily so that the filter functions are
+        pushed down into the scan. They are collected the first time that they are accessed.
+        """
         if base_folder is None:
             logger.warning("Missing base folder for {}", self.config.name)
             return None
         logger.trace("Parsing data for {}", self.__class__.__name__)
+        cache_folder = self._get_cache_folder(base_folder)
+        files_to_read = self._get_files_to_read(base_folder=base_folder, fmap=fmap, **kwargs)
+
+        if is_flag_enabled(self.config.feature_flags.get("lazy-parse")):
+            if not isinstance(self.data, ParsedData):
+                self.data = ParsedData(self.data)
+            for _, read_kwargs in files_to_read.values():
+                read_kwargs["lazy"] = True
+
+        load_file = partial(self._load_file, cache_folder=cache_folder, filter_funcs=filter_func)
+        parallel_flag = self.config.feature_flags.get("parallel-parse")
+        if not is_flag_enabled(parallel_flag) or len(files_to_read) < 2:
+            for dname, (fpath, read_kwargs) in files_to_read.items():
+                data = load_file(dname, fpath, **read_kwargs)
+                self._store_data(dname, data, lazy=_is_lazy_scan(fpath, read_kwargs))
+            return None
+
+        logger.debug("Reading {} files concurrently", len(files_to_read))
+        executor = ThreadPoolExecutor(
+            max_workers=get_max_workers(parallel_flag), thread_name_prefix="r2x-parse"
+        )
+        try:
+            futures = {
+                dname: executor.submit(load_file, dname, fpath, **read_kwargs)
+                for dname, (fpath, read_kwargs) in files_to_read.items()
+            }
+            for dname, future in futures.items():
+                self._store_data(dname, future.result(), lazy=_is_lazy_scan(*files_to_read[dname]))
+        finally:
+            # If one of the files failed, cancel the reads that have not started. Running reads still finish.
+            executor.shutdown(wait=True, cancel_futures=True)
+        return None
+
+    def _get_files_to_read(
+        self, *, base_folder: str | Path, fmap: dict, **kwargs
+    ) -> dict[str, tuple[Path | str, dict]]:
+        """Return the path and reading options of each fmap entry found on the base folder.
+
+        Raises
+        ------
+        FileNotFoundError
+            If a mandatory file is not found.
+        """
+        _fmap = deepcopy(fmap)
+        files_to_read: dict[str, tuple[Path | str, dict]] = {}
         for dname, data in _fmap.items():
             if not isinstance(data, dict):
                 continue
@@ -127,9 +241,101 @@ class BaseParser(ABC):
                     fpath = _fpath
                 assert isinstance(fpath, Path) or isinstance(fpath, str)
                 fmap[dname]["fpath"] = fpath
-                self.data[dname] = self.read_file(fpath=fpath, filter_funcs=filter_func, **{**data, **kwargs})
-                logger.debug("Loaded file for {} from {}", dname, fpath)
-        return None
+                files_to_read[dname] = (fpath, {**data, **kwargs})
+        return files_to_read
+
+    def _store_data(self, dname: str, data: Any, lazy: bool = False) -> None:
+        """Store parsed data. If `lazy`, lazy frames are collected on first access."""
+        if lazy and isinstance(data, pl.LazyFrame) and isinstance(self.data, ParsedData):
+            self.data.set_lazy(dname, data)
+            return
+        self.data[dname] = data
+
+    def _load_file(
+        self,
+        dname: str,
+        fpath: Path | str,
+        /,
+        *,
+        cache_folder: Path | None = None,
+        filter_funcs: list[Callable] | None = None,
+        **kwargs,
+    ):
+        """Read a single fmap entry and log its reading time and size."""
+        start = time.perf_counter()
+        if cache_folder is not None and Path(fpath).suffix in CACHEABLE_SUFFIXES:
+            data = self._read_cached_file(
+                dname, fpath=fpath, cache_folder=cache_folder, filter_funcs=filter_funcs, **kwargs
+            )
+        else:
+            data = self.read_file(fpath=fpath, filter_funcs=filter_funcs, **kwargs)
+        file_size = os.path.getsize(fpath) if os.path.exists(fpath) else 0
+        logger.debug(
+            "Loaded file for {} from {} ({:.2f} MB in {:.3f}s)",
+            dname,
+            fpath,
+            file_size / 1024**2,
+            time.perf_counter() - start,
+        )
+        return data
+
+    def _get_cache_folder(self, base_folder: str | Path) -> Path | None:
+        """Return the folder of the parsed data cache if enabled with the `parser-cache` feature flag.
+
+        The flag accepts a boolean (`parser-cache=true`) to use `{run_folder}/.r2x_cache` or the path of the
+        folder to use instead.
+        """
+        cache_flag = self.config.feature_flags.get("parser-cache")
+        if not is_flag_enabled(cache_flag):
+            return None
+        if cache_flag is True or str(cache_flag).lower() in {"true", "1", "yes"}:
+            return Path(base_folder) / DEFAULT_CACHE_FOLDER
+        return Path(str(cache_flag))
+
+    def _read_cached_file(
+        self,
+        dname: str,
+        /,
+        *,
+        fpath: Path | str,
+        cache_folder: Path,
+        filter_funcs: list[Callable] | None = None,
+        **kwargs,
+    ):
+        """Read a file using the on-disk Parquet cache of parsed data.
+
+        The cached frame is the result of :meth:`read_file`, i.e., after applying the `filter_funcs`. It is
+        stored as `{cache_folder}/{dname}-{key}.parquet` where the key changes if the source file (path, size
+        or modification time), the fmap entry, the parsing options or the filter functions change. Files
+        that do not return data (e.g., empty CSV files) are stored as an empty `.empty` marker.
+        """
+        cache_key = get_cache_key(fpath, filter_funcs=filter_funcs, **kwargs)
+        cache_fpath = cache_folder / f"{dname}-{cache_key[:16]}.parquet"
+        empty_fpath = cache_fpath.with_suffix(".empty")
+
+        if cache_fpath.exists():
+            logger.trace("Reading {} from cache {}", dname, cache_fpath)
+            return pl.read_parquet(cache_fpath, memory_map=True)
+        if empty_fpath.exists():
+            return None
+
+        data = self.read_file(fpath=fpath, filter_funcs=filter_funcs, **kwargs)
+        if data is None:
+            cache_folder.mkdir(parents=True, exist_ok=True)
+            empty_fpath.touch()
+            return None
+        if not isinstance(data, pl.DataFrame | pl.LazyFrame):
+            return data
+
+        logger.trace("Saving {} to cache {}", dname, cache_fpath)
+        if isinstance(data, pl.LazyFrame):
+            data = data.collect()
+        cache_folder.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent runs never read a partial file.
+        tmp_fpath = cache_fpath.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        data.write_parquet(tmp_fpath)
+        os.replace(tmp_fpath, cache_fpath)
+        return data
 
     @abstractmethod
     def build_system(self) -> System:
@@ -182,6 +388,53 @@ def file_handler(
             raise NotImplementedError(f"File {fpath.suffix = } not yet supported.")
 
 
+def _is_lazy_scan(fpath: Path | str, read_kwargs: dict) -> bool:
+    return bool(read_kwargs.get("lazy")) and Path(fpath).suffix == ".csv"
+
+
+def _cache_key_default(value: Any) -> Any:
+    if isinstance(value, set | frozenset):
+        return sorted(map(str, value))
+    return str(value)
+
+
+def _get_func_name(func: Callable) -> str:
+    if isinstance(func, partial):
+        return f"{_get_func_name(func.func)}{func.args}{sorted(func.keywords.items())}"
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def get_cache_key(fpath: Path | str, filter_funcs: list[Callable] | None = None, **kwargs) -> str:
+    """Return the key of a parsed file on the Parquet cache.
+
+    Parameters
+    ----------
+    fpath
+        Source file.
+    filter_funcs
+        Functions applied to the file after reading it.
+    **kwargs
+        fmap entry and parsing options of the file. The complete `fmap` is ignored.
+
+    Returns
+    -------
+    str
+        SHA-256 of the source path, size and modification time, the filter functions and the options.
+    """
+    fpath = Path(fpath).resolve()
+    stat = fpath.stat()
+    payload = {
+        "fpath": str(fpath),
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "filter_funcs": [_get_func_name(func) for func in filter_funcs or []],
+        "entry": {key: value for key, value in kwargs.items() if key != "fmap"},
+    }
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, default=_cache_key_default).encode()
+    ).hexdigest()
+
+
 ParserClass = TypeVar("ParserClass", bound=BaseParser)
 
 
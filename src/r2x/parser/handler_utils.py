@@ -1,16 +1,19 @@
 """Helper functions for base parser."""
 
+from collections.abc import Sequence
 from pathlib import Path
 
 import h5py
-import pandas as pd
+import numpy as np
 import polars as pl
 from loguru import logger
 
 from .polars_helpers import pl_lowercase
 
 
-def csv_handler(fpath: Path, csv_file_encoding="utf8", **kwargs) -> pl.DataFrame:
+def csv_handler(
+    fpath: Path, csv_file_encoding="utf8", lazy: bool = False, **kwargs
+) -> pl.DataFrame | pl.LazyFrame | None:
     """Parse CSV files and return a Polars DataFrame with all column names in lowercase.
 
     Parameters
@@ -19,14 +22,17 @@ def csv_handler(fpath: Path, csv_file_encoding="utf8", **kwargs) -> pl.DataFrame
         The file path of the CSV file to read.
     csv_file_encoding : str, optional
         The encoding format of the CSV file, by default "utf8".
+    lazy : bool, optional
+        If True, return a `pl.LazyFrame` from `pl.scan_csv` so that later filters and projections are
+        pushed down to the scan. Only supported for utf8 files, by default False.
     **kwargs : dict, optional
         Additional keyword arguments passed to the `pl.read_csv` function.
 
     Returns
     -------
-    pl.DataFrame or None
+    pl.DataFrame, pl.LazyFrame or None
         The parsed CSV file as a Polars DataFrame with lowercase column names if successful,
-        or `None` if the file was not found.
+        or `None` if the file is empty.
 
     Raises
     ------
@@ -55,12 +61,26 @@ def csv_handler(fpath: Path, csv_file_encoding="utf8", **kwargs) -> pl.DataFrame
     """
     logger.trace("Attempting reading file {}", fpath)
     logger.trace("Parsing file {}", fpath)
+    lazy = lazy and csv_file_encoding in {"utf8", "utf8-lossy"}
     try:
-        data_file = pl.read_csv(
-            fpath.as_posix(),
-            infer_schema_length=10_000_000,
-            encoding=csv_file_encoding,
-        )
+        if lazy:
+            # Infer the schema once. Without a fixed schema, every plan derived from the scan infers it again
+            # by reading the file. The eager reader infers it faster than `collect_schema` on a scan.
+            schema = pl.read_csv(
+                fpath.as_posix(),
+                infer_schema_length=10_000_000,
+                encoding=csv_file_encoding,
+                n_rows=0,
+            ).schema
+            data_file = pl.scan_csv(fpath.as_posix(), schema=schema, encoding=csv_file_encoding)
+            is_empty = not _has_data_rows(fpath)
+        else:
+            data_file = pl.read_csv(
+                fpath.as_posix(),
+                infer_schema_length=10_000_000,
+                encoding=csv_file_encoding,
+            )
+            is_empty = data_file.is_empty()
     except FileNotFoundError:
         msg = f"File {fpath} not found."
         logger.error(msg)
@@ -69,9 +89,9 @@ def csv_handler(fpath: Path, csv_file_encoding="utf8", **kwargs) -> pl.DataFrame
         logger.warning("File {} could not be parse due to dtype problems. See error.", fpath)
         raise
 
-    if data_file.is_empty():
+    if is_empty:
         logger.debug("File {} is empty. Skipping it.", fpath)
-        return
+        return None
 
     if kwargs.get("keep_case") is None:
         data_file = pl_lowercase(data_file)
@@ -79,8 +99,163 @@ def csv_handler(fpath: Path, csv_file_encoding="utf8", **kwargs) -> pl.DataFrame
     return data_file
 
 
-def h5_handler(fpath, parser_class: str, **kwargs) -> pl.LazyFrame:
-    """Parse H5 files and return a Polars DataFrame.
+def _has_data_rows(fpath: Path) -> bool:
+    """Return True if the CSV file has at least one line after the header."""
+    with open(fpath, "rb") as csv_file:
+        csv_file.readline()
+        return any(line.strip() for line in csv_file)
+
+
+class H5Reader:
+    """Column-selective reader of the ReEDS `.h5` profiles (e.g., `recf.h5` or `load.h5`).
+
+    Only the column names are read when the reader is created. The profiles are read on demand with
+    :meth:`read`, which slices the requested rows and columns directly from the `data` dataset, so a single
+    weather year of a multi-year file never materializes the full matrix.
+
+    Parameters
+    ----------
+    fpath : str | Path
+        The file path of the H5 file to read.
+
+    Attributes
+    ----------
+    columns : list[str]
+        Decoded column names of the `data` dataset.
+    column_index : dict[str, int]
+        Mapping from column name to its position in the `data` dataset.
+    shape : tuple[int, int]
+        Shape of the `data` dataset.
+
+    Example
+    -------
+    >>> reader = H5Reader("recf.h5")
+    >>> profiles = reader.read(["upv_1_p1"], start=0, end=8760)
+    >>> profiles["upv_1_p1"].shape
+    (8760,)
+    """
+
+    def __init__(self, fpath: str | Path) -> None:
+        self.fpath = Path(fpath)
+        with h5py.File(self.fpath, "r") as f:
+            self.columns: list[str] = [col.decode("utf-8") for col in f["columns"]]
+            self.shape: tuple[int, int] = f["data"].shape
+            self._dtype = f["data"].dtype
+        self.column_index: dict[str, int] = {column: idx for idx, column in enumerate(self.columns)}
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.fpath}, shape={self.shape})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, H5Reader) and self.fpath == other.fpath
+
+    def __len__(self) -> int:
+        return self.shape[0]
+
+    def __contains__(self, column: object) -> bool:
+        return column in self.column_index
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Return the dtype of the profiles. Half precision files are read as float32."""
+        return np.dtype(np.float32) if self._dtype == np.float16 else self._dtype
+
+    def collect_schema(self) -> pl.Schema:
+        """Return the schema of :meth:`collect`."""
+        value_dtype = pl.Series(np.empty(0, dtype=self.dtype)).dtype
+        return pl.Schema({"index": pl.Int64, **{column: value_dtype for column in self.columns}})
+
+    def read_array(
+        self, columns: Sequence[str] | None = None, start: int | None = None, end: int | None = None
+    ) -> np.ndarray:
+        """Read the rows `start:end` of the requested columns as a 2-D array.
+
+        Parameters
+        ----------
+        columns : Sequence[str] | None
+            Columns to read. Repeated columns are only read once from the file. If None, read all the
+            columns.
+        start : int | None
+            First row to read.
+        end : int | None
+            Row after the last row to read.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape `(rows, len(columns))` with the columns in the order requested.
+
+        Raises
+        ------
+        KeyError
+            If a requested column is not on the file.
+        """
+        columns = self.columns if columns is None else list(columns)
+        if missing := [column for column in dict.fromkeys(columns) if column not in self.column_index]:
+            msg = f"Columns {missing} not found in {self.fpath}."
+            raise KeyError(msg)
+
+        if not columns:
+            return np.empty((0, 0), dtype=self.dtype)
+
+        rows = slice(start, end)
+        column_idx = sorted({self.column_index[column] for column in columns})
+        with h5py.File(self.fpath, "r") as f:
+            dataset = f["data"]
+            if dataset.chunks is None and len(column_idx) <= dataset.shape[1] // 2:
+                # h5py requires increasing indices for the point selection.
+                values = dataset[rows, column_idx]
+                position = {idx: pos for pos, idx in enumerate(column_idx)}
+            else:
+                # Selecting columns of a chunked (and usually compressed) dataset decompresses every
+                # chunk once per column, so we read the covering span and select in memory.
+                values = dataset[rows, column_idx[0] : column_idx[-1] + 1]
+                position = {idx: idx - column_idx[0] for idx in column_idx}
+        order = [position[self.column_index[column]] for column in columns]
+        if order != list(range(values.shape[1])):
+            values = values[:, order]
+        return values.astype(self.dtype, copy=False)
+
+    def read(
+        self, columns: Sequence[str] | None = None, start: int | None = None, end: int | None = None
+    ) -> dict[str, np.ndarray]:
+        """Read the rows `start:end` of the requested columns.
+
+        Parameters
+        ----------
+        columns : Sequence[str] | None
+            Columns to read. If None, read all the columns.
+        start : int | None
+            First row to read.
+        end : int | None
+            Row after the last row to read.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            One array per requested column in the order requested.
+
+        Raises
+        ------
+        KeyError
+            If a requested column is not on the file.
+
+        See Also
+        --------
+        read_array : Read the columns as a single 2-D array.
+        """
+        columns = self.columns if columns is None else list(dict.fromkeys(columns))
+        values = self.read_array(columns, start=start, end=end)
+        return {column: values[:, idx] for idx, column in enumerate(columns)}
+
+    def collect(self) -> pl.DataFrame:
+        """Return all the profiles as a DataFrame with an `index` column."""
+        profiles = self.read()
+        return pl.DataFrame({"index": np.arange(len(self), dtype=np.int64), **profiles})
+
+
+def h5_handler(fpath, parser_class: str, **kwargs) -> H5Reader:
+    """Parse H5 files and return a column-selective reader.
 
     Currently, the only exception we handle is for ReEDS since it is formatting differently. If new parsers or
     existing parsers required h5 reading, we will need to add new handlers.
@@ -96,15 +271,14 @@ def h5_handler(fpath, parser_class: str, **kwargs) -> pl.LazyFrame:
     ------
     NotImplementedError
         Raised if a non supported parser request a h5 file.
+
+    See Also
+    --------
+    H5Reader : Reader returned for ReEDS files.
     """
     match parser_class:
         case "ReEDSParser":
-            with h5py.File(fpath, "r") as f:
-                return pl.LazyFrame(
-                    pd.DataFrame(
-                        f["data"], columns=[col.decode("utf-8") for col in f["columns"]]
-                    ).reset_index()
-                )
+            return H5Reader(fpath)
         case _:
             msg = f"H5 file parsing is not implemented for {parser_class=}."
             raise NotImplementedError(msg)
@@ -2,10 +2,11 @@
 # ruff: noqa
 
 from datetime import timedelta
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, Literal
 import polars as pl
 import numpy as np
-import cvxpy as cp
+from numpy.typing import ArrayLike, NDArray
 
 from infrasys.function_data import QuadraticFunctionData, PiecewiseLinearData, XYCoords
 
@@ -282,7 +283,9 @@ def reconcile_timeseries(data_file: pl.DataFrame, hourly_time_index: pl.DataFram
     return data_file
 
 
-def construct_pwl_from_quadtratic(fn, mapped_records, num_tranches=6):
+def construct_pwl_from_quadtratic(
+    fn, mapped_records, num_tranches=6, solver: Literal["isotonic", "cvxpy"] = "isotonic"
+):
     """Given function data of quadratic curve, construct piecewise linear curve with num_tranches tranches."""
     assert isinstance(fn, QuadraticFunctionData), "Input function data must be of type QuadraticFunctionData"
     if isinstance(num_tranches, str):
@@ -296,11 +299,9 @@ def construct_pwl_from_quadtratic(fn, mapped_records, num_tranches=6):
 
     # Use evenly spaced X values for the tranches
     # Future iteration should accept custom X values for Bid Cost Markup
-    x_vals, y_vals = optimize_pwl(a, b, c, x_min, x_max, num_tranches)
+    x_vals, y_vals = optimize_pwl(a, b, c, x_min, x_max, num_tranches, solver=solver)
 
-    pwl_fn = PiecewiseLinearData(
-        points=[XYCoords(x, y) for x, y in sorted(zip(x_vals, y_vals), key=lambda x: x[0])]
-    )
+    pwl_fn = _to_piecewise_linear(x_vals, y_vals)
 
     # # Plot the results
     # import matplotlib.pyplot as plt
@@ -321,7 +322,65 @@ def construct_pwl_from_quadtratic(fn, mapped_records, num_tranches=6):
     return pwl_fn
 
 
-def optimize_pwl(a, b, c, min, max, n_tranches=6):
+def construct_pwl_batch_from_quadratic(
+    fns: Sequence[QuadraticFunctionData],
+    x_min: ArrayLike,
+    x_max: ArrayLike,
+    num_tranches: int | str = 6,
+) -> list[PiecewiseLinearData]:
+    """Construct the piecewise linear curves of several quadratic curves with a single fit.
+
+    Same result as calling `construct_pwl_from_quadtratic` for each curve, but every curve is fitted at once
+    with `fit_monotone_pwl`.
+
+    Parameters
+    ----------
+    fns : Sequence[QuadraticFunctionData]
+        Quadratic function data of each curve.
+    x_min, x_max : ArrayLike
+        Lower and upper limit of each curve.
+    num_tranches : int | str, optional
+        Number of breakpoints of each curve (default is 6).
+
+    Returns
+    -------
+    list[PiecewiseLinearData]
+        Piecewise linear curve of each quadratic curve, in the same order.
+    """
+    if not fns:
+        return []
+    x_values, y_values = fit_monotone_pwl(
+        [fn.quadratic_term for fn in fns],
+        [fn.proportional_term for fn in fns],
+        [fn.constant_term for fn in fns],
+        x_min,
+        x_max,
+        int(num_tranches),
+    )
+    return [_to_piecewise_linear(x_vals, y_vals) for x_vals, y_vals in zip(x_values, y_values, strict=True)]
+
+
+def _to_piecewise_linear(x_vals, y_vals) -> PiecewiseLinearData:
+    return PiecewiseLinearData(
+        points=[XYCoords(x, y) for x, y in sorted(zip(x_vals, y_vals), key=lambda x: x[0])]
+    )
+
+
+def optimize_pwl(a, b, c, min, max, n_tranches=6, solver: Literal["isotonic", "cvxpy"] = "isotonic"):
+    """Fit a monotone piecewise linear curve to a quadratic curve.
+
+    The breakpoints are evenly spaced between `min` and `max`, and the values are the least squares fit of
+    the quadratic curve subject to being non-decreasing. By default the fit uses the closed form solution of
+    `fit_monotone_pwl`. Pass `solver="cvxpy"` to solve it as a convex problem instead, which imports cvxpy.
+    """
+    if solver == "isotonic":
+        x_target, y_values = fit_monotone_pwl(a, b, c, min, max, n_tranches)
+        return x_target[0], y_values[0]
+    if solver != "cvxpy":
+        raise ValueError(f"Solver {solver} not supported. Use 'isotonic' or 'cvxpy'.")
+
+    import cvxpy as cp
+
     y = cp.Variable(n_tranches)
     x_target = np.linspace(min, max, n_tranches)
     y_quad = a * x_target**2 + b * x_target + c
@@ -337,6 +396,66 @@ def optimize_pwl(a, b, c, min, max, n_tranches=6):
     return x_target, y.value
 
 
+def fit_monotone_pwl(
+    a: ArrayLike,
+    b: ArrayLike,
+    c: ArrayLike,
+    x_min: ArrayLike,
+    x_max: ArrayLike,
+    n_tranches: int = 6,
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """Fit monotone piecewise linear curves to a batch of quadratic curves.
+
+    Each quadratic curve :math:`a x^2 + b x + c` is sampled on `n_tranches` evenly spaced points between its
+    `x_min` and `x_max`. The values are then projected onto the set of non-decreasing sequences, which is
+    the least squares problem solved by `optimize_pwl` with cvxpy. The projection is an isotonic regression
+    with the closed form `y[i] = max(j <= i) min(k >= i) mean(q[j:k + 1])`, evaluated for every curve at
+    once with the prefix sums of the sampled values `q`.
+
+    Parameters
+    ----------
+    a, b, c : ArrayLike
+        Quadratic, proportional and constant terms of each curve.
+    x_min, x_max : ArrayLike
+        Lower and upper limit of each curve.
+    n_tranches : int, optional
+        Number of breakpoints of each curve (default is 6).
+
+    Returns
+    -------
+    tuple[NDArray[np.float64], NDArray[np.float64]]
+        The x and y values of the breakpoints with shape `(n_curves, n_tranches)`.
+
+    Examples
+    --------
+    >>> x, y = fit_monotone_pwl([1.0, 0.5], [-10.0, 2.0], [30.0, 0.0], [0.0, 10.0], [10.0, 20.0], 3)
+    >>> x
+    array([[ 0.,  5., 10.],
+           [10., 15., 20.]])
+    >>> y
+    array([[ 17.5,  17.5,  30. ],
+           [ 70. , 142.5, 240. ]])
+    """
+    n_tranches = int(n_tranches)
+    a, b, c, x_min, x_max = np.broadcast_arrays(
+        *(np.atleast_1d(np.asarray(term, dtype=np.float64)) for term in (a, b, c, x_min, x_max))
+    )
+    x_target = np.linspace(x_min, x_max, n_tranches, axis=-1)
+    y_quad = a[:, None] * x_target**2 + b[:, None] * x_target + c[:, None]
+
+    # Mean of every window y_quad[j..k] from the prefix sums. Windows with k < j are not valid.
+    prefix = np.concatenate([np.zeros((len(y_quad), 1)), np.cumsum(y_quad, axis=-1)], axis=-1)
+    start = np.arange(n_tranches)[:, None]
+    end = np.arange(n_tranches)[None, :]
+    valid = end >= start
+    window_means = (prefix[:, None, 1:] - prefix[:, :-1, None]) / np.where(valid, end - start + 1, 1)
+
+    # min over the windows that end at or after i, then max over the windows that start at or before i.
+    suffix_min = np.minimum.accumulate(np.where(valid, window_means, np.inf)[..., ::-1], axis=-1)[..., ::-1]
+    y_values = np.where(valid, suffix_min, -np.inf).max(axis=1)
+    return x_target, y_values
+
+
 def _bid_cost_mark_up(fn, mapped_records):
     # TODO(ktehranchi): Implement bid-cost markup
     # First we need to convert whichever type of function we have to a piecewise linear function
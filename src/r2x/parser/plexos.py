@@ -1,8 +1,13 @@
 """Plexos parser class."""
 
 import importlib
+import os
+import threading
 from argparse import ArgumentParser
+from collections import defaultdict
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from importlib.resources import files
 from pathlib import Path, PureWindowsPath
@@ -46,11 +51,11 @@ from r2x.models.core import MinMax
 from r2x.models.costs import HydroGenerationCost, RenewableGenerationCost, ThermalGenerationCost
 from r2x.models.load import PowerLoad
 from r2x.units import ureg
-from r2x.utils import get_enum_from_string, get_pint_unit, validate_string
+from r2x.utils import get_enum_from_string, get_max_workers, get_pint_unit, is_flag_enabled, validate_string
 
 from .handler import PCMParser, csv_handler
 from .parser_helpers import (
-    construct_pwl_from_quadtratic,
+    construct_pwl_batch_from_quadratic,
     field_filter,
     prepare_ext_field,
     reconcile_timeseries,
@@ -62,6 +67,7 @@ from .plexos_utils import (
     find_xml,
     get_column_enum,
     parse_data_file,
+    time_slice_batch_handler,
     time_slice_handler,
 )
 from .polars_helpers import pl_filter_year
@@ -138,6 +144,22 @@ SIMPLE_QUERY_COLUMNS_SCHEMA = {
 }
 
 
+@dataclass(frozen=True)
+class DataFileCacheEntry:
+    """Parsed PLEXOS data file shared by every record that references it."""
+
+    column_type: DATAFILE_COLUMNS
+    data: pl.DataFrame
+    partitions: dict[str, pl.DataFrame] | None = None
+
+    @property
+    def estimated_size(self) -> int:
+        """Return the estimated size in bytes of the cached frames."""
+        if self.partitions is None:
+            return self.data.estimated_size()
+        return sum(partition.estimated_size() for partition in self.partitions.values())
+
+
 def cli_arguments(parser: ArgumentParser):
     """CLI arguments for the plugin."""
     parser.add_argument(
@@ -208,6 +230,18 @@ class PlexosParser(PCMParser):
             datetime(self.year, 1, 1), datetime(self.year + 1, 1, 1), interval="1h", eager=True, closed="left"
         ).to_frame("datetime")
 
+        # Parsed data files keyed by (resolved path, encoding, mtime). Most PLEXOS models point thousands of
+        # records to the same file, so we read, melt and classify each file only once per parse.
+        self._data_file_cache: dict[tuple[str, str, float], DataFileCacheEntry] = {}
+        self._data_file_cache_stats = {"hits": 0, "misses": 0}
+        self._data_file_cache_lock = threading.Lock()
+        self._data_file_locks: dict[tuple[str, str, float], threading.Lock] = {}
+
+        # Properties parsed ahead of the component construction when the staged build is enabled.
+        self._staged_properties: dict[str, dict[str, tuple[dict[str, Any], set[str]]]] = {}
+        self._generator_fuel_pmtypes: tuple[dict[str, str], dict[str, dict[str, Any]]] | None = None
+        # Quadratic heat rate curves that are converted to piecewise linear after creating the generators.
+        self._quadratic_value_curves: list[tuple[InputOutputCurve, MinMax]] = []
         return
 
     def build_system(self) -> System:
@@ -217,6 +251,14 @@ class PlexosParser(PCMParser):
         # If we decide to change the engine for handling the data we can do it here.
         object_data = self._plexos_table_data()
         self.plexos_data = self._polarize_data(object_data=object_data)
+        self._build_property_index()
+        self._build_object_id_index()
+        self._build_membership_index()
+
+        # Parse the properties of the independent classes concurrently. The construction of the components
+        # below stays sequential, so the system is identical to the one created without the flag.
+        if is_flag_enabled(parallel_flag := self.config.feature_flags.get("plexos-parallel-build")):
+            self._stage_property_data(max_workers=get_max_workers(parallel_flag))
 
         # Construct the network
         self._construct_load_zones()
@@ -237,8 +279,72 @@ class PlexosParser(PCMParser):
         self._add_battery_reserves()
 
         self._construct_load_profiles()
+        self._clear_data_file_cache()
+        self._staged_properties.clear()
+        self._generator_fuel_pmtypes = None
         return self.system
 
+    def _stage_property_data(self, max_workers: int | None = None) -> None:
+        """Parse the properties of every independent class using a thread pool.
+
+        Each class frame is split into chunks of objects that are parsed on their own, and the chunks are
+        merged back in the original object order. The results are consumed by the `_construct_*` methods
+        through `_get_parsed_properties`. Everything that touches the SQLite database runs on the calling
+        thread, the workers only read the property index and the data files.
+
+        Parameters
+        ----------
+        max_workers : int | None
+            Number of worker threads. Uses the `ThreadPoolExecutor` default if None.
+        """
+        system_generators = self._get_class_data(ClassEnum.Generator)
+        _, generator_fuel_pmtypes = self._get_generator_fuel_pmtypes(system_generators)
+        class_frames = {
+            ClassEnum.Fuel.value: self._get_class_data(ClassEnum.Fuel).with_columns(
+                property_unit=pl.lit("$/MMBtu")
+            ),
+            ClassEnum.Node.value: self._get_class_data(ClassEnum.Node),
+            ClassEnum.Reserve.value: self._get_class_data(ClassEnum.Reserve),
+            ClassEnum.Generator.value: system_generators.filter(
+                pl.col("name").is_in(list(generator_fuel_pmtypes))
+            ),
+            ClassEnum.Battery.value: self._get_class_data(ClassEnum.Battery),
+            ClassEnum.Region.value: self._get_class_data(ClassEnum.Region),
+        }
+
+        # Same default as `ThreadPoolExecutor`. We use one chunk per worker for each class.
+        n_chunks = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=n_chunks, thread_name_prefix="plexos-parser") as executor:
+            futures = {}
+            for class_name, class_data in class_frames.items():
+                names = class_data["name"].unique(maintain_order=True)
+                chunk_size = max(1, -(-len(names) // n_chunks))
+                futures[class_name] = [
+                    executor.submit(
+                        self._parse_property_frame,
+                        class_data.filter(pl.col("name").is_in(names.slice(offset, chunk_size))),
+                    )
+                    for offset in range(0, len(names), chunk_size)
+                ]
+            for class_name, class_futures in futures.items():
+                parsed: dict[str, tuple[dict[str, Any], set[str]]] = {}
+                for future in class_futures:
+                    parsed.update(future.result())
+                self._staged_properties[class_name] = parsed
+        logger.debug(
+            "Staged properties of {} objects using {} workers",
+            sum(len(parsed) for parsed in self._staged_properties.values()),
+            n_chunks,
+        )
+
+    def _get_parsed_properties(
+        self, class_name: ClassEnum, data: pl.DataFrame
+    ) -> dict[str, tuple[dict[str, Any], set[str]]]:
+        """Return the staged properties of a class or parse them from the given frame."""
+        if (parsed := self._staged_properties.pop(class_name.value, None)) is not None:
+            return parsed
+        return self._parse_property_frame(data)
+
     def _collect_horizon_data(self, model_name: str) -> dict[str, float]:
         """Collect horizon data (Date From/To) from Plexos database."""
         horizon_query = f"""
@@ -270,21 +376,12 @@ class PlexosParser(PCMParser):
 
     def _get_fuel_prices(self):
         logger.debug("Creating fuel representation")
-        system_fuels = (pl.col("child_class_name") == ClassEnum.Fuel.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-
-        fuels = self._get_model_data(system_fuels)
+        fuels = self._get_class_data(ClassEnum.Fuel)
         fuels.write_csv("fuels.csv")
+        fuels = fuels.with_columns(property_unit=pl.lit("$/MMBtu"))
         fuel_prices = {}
-        for fuel_name, fuel_data in fuels.group_by("name"):
-            fuel_name = fuel_name[0]
-            property_records = fuel_data.to_dicts()
-
-            for property in property_records:
-                property.update({"property_unit": "$/MMBtu"})
-
-            mapped_records, multi_band_records = self._parse_property_data(property_records)
+        parsed_fuels = self._get_parsed_properties(ClassEnum.Fuel, fuels)
+        for fuel_name, (mapped_records, multi_band_records) in parsed_fuels.items():
             if multi_band_records:
                 logger.warning("Some properties have multiple bands.")
             mapped_records["name"] = fuel_name
@@ -299,10 +396,7 @@ class PlexosParser(PCMParser):
         of doing it.
         """
         logger.info("Creating load zone representation")
-        system_regions = (pl.col("child_class_name") == ClassEnum.Region.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-        regions = self._get_model_data(system_regions)
+        regions = self._get_class_data(ClassEnum.Region)
 
         region_pivot = regions.pivot(
             index=DEFAULT_INDEX,
@@ -318,29 +412,21 @@ class PlexosParser(PCMParser):
 
     def _construct_buses(self, default_model=ACBus) -> None:
         logger.info("Creating buses representation")
-        system_buses = (pl.col("child_class_name") == ClassEnum.Node.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-        region_buses = (pl.col("child_class_name") == ClassEnum.Region.value) & (
-            pl.col("parent_class_name") == ClassEnum.Node.value
-        )
-        system_buses = self._get_model_data(system_buses)
-        buses_region = self._get_model_data(region_buses)
-        for idx, (bus_name, bus_data) in enumerate(system_buses.group_by("name")):
+        system_buses = self._get_class_data(ClassEnum.Node)
+        parsed_buses = self._get_parsed_properties(ClassEnum.Node, system_buses)
+        for idx, (bus_name, _) in enumerate(system_buses.group_by("name")):
             bus_name = bus_name[0]
             logger.trace("Parsing bus = {}", bus_name)
 
-            property_records = bus_data.to_dicts()
-            mapped_records, _ = self._parse_property_data(property_records)
+            mapped_records, _ = parsed_buses[bus_name]
             mapped_records["name"] = bus_name
-            # mapped_records, _ = self._parse_property_data(property_records)
 
             valid_fields, ext_data = field_filter(mapped_records, default_model.model_fields)
 
             # Get region from buses region memberships
-            region_name = buses_region.filter(pl.col("parent_object_id") == bus_data["object_id"].unique())[
-                "name"
-            ].item()
+            (region_name,) = self._get_membership_children(
+                bus_name, ClassEnum.Node, ClassEnum.Region, CollectionEnum.Region
+            )
 
             valid_fields["load_zone"] = self.system.get_component(LoadZone, name=region_name)
 
@@ -385,16 +471,11 @@ class PlexosParser(PCMParser):
     def _construct_reserves(self, default_model=Reserve):
         logger.info("Creating reserve representation")
 
-        system_reserves = self._get_model_data(
-            (pl.col("child_class_name") == ClassEnum.Reserve.name)
-            & (pl.col("parent_class_name") == ClassEnum.System.name)
-        )
+        system_reserves = self._get_class_data(ClassEnum.Reserve)
 
-        for reserve_name, reserve_data in system_reserves.group_by("name"):
-            reserve_name = reserve_name[0]
+        parsed_reserves = self._get_parsed_properties(ClassEnum.Reserve, system_reserves)
+        for reserve_name, (mapped_records, _) in parsed_reserves.items():
             logger.trace("Parsing reserve = {}", reserve_name)
-            property_records = reserve_data.to_dicts()
-            mapped_records, _ = self._parse_property_data(property_records)
             mapped_records["name"] = reserve_name
             reserve_type = validate_string(mapped_records.pop("Type", "default"))
             plexos_reserve_map = self.input_config.defaults["reserve_types"].get(
@@ -426,10 +507,7 @@ class PlexosParser(PCMParser):
 
     def _construct_branches(self, default_model=MonitoredLine):
         logger.info("Creating lines")
-        system_lines = (pl.col("child_class_name") == ClassEnum.Line.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-        system_lines = self._get_model_data(system_lines)
+        system_lines = self._get_class_data(ClassEnum.Line)
         lines_pivot = system_lines.pivot(
             index=DEFAULT_INDEX,
             on="property_name",
@@ -440,9 +518,6 @@ class PlexosParser(PCMParser):
             logger.warning("No line objects found on the system.")
             return
 
-        lines_pivot_memberships = self.db.get_memberships(
-            *lines_pivot["name"].to_list(), object_class=ClassEnum.Line
-        )
         for line in lines_pivot.iter_rows(named=True):
             line_properties_mapped = {self.property_map.get(key, key): value for key, value in line.items()}
             line_properties_mapped["rating"] = line_properties_mapped.get("max_power_flow", 0.0)
@@ -455,25 +530,13 @@ class PlexosParser(PCMParser):
 
             valid_fields, ext_data = field_filter(line_properties_mapped, default_model.model_fields)
 
-            from_bus_name = next(
-                membership
-                for membership in lines_pivot_memberships
-                if (
-                    membership[2] == line["name"]
-                    and membership[5] == ClassEnum.Line.name
-                    and membership[6].replace(" ", "") == CollectionEnum.NodeFrom.name
-                )
-            )[3]
+            from_bus_name = self._get_membership_children(
+                line["name"], ClassEnum.Line, ClassEnum.Node, CollectionEnum.NodeFrom
+            )[0]
             from_bus = self.system.get_component(ACBus, from_bus_name)
-            to_bus_name = next(
-                membership
-                for membership in lines_pivot_memberships
-                if (
-                    membership[2] == line["name"]
-                    and membership[5] == ClassEnum.Line.name
-                    and membership[6].replace(" ", "") == CollectionEnum.NodeTo.name
-                )
-            )[3]
+            to_bus_name = self._get_membership_children(
+                line["name"], ClassEnum.Line, ClassEnum.Node, CollectionEnum.NodeTo
+            )[0]
             to_bus = self.system.get_component(ACBus, to_bus_name)
             valid_fields["from_bus"] = from_bus
             valid_fields["to_bus"] = to_bus
@@ -484,10 +547,7 @@ class PlexosParser(PCMParser):
 
     def _construct_transformers(self, default_model=Transformer2W):
         logger.info("Creating transformers")
-        system_transformers = (pl.col("child_class_name") == ClassEnum.Transformer.value) & (
-            pl.col("parent_class_name") == ClassEnum.System.value
-        )
-        system_transformers = self._get_model_data(system_transformers)
+        system_transformers = self._get_class_data(ClassEnum.Transformer)
         transformer_pivot = system_transformers.pivot(
             index=DEFAULT_INDEX,
             on="property_name",
@@ -498,9 +558,6 @@ class PlexosParser(PCMParser):
             logger.warning("No transformer objects found on the system.")
             return
 
-        lines_pivot_memberships = self.db.get_memberships(
-            *transformer_pivot["name"].to_list(), object_class=ClassEnum.Transformer
-        )
         for transformer in transformer_pivot.iter_rows(named=True):
             transformer_properties_mapped = {
                 self.property_map.get(key, key): value for key, value in transformer.items()
@@ -521,25 +578,13 @@ class PlexosParser(PCMParser):
 
             valid_fields, ext_data = field_filter(transformer_properties_mapped, default_model.model_fields)
 
-            from_bus_name = next(
-                membership
-                for membership in lines_pivot_memberships
-                if (
-                    membership[2] == transformer["name"]
-                    and membership[5] == ClassEnum.Transformer.name
-                    and membership[6].replace(" ", "") == CollectionEnum.NodeFrom.name
-                )
-            )[3]
+            from_bus_name = self._get_membership_children(
+                transformer["name"], ClassEnum.Transformer, ClassEnum.Node, CollectionEnum.NodeFrom
+            )[0]
             from_bus = self.system.get_component(ACBus, from_bus_name)
-            to_bus_name = next(
-                membership
-                for membership in lines_pivot_memberships
-                if (
-                    membership[2] == transformer["name"]
-                    and membership[5] == ClassEnum.Transformer.name
-                    and membership[6].replace(" ", "") == CollectionEnum.NodeTo.name
-                )
-            )[3]
+            to_bus_name = self._get_membership_children(
+                transformer["name"], ClassEnum.Transformer, ClassEnum.Node, CollectionEnum.NodeTo
+            )[0]
             to_bus = self.system.get_component(ACBus, to_bus_name)
             valid_fields["from_bus"] = from_bus
             valid_fields["to_bus"] = to_bus
@@ -609,19 +654,16 @@ class PlexosParser(PCMParser):
                     return model
         return ""
 
-    def _construct_generators(self):  # noqa: C901
-        """Create Plexos generator objects."""
-        logger.info("Creating generator objects")
+    def _get_generator_fuel_pmtypes(
+        self, system_generators: pl.DataFrame
+    ) -> tuple[dict[str, str], dict[str, dict[str, Any]]]:
+        """Return the fuel of each generator and the fuel and prime mover type of the mappable ones.
 
-        # Filter only generator objects that belong to the system
-        # NOTE: Polars 1.1.0 can not make a comparisson between a Enum and a string column. If we convert the
-        # Enum to string it works, but we might be able to change this in a near future if polars supports it.
-        system_generators_filter = (pl.col("child_class_name") == str(ClassEnum.Generator)) & (
-            pl.col("parent_class_name") == str(ClassEnum.System)
-        )
-        system_generators = self._get_model_data(system_generators_filter)
-        if self.config.feature_flags.get("plexos-csv", None):
-            system_generators.write_csv("generators.csv")
+        The result is computed once per build since it is needed by both the staged build and
+        `_construct_generators`.
+        """
+        if self._generator_fuel_pmtypes is not None:
+            return self._generator_fuel_pmtypes
 
         # NOTE: The best way to identify the type of generator on Plexos is by reading the fuel
         fuel_query = f"""
@@ -641,9 +683,9 @@ class PlexosParser(PCMParser):
         generator_fuel = self.db.query(fuel_query)
         generator_fuel_map = {key: value for key, value in generator_fuel}
 
-        fuel_prices = self._get_fuel_prices()
-
-        # Iterate over properties to create generator object
+        # Find the fuel and prime mover type first, so we only parse the properties of generators that we can
+        # map to a model.
+        generator_fuel_pmtypes = {}
         for generator_name, generator_data in system_generators.group_by("name"):
             generator_name = generator_name[0]
 
@@ -662,15 +704,34 @@ class PlexosParser(PCMParser):
                 msg = "Fuel mapping not found for {} with fuel_type={}"
                 logger.warning(msg, generator_name, fuel_name)
                 continue
+            generator_fuel_pmtypes[generator_name] = fuel_pmtype
+
+        self._generator_fuel_pmtypes = (generator_fuel_map, generator_fuel_pmtypes)
+        return self._generator_fuel_pmtypes
 
+    def _construct_generators(self):
+        """Create Plexos generator objects."""
+        logger.info("Creating generator objects")
+
+        # Filter only generator objects that belong to the system
+        system_generators = self._get_class_data(ClassEnum.Generator)
+        if self.config.feature_flags.get("plexos-csv", None):
+            system_generators.write_csv("generators.csv")
+
+        fuel_prices = self._get_fuel_prices()
+        generator_fuel_map, generator_fuel_pmtypes = self._get_generator_fuel_pmtypes(system_generators)
+        parsed_generators = self._get_parsed_properties(
+            ClassEnum.Generator,
+            system_generators.filter(pl.col("name").is_in(list(generator_fuel_pmtypes))),
+        )
+
+        # Iterate over properties to create generator object
+        for generator_name, fuel_pmtype in generator_fuel_pmtypes.items():
             # We assume that if we find the fuel, there is a model_map
             model_map = self._get_model_type(fuel_pmtype)
             model_map = getattr(R2X_MODELS, model_map)
 
-            # property_records = generator_data[DEFAULT_PROPERTY_COLUMNS].to_dicts()
-            property_records = generator_data.to_dicts()
-
-            mapped_records, multi_band_records = self._parse_property_data(property_records)
+            mapped_records, multi_band_records = parsed_generators[generator_name]
             mapped_records["name"] = generator_name
 
             # if multi_band_records:
@@ -729,77 +790,77 @@ class PlexosParser(PCMParser):
                 for ts_name, ts in ts_fields.items():
                     ts.variable_name = ts_name
                     self.system.add_time_series(ts, generator, **ts_dict)
+
+        self._fit_quadratic_value_curves()
         return
 
+    def _fit_quadratic_value_curves(self) -> None:
+        """Replace the quadratic heat rate curves by piecewise linear curves fitted in a single batch."""
+        if not self._quadratic_value_curves:
+            return
+        value_curves, active_power_limits = zip(*self._quadratic_value_curves, strict=True)
+        pwl_functions = construct_pwl_batch_from_quadratic(
+            [value_curve.function_data for value_curve in value_curves],
+            x_min=[limits.min.magnitude for limits in active_power_limits],
+            x_max=[limits.max.magnitude for limits in active_power_limits],
+            num_tranches=self.config.feature_flags["quad2pwl"],
+        )
+        for value_curve, pwl_function in zip(value_curves, pwl_functions, strict=True):
+            value_curve.function_data = pwl_function
+        logger.debug("Fitted {} piecewise linear heat rate curves", len(pwl_functions))
+        self._quadratic_value_curves.clear()
+
     def _add_buses_to_generators(self):
         # Add buses to generators
-        generators = [generator["name"] for generator in self.system.to_records(Generator)]
-        generator_memberships = self.db.get_memberships(
-            *generators,
-            object_class=ClassEnum.Generator,
-            collection=CollectionEnum.Nodes,
-        )
         for generator in self.system.get_components(Generator):
-            buses = [membership for membership in generator_memberships if membership[2] == generator.name]
-            if buses:
-                for bus in buses:
-                    try:
-                        bus_object = self.system.get_component(ACBus, name=bus[3])
-                    except ISNotStored:
-                        logger.warning(
-                            "Skipping membership for generator:{} since reserve {} is not stored",
-                            generator.name,
-                            buses[3],
-                        )
-                        continue
-                    generator.bus = bus_object
+            buses = self._get_membership_children(
+                generator.name, ClassEnum.Generator, ClassEnum.Node, CollectionEnum.Nodes
+            )
+            for bus in buses:
+                try:
+                    bus_object = self.system.get_component(ACBus, name=bus)
+                except ISNotStored:
+                    logger.warning(
+                        "Skipping membership for generator:{} since bus {} is not stored",
+                        generator.name,
+                        bus,
+                    )
+                    continue
+                generator.bus = bus_object
         return
 
     def _add_generator_reserves(self):
         reserve_map = self.system.get_component(ReserveMap, name="contributing_generators")
-        generators = [generator["name"] for generator in self.system.to_records(Generator)]
-        generator_memberships = self.db.get_memberships(
-            *generators,
-            object_class=ClassEnum.Generator,
-            parent_class=ClassEnum.Reserve,
-            collection=CollectionEnum.Generators,
-        )
         for generator in self.system.get_components(Generator):
-            reserves = [membership for membership in generator_memberships if membership[3] == generator.name]
-            if reserves:
-                # NOTE: This would get replaced if we have a method on infrasys
-                # that check if something exists on the system
-                for reserve in reserves:
-                    try:
-                        reserve_object = self.system.get_component(Reserve, name=reserve[2])
-                    except ISNotStored:
-                        logger.warning(
-                            "Skipping membership for generator:{} since reserve {} is not stored",
-                            generator.name,
-                            reserve[2],
-                        )
-                        continue
-                    reserve_map.mapping[reserve_object.name].append(generator.name)
+            reserves = self._get_membership_parents(
+                generator.name, ClassEnum.Generator, ClassEnum.Reserve, CollectionEnum.Generators
+            )
+            # NOTE: This would get replaced if we have a method on infrasys
+            # that check if something exists on the system
+            for reserve in reserves:
+                try:
+                    reserve_object = self.system.get_component(Reserve, name=reserve)
+                except ISNotStored:
+                    logger.warning(
+                        "Skipping membership for generator:{} since reserve {} is not stored",
+                        generator.name,
+                        reserve,
+                    )
+                    continue
+                reserve_map.mapping[reserve_object.name].append(generator.name)
         return
 
     def _construct_batteries(self):
         logger.info("Creating battery objects")
-        system_batteries = self._get_model_data(
-            (pl.col("child_class_name") == ClassEnum.Battery.name)
-            & (pl.col("parent_class_name") == ClassEnum.System.name)
-        )
+        system_batteries = self._get_class_data(ClassEnum.Battery)
 
         required_fields = {
             key: value for key, value in GenericBattery.model_fields.items() if value.is_required()
         }
 
-        for battery_name, battery_data in system_batteries.group_by("name"):
-            battery_name = battery_name[0]
+        parsed_batteries = self._get_parsed_properties(ClassEnum.Battery, system_batteries)
+        for battery_name, (mapped_records, _) in parsed_batteries.items():
             logger.trace("Parsing battery = {}", battery_name)
-
-            property_records = battery_data.to_dicts()
-
-            mapped_records, _ = self._parse_property_data(property_records)
             mapped_records["name"] = battery_name
             mapped_records["prime_mover_type"] = PrimeMoversType.BA
 
@@ -830,25 +891,21 @@ class PlexosParser(PCMParser):
             msg = "No battery objects found on the system. Skipping adding membership to buses"
             logger.warning(msg)
             return
-        generator_memberships = self.db.get_memberships(
-            *batteries,
-            object_class=ClassEnum.Battery,
-            collection=CollectionEnum.Nodes,
-        )
         for component in self.system.get_components(GenericBattery):
-            buses = [membership for membership in generator_memberships if membership[2] == component.name]
-            if buses:
-                for bus in buses:
-                    try:
-                        bus_object = self.system.get_component(ACBus, name=bus[3])
-                    except ISNotStored:
-                        logger.warning(
-                            "Skipping membership for battery:{} since bus {} is not stored",
-                            component.name,
-                            buses[3],
-                        )
-                        continue
-                    component.bus = bus_object
+            buses = self._get_membership_children(
+                component.name, ClassEnum.Battery, ClassEnum.Node, CollectionEnum.Nodes
+            )
+            for bus in buses:
+                try:
+                    bus_object = self.system.get_component(ACBus, name=bus)
+                except ISNotStored:
+                    logger.warning(
+                        "Skipping membership for battery:{} since bus {} is not stored",
+                        component.name,
+                        bus,
+                    )
+                    continue
+                component.bus = bus_object
         return
 
     def _add_battery_reserves(self):
@@ -858,38 +915,29 @@ class PlexosParser(PCMParser):
             msg = "No battery objects found on the system. Skipping adding reserve memberships"
             logger.warning(msg)
             return
-        generator_memberships = self.db.get_memberships(
-            *batteries,
-            object_class=ClassEnum.Battery,
-            parent_class=ClassEnum.Reserve,
-            collection=CollectionEnum.Batteries,
-        )
-
         for battery in self.system.get_components(GenericBattery):
-            reserves = [membership for membership in generator_memberships if membership[3] == battery.name]
-            if reserves:
-                # NOTE: This would get replaced if we have a method on infrasys
-                # that check if something exists on the system
-                for reserve in reserves:
-                    try:
-                        reserve_object = self.system.get_component(Reserve, name=reserve[2])
-                    except ISNotStored:
-                        logger.warning(
-                            "Skipping membership for generator:{} since reserve {} is not stored",
-                            battery.name,
-                            reserve[2],
-                        )
-                        continue
-                    reserve_map.mapping[reserve_object.name].append(battery.name)
+            reserves = self._get_membership_parents(
+                battery.name, ClassEnum.Battery, ClassEnum.Reserve, CollectionEnum.Batteries
+            )
+            # NOTE: This would get replaced if we have a method on infrasys
+            # that check if something exists on the system
+            for reserve in reserves:
+                try:
+                    reserve_object = self.system.get_component(Reserve, name=reserve)
+                except ISNotStored:
+                    logger.warning(
+                        "Skipping membership for generator:{} since reserve {} is not stored",
+                        battery.name,
+                        reserve,
+                    )
+                    continue
+                reserve_map.mapping[reserve_object.name].append(battery.name)
         return
 
     def _construct_interfaces(self, default_model=TransmissionInterface):
         """Construct Transmission Interface and Transmission Interface Map."""
         logger.info("Creating transmission interfaces")
-        system_interfaces_mask = (pl.col("child_class_name") == ClassEnum.Interface.name) & (
-            pl.col("parent_class_name") == ClassEnum.System.name
-        )
-        system_interfaces = self._get_model_data(system_interfaces_mask)
+        system_interfaces = self._get_class_data(ClassEnum.Interface)
         interfaces = system_interfaces.pivot(
             index=DEFAULT_INDEX,
             on="property_name",
@@ -931,26 +979,20 @@ class PlexosParser(PCMParser):
         lines = [line["name"] for line in self.system.to_records(MonitoredLine)]
         if not lines:
             return
-        lines_memberships = self.db.get_memberships(
-            *lines,
-            object_class=ClassEnum.Line,
-            parent_class=ClassEnum.Interface,
-            collection=CollectionEnum.Lines,
-        )
         for line in self.system.get_components(MonitoredLine):
-            interface = next(
-                (membership for membership in lines_memberships if membership[3] == line.name), None
+            interfaces = self._get_membership_parents(
+                line.name, ClassEnum.Line, ClassEnum.Interface, CollectionEnum.Lines
             )
-            if interface:
+            if interfaces:
                 # NOTE: This would get replaced if we have a method on infrasys
                 # that check if something exists on the system
                 try:
-                    interface_object = self.system.get_component(TransmissionInterface, name=interface[2])
+                    interface_object = self.system.get_component(TransmissionInterface, name=interfaces[0])
                 except ISNotStored:
                     logger.warning(
                         "Skipping membership for line:{} since interface {} is not stored",
                         line.name,
-                        interface[2],
+                        interfaces[0],
                     )
                     continue
                 tx_interface_map.mapping[interface_object.name].append(line.label)
@@ -1017,8 +1059,9 @@ class PlexosParser(PCMParser):
                 constant_term=heat_rate_base.magnitude,
             )
             if self.config.feature_flags.get("quad2pwl", None):
-                n_tranches = self.config.feature_flags.get("quad2pwl", None)
-                fn = construct_pwl_from_quadtratic(fn, record, n_tranches)
+                # The curves of every generator are fitted at once by `_fit_quadratic_value_curves`.
+                vc = InputOutputCurve(function_data=fn)
+                self._quadratic_value_curves.append((vc, record["active_power_limits"]))
         elif not heat_rate_incr2 and heat_rate_incr:
             fn = LinearFunctionData(
                 proportional_term=heat_rate_incr.magnitude, constant_term=heat_rate_base.magnitude
@@ -1268,20 +1311,148 @@ class PlexosParser(PCMParser):
         self.id_to_tag_id = dict(zip(object_map["object_id"], object_map["tag_datafile_object_id"]))
         return data
 
+    def _build_property_index(self) -> None:
+        """Resolve the scenario, date and base case logic once and index the result.
+
+        The resolution is done per (child_class_name, parent_class_name) partition, which is the same scope
+        that the class filters of `_get_model_data` use, so each partition returns the same rows as before.
+        Class lookups return the resolved partition and nested object lookups gather the rows of a single
+        `object_id` using a precomputed index.
+        """
+        partitions = self.plexos_data.partition_by(
+            ["child_class_name", "parent_class_name"], maintain_order=True, as_dict=True
+        )
+        self._class_index: dict[tuple[str, str], pl.DataFrame] = {
+            class_key: self._resolve_model_data(partition) for class_key, partition in partitions.items()
+        }
+        self._empty_model_data = self._resolve_model_data(self.plexos_data.clear())
+        self.model_data = (
+            pl.concat(self._class_index.values(), rechunk=False)
+            if self._class_index
+            else self._empty_model_data
+        )
+
+        object_ids = self.model_data["object_id"].to_numpy()
+        row_order = np.argsort(object_ids, kind="stable")
+        unique_ids, offsets, counts = np.unique(object_ids[row_order], return_index=True, return_counts=True)
+        self._object_index: dict[int, np.ndarray] = {
+            int(object_id): row_order[offset : offset + count]
+            for object_id, offset, count in zip(unique_ids, offsets, counts)
+        }
+        logger.debug(
+            "Indexed {} property rows into {} class partitions and {} objects",
+            self.model_data.height,
+            len(self._class_index),
+            len(self._object_index),
+        )
+        return
+
+    def _build_object_id_index(self) -> None:
+        """Create the lookup of object ids by class and lower-cased object name.
+
+        Object names are case insensitive on the database. Names that are repeated within a class are kept
+        apart so `_get_object_id` raises the same error as the database without querying it, which keeps the
+        lookup safe to call from the staged build workers.
+        """
+        object_query = """
+        SELECT
+            t_class.name AS class_name,
+            t_object.name AS object_name,
+            t_object.object_id AS object_id
+        FROM
+            t_object
+            LEFT JOIN t_class ON t_object.class_id = t_class.class_id
+        """
+        object_ids: dict[tuple[str, str], int | None] = {}
+        for class_name, object_name, object_id in self.db.query(object_query):
+            key = (class_name, object_name.lower())
+            object_ids[key] = None if key in object_ids else object_id
+        self._object_ids = {key: object_id for key, object_id in object_ids.items() if object_id is not None}
+        self._duplicate_object_names = {key for key, object_id in object_ids.items() if object_id is None}
+
+    def _get_object_id(self, object_name: str, class_name: ClassEnum) -> int:
+        """Return the id of an object without querying the database."""
+        key = (class_name.value, object_name.lower())
+        if (object_id := self._object_ids.get(key)) is not None:
+            return object_id
+        if key in self._duplicate_object_names:
+            msg = f"Multiple ids returned for {object_name} and {class_name}. Try passing addtional filters"
+            raise ValueError(msg)
+        msg = f"No object found with the requested {object_name=} and {class_name=}"
+        raise KeyError(msg)
+
+    def _build_membership_index(self) -> None:
+        """Index the memberships of every object by parent and by child name.
+
+        Both indices are keyed by `(parent_class, child_class, collection, object_name)` and store the names
+        of the related objects in database order. Collection names are stored without spaces to match
+        `CollectionEnum` (e.g., `Node From` is stored as `NodeFrom`). System memberships are excluded.
+        """
+        membership_query = f"""
+        SELECT
+            parent_class.name AS parent_class_name,
+            child_class.name AS child_class_name,
+            collections.name AS collection_name,
+            parent_object.name AS parent_object_name,
+            child_object.name AS child_object_name
+        FROM
+            t_membership AS mem
+            INNER JOIN t_object AS parent_object ON mem.parent_object_id = parent_object.object_id
+            INNER JOIN t_object AS child_object ON mem.child_object_id = child_object.object_id
+            LEFT JOIN t_class AS parent_class ON mem.parent_class_id = parent_class.class_id
+            LEFT JOIN t_class AS child_class ON mem.child_class_id = child_class.class_id
+            LEFT JOIN t_collection AS collections ON mem.collection_id = collections.collection_id
+        WHERE
+            parent_class.name <> '{ClassEnum.System}'
+        """
+        self._memberships_by_parent: dict[tuple[str, str, str, str], list[str]] = defaultdict(list)
+        self._memberships_by_child: dict[tuple[str, str, str, str], list[str]] = defaultdict(list)
+        memberships = self.db.query(membership_query)
+        for parent_class, child_class, collection, parent_name, child_name in memberships:
+            key = (parent_class, child_class, (collection or "").replace(" ", ""))
+            self._memberships_by_parent[(*key, parent_name)].append(child_name)
+            self._memberships_by_child[(*key, child_name)].append(parent_name)
+        logger.debug("Indexed {} memberships", len(memberships))
+
+    def _get_membership_children(
+        self, parent_name: str, parent_class: ClassEnum, child_class: ClassEnum, collection: CollectionEnum
+    ) -> list[str]:
+        """Return the names of the child objects of a parent on a collection."""
+        key = (parent_class.value, child_class.value, collection.value, parent_name)
+        return self._memberships_by_parent.get(key, [])
+
+    def _get_membership_parents(
+        self, child_name: str, child_class: ClassEnum, parent_class: ClassEnum, collection: CollectionEnum
+    ) -> list[str]:
+        """Return the names of the parent objects of a child on a collection."""
+        key = (parent_class.value, child_class.value, collection.value, child_name)
+        return self._memberships_by_child.get(key, [])
+
+    def _get_class_data(
+        self, child_class: ClassEnum, parent_class: ClassEnum = ClassEnum.System
+    ) -> pl.DataFrame:
+        """Return the resolved model data for a pair of child and parent classes."""
+        assert hasattr(self, "_class_index"), "Property index not built yet"
+        return self._class_index.get((child_class.value, parent_class.value), self._empty_model_data)
+
     def _get_model_data(self, data_filter) -> pl.DataFrame:
         """Filter plexos data for a given class and all scenarios in a model."""
+        return self._resolve_model_data(self.plexos_data.filter(data_filter))
+
+    def _resolve_model_data(self, data: pl.DataFrame) -> pl.DataFrame:
+        """Apply the scenario, base case and date overrides to a subset of the plexos data."""
         assert isinstance(self.year, int)
         scenario_specific_data = None
         scenario_filter = None
         if getattr(self, "scenarios", None):
             scenario_filter = pl.col("scenario").is_in(self.scenarios)
-            scenario_specific_data = self.plexos_data.filter(data_filter & scenario_filter)
+            scenario_specific_data = data.filter(scenario_filter)
             scenario_specific_data = filter_property_dates(scenario_specific_data, self.year)
 
         base_case_filter = pl.col("scenario").is_null()
         # Default is to parse data normally if there is not scenario. If scenario exist modify the filter.
         if scenario_specific_data is None:
-            system_data = self.plexos_data.filter(data_filter & base_case_filter)
+            system_data = data.filter(base_case_filter)
             system_data = filter_property_dates(system_data, self.year)
         else:
             # include both scenario specific and basecase data
@@ -1293,7 +1464,7 @@ class PlexosParser(PCMParser):
             base_case_filter = base_case_filter & (
                 ~combined_key_base.is_in(combined_key_scenario) | pl.col("property_name").is_null()
             )
-            base_case_data = self.plexos_data.filter(data_filter & base_case_filter)
+            base_case_data = data.filter(base_case_filter)
             base_case_data = filter_property_dates(base_case_data, self.year)
 
             system_data = pl.concat([scenario_specific_data, base_case_data])
@@ -1311,14 +1482,9 @@ class PlexosParser(PCMParser):
 
     def _construct_load_profiles(self):
         logger.info("Creating load profile time series")
-        system_regions = (pl.col("child_class_name") == ClassEnum.Region.name) & (
-            pl.col("parent_class_name") == ClassEnum.System.name
-        )
-        regions = self._get_model_data(system_regions)
-        for region, region_data in regions.group_by("name"):
-            property_records = region_data.to_dicts()
-            mapped_records, _ = self._parse_property_data(property_records)
-
+        regions = self._get_class_data(ClassEnum.Region)
+        parsed_regions = self._get_parsed_properties(ClassEnum.Region, regions)
+        for region_name, (mapped_records, _) in parsed_regions.items():
             if max_active_power := mapped_records.get("max_active_power"):
                 max_load = (
                     np.nanmax(max_active_power.data)
@@ -1327,14 +1493,11 @@ class PlexosParser(PCMParser):
                 )
             else:
                 continue
-            bus_region_membership = self.db.get_memberships(
-                region[0],
-                object_class=ClassEnum.Region,
-                parent_class=ClassEnum.Node,
-                collection=CollectionEnum.Region,
+            region_buses = self._get_membership_parents(
+                region_name, ClassEnum.Region, ClassEnum.Node, CollectionEnum.Region
             )
-            for bus in bus_region_membership:
-                bus = self.system.get_component(ACBus, name=bus[2])
+            for bus_name in region_buses:
+                bus = self.system.get_component(ACBus, name=bus_name)
                 load = PowerLoad(name=f"{bus.name}", bus=bus, max_active_power=max_load)
                 self.system.add_component(load)
                 ts_dict = {"solve_year": self.year}
@@ -1362,14 +1525,11 @@ class PlexosParser(PCMParser):
         else:
             path = self.run_folder / Path(fpath_str)
 
-        data_file = csv_handler(path, csv_file_encoding=csv_file_encoding)
-
-        column_type = get_column_enum(data_file.columns)
-        if column_type is None:
-            msg = f"Time series format {data_file.columns=} not yet supported."
-            raise NotImplementedError(msg)
-
-        parsed_file = self._parse_data_file(data_file, record_name, property_name, column_type, variable_name)
+        cache_entry = self._get_data_file(path, csv_file_encoding=csv_file_encoding)
+        if cache_entry is None:
+            return
+        column_type = cache_entry.column_type
+        parsed_file = self._slice_data_file(cache_entry, record_name, property_name, variable_name)
 
         if parsed_file.is_empty():
             msg = "Could not find record_name = {} or property_name = {} in fpath = {}. Check data file."
@@ -1420,29 +1580,110 @@ class PlexosParser(PCMParser):
             columns_to_check.append("month")
         return columns_to_check
 
-    def _parse_data_file(
-        self,
-        data_file,
-        record_name: str,
-        property_name: str,
-        column_type: DATAFILE_COLUMNS,
-        variable_name: str | None = None,
-    ) -> pl.DataFrame:
-        """Parse and filter data based on record and property names."""
+    def _get_data_file(self, path: Path, csv_file_encoding: str = "utf8") -> DataFileCacheEntry | None:
+        """Return the parsed data file from the cache, reading it on the first request.
+
+        The cached frame is already lower-cased, classified with `DATAFILE_COLUMNS`, parsed with
+        `parse_data_file` and filtered by the solve year. If the file has a `name` column, it is stored
+        partitioned by the lower-cased name so each record gets its slice with a dictionary lookup.
+
+        The cache is safe to use from the staged build workers. Each file is read by a single thread while
+        the others wait for it.
+        """
         assert isinstance(self.year, int)
-        parsed_file = parse_data_file(column_type, data_file)
+        mtime = path.stat().st_mtime if path.exists() else -1.0
+        cache_key = (str(path.resolve()), csv_file_encoding, mtime)
+        with self._data_file_cache_lock:
+            if (cache_entry := self._data_file_cache.get(cache_key)) is not None:
+                self._data_file_cache_stats["hits"] += 1
+                logger.trace("Data file cache hit for {}", path)
+                return cache_entry
+            file_lock = self._data_file_locks.setdefault(cache_key, threading.Lock())
+
+        with file_lock:
+            if (cache_entry := self._data_file_cache.get(cache_key)) is not None:
+                with self._data_file_cache_lock:
+                    self._data_file_cache_stats["hits"] += 1
+                return cache_entry
+            return self._read_data_file(path, cache_key, csv_file_encoding=csv_file_encoding)
+
+    def _read_data_file(
+        self, path: Path, cache_key: tuple[str, str, float], csv_file_encoding: str = "utf8"
+    ) -> DataFileCacheEntry | None:
+        """Read, parse and store a data file on the cache."""
+        assert isinstance(self.year, int)
+        with self._data_file_cache_lock:
+            self._data_file_cache_stats["misses"] += 1
+        data_file = csv_handler(path, csv_file_encoding=csv_file_encoding)
+        if data_file is None:
+            return None
 
+        column_type = get_column_enum(data_file.columns)
+        if column_type is None:
+            msg = f"Time series format {data_file.columns=} not yet supported."
+            raise NotImplementedError(msg)
+
+        parsed_file = parse_data_file(column_type, data_file)
         if "year" in parsed_file.columns:
             parsed_file = pl_filter_year(parsed_file, year=self.year)
 
             if parsed_file.is_empty():
                 logger.warning("No time series data specified for year filter. Year passed {}", self.year)
 
+        partitions = None
         if "name" in parsed_file.columns:
-            cols = [col.lower() for col in [record_name, property_name, variable_name] if col]
-            parsed_file = parsed_file.filter(pl.col("name").str.to_lowercase().is_in(cols))
+            partitions = {
+                key[0]: partition
+                for key, partition in parsed_file.with_row_index("row_nr")
+                .with_columns(name_key=pl.col("name").str.to_lowercase())
+                .partition_by("name_key", as_dict=True, include_key=False)
+                .items()
+            }
+            parsed_file = parsed_file.clear()
+
+        cache_entry = DataFileCacheEntry(column_type=column_type, data=parsed_file, partitions=partitions)
+        with self._data_file_cache_lock:
+            self._data_file_cache[cache_key] = cache_entry
+            held_bytes = sum(entry.estimated_size for entry in self._data_file_cache.values())
+        logger.debug(
+            "Data file cache miss for {}. Cached {} bytes ({} bytes held in total)",
+            path,
+            cache_entry.estimated_size,
+            held_bytes,
+        )
+        return cache_entry
 
-        return parsed_file
+    def _slice_data_file(
+        self,
+        cache_entry: DataFileCacheEntry,
+        record_name: str,
+        property_name: str,
+        variable_name: str | None = None,
+    ) -> pl.DataFrame:
+        """Return the rows of a cached data file that belong to a record, property or variable."""
+        if cache_entry.partitions is None:
+            return cache_entry.data
+
+        names = dict.fromkeys(col.lower() for col in [record_name, property_name, variable_name] if col)
+        slices = [cache_entry.partitions[name] for name in names if name in cache_entry.partitions]
+        if not slices:
+            return cache_entry.data
+        if len(slices) == 1:
+            return slices[0].drop("row_nr")
+        # Keep the row order of the original file when more than one name matches.
+        return pl.concat(slices).sort("row_nr").drop("row_nr")
+
+    def _clear_data_file_cache(self) -> None:
+        """Log the data file cache statistics and release the cached frames."""
+        logger.debug(
+            "Data file cache: {} hits, {} misses, {} files, {} bytes held",
+            self._data_file_cache_stats["hits"],
+            self._data_file_cache_stats["misses"],
+            len(self._data_file_cache),
+            sum(entry.estimated_size for entry in self._data_file_cache.values()),
+        )
+        self._data_file_cache.clear()
+        self._data_file_locks.clear()
 
     def _get_single_value(
         self,
@@ -1497,6 +1738,72 @@ class PlexosParser(PCMParser):
             return val_b
         return results
 
+    def _parse_property_frame(self, data: pl.DataFrame) -> dict[str, tuple[dict[str, Any], set[str]]]:
+        """Parse the properties of every object of a class frame.
+
+        Columnar equivalent of calling `_parse_property_data` for each object. Properties whose records do
+        not have text, tag_datafile, tag_variable or tag_timeslice are resolved in a single pass: property
+        names are mapped with the property map, units are parsed once per distinct unit string and the last
+        value of each property is selected per object. Only the properties that have at least one record
+        that needs data file, variable or timeslice resolution fall back to the record-by-record matcher.
+
+        Parameters
+        ----------
+        data : pl.DataFrame
+            Model data of a class as returned by `_get_class_data`.
+
+        Returns
+        -------
+        dict
+            Mapping of object name to the `(mapped_properties, multi_band_properties)` tuple returned by
+            `_parse_property_data`.
+        """
+        if data.is_empty():
+            return {}
+
+        data = data.with_columns(
+            mapped_property_name=pl.col("property_name").replace(self.property_map),
+            needs_matcher=pl.any_horizontal(
+                pl.col(column).is_not_null()
+                for column in ("text", "tag_timeslice", "tag_datafile", "tag_variable")
+            ),
+        ).with_columns(
+            needs_matcher=pl.col("needs_matcher").any().over(["name", "mapped_property_name"]),
+        )
+        simple_properties = (
+            data.filter(~pl.col("needs_matcher"))
+            .group_by(["name", "mapped_property_name"], maintain_order=True)
+            .agg(
+                pl.col("property_value").last(),
+                pl.col("property_unit").last(),
+                multi_band=pl.col("band").n_unique() > 1,
+            )
+        )
+        units = {
+            unit_str: get_pint_unit(unit_str)
+            for unit_str in simple_properties["property_unit"].unique().drop_nulls()
+            if unit_str
+        }
+
+        parsed: dict[str, tuple[dict[str, Any], set[str]]] = {
+            name: ({}, set()) for name in data["name"].unique(maintain_order=True)
+        }
+        for name, mapped_property_name, value, unit_str, multi_band in simple_properties.iter_rows():
+            mapped_properties, multi_band_properties = parsed[name]
+            mapped_properties[mapped_property_name] = self._parse_value(value, unit=units.get(unit_str))
+            if multi_band:
+                multi_band_properties.add(mapped_property_name)
+
+        matcher_data = data.filter(pl.col("needs_matcher")).drop(["mapped_property_name", "needs_matcher"])
+        if matcher_data.is_empty():
+            return parsed
+        matcher_partitions = matcher_data.partition_by("name", maintain_order=True, as_dict=True)
+        for (name,), object_data in matcher_partitions.items():
+            mapped_properties, multi_band_properties = self._parse_property_data(object_data.to_dicts())
+            parsed[name][0].update(mapped_properties)
+            parsed[name][1].update(multi_band_properties)
+        return parsed
+
     def _parse_property_data(self, record_data: list[dict[str, Any]]):
         mapped_properties = {}
         property_counts: dict[str, Any] = {}
@@ -1544,11 +1851,12 @@ class PlexosParser(PCMParser):
 
                 mapped_properties[mapped_property_name] = value
         if timeslice_properties:
+            timeslice_records = {}
             for property in timeslice_properties:
                 property_with_timeslice = property_counts[property]
                 pattern_values = []
                 for timeslice in property_with_timeslice["timeslices"]:
-                    timeslice_object_id = self.db.get_object_id(timeslice, class_name=ClassEnum.Timeslice)
+                    timeslice_object_id = self._get_object_id(timeslice, class_name=ClassEnum.Timeslice)
                     timeslice_data = self._filter_by_object_id(timeslice_object_id)
                     pattern_values.append(
                         {
@@ -1558,10 +1866,11 @@ class PlexosParser(PCMParser):
                             ],  # 1 since we only assume single band timeslices
                         }
                     )
+                timeslice_records[property] = pattern_values
+            timeslice_series = time_slice_batch_handler(timeslice_records, self.hourly_time_index)
+            for property, series in timeslice_series.items():
                 mapped_properties[property] = self._parse_value(
-                    time_slice_handler(pattern_values, self.hourly_time_index),
-                    property,
-                    unit=property_unit_map[property],
+                    series, property, unit=property_unit_map[property]
                 )
         return mapped_properties, multi_band_properties
 
@@ -1600,7 +1909,7 @@ class PlexosParser(PCMParser):
                     value=data_file_value, variable_name=mapped_property_name, unit=unit
                 )
             case {"text": str(), "text_class_name": ClassEnum.Variable}:
-                nested_object_id = self.db.get_object_id(record["text"], class_name=ClassEnum.Variable)
+                nested_object_id = self._get_object_id(record["text"], class_name=ClassEnum.Variable)
                 nested_object_data = self._get_nested_object_data(nested_object_id)
                 if isinstance(nested_object_data, str):
                     value = (
@@ -1620,9 +1929,7 @@ class PlexosParser(PCMParser):
 
             # This case covers when the variable is used to scale a property that is nested on a data file
             case {"tag_datafile": str(), "tag_variable": str()}:
-                nested_object_id = self.db.get_object_id(
-                    record["tag_variable"], class_name=ClassEnum.Variable
-                )
+                nested_object_id = self._get_object_id(record["tag_variable"], class_name=ClassEnum.Variable)
                 nested_object_data = self._get_nested_object_data(nested_object_id)
                 if isinstance(nested_object_data, str):
                     nested_object_data = self._data_file_handler(
@@ -1648,9 +1955,7 @@ class PlexosParser(PCMParser):
                     data_file_value = prop_value
                 value = self._parse_value(data_file_value, variable_name=mapped_property_name, unit=unit)
             case {"tag_variable": str()}:
-                nested_object_id = self.db.get_object_id(
-                    record["tag_variable"], class_name=ClassEnum.Variable
-                )
+                nested_object_id = self._get_object_id(record["tag_variable"], class_name=ClassEnum.Variable)
                 nested_object_data = self._get_nested_object_data(nested_object_id)
                 if isinstance(nested_object_data, str):
                     value = self._data_file_handler(
@@ -1707,8 +2012,10 @@ class PlexosParser(PCMParser):
         pl.DataFrame
             A filtered DataFrame containing only rows where the object_id matches.
         """
-        assert hasattr(self, "plexos_data"), "plexos data not processed yet"
-        return self._get_model_data(pl.col("object_id") == object_id)
+        assert hasattr(self, "_object_index"), "plexos data not processed yet"
+        if (rows := self._object_index.get(object_id)) is None:
+            return self._empty_model_data
+        return self.model_data[rows]
 
     def _get_nested_object_data(self, object_id: int) -> str | float | np.ndarray:
         assert object_id
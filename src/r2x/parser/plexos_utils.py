@@ -5,7 +5,8 @@ from datetime import datetime
 import re
 from enum import Enum
 from typing import Any
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 
@@ -335,6 +336,10 @@ def parse_ts_nymdh(data_file):
     return data_file
 
 
+# Label and largest value of each timeslice symbol.
+TIMESLICE_LIMITS = {"M": ("month", 12), "W": ("weekday", 7), "D": ("day of month", 31), "H": ("hour", 24)}
+
+
 def parse_patterns(key: str) -> list[tuple[str, list[int]]]:
     """Parse a key for time slice patterns (e.g., 'M1-3', 'H1-6') and return a list of tuples.
 
@@ -383,20 +388,144 @@ def parse_patterns(key: str) -> list[tuple[str, list[int]]]:
             end_value = int(match.group(3)) if match.group(3) else start_value
 
             # Validating ranges based on time slice type
-            if time_slice_type == "M" and not (1 <= start_value <= 12 and 1 <= end_value <= 12):
-                raise ValueError(f"Invalid month range: {start_value}-{end_value}")
-            if time_slice_type == "H" and not (1 <= start_value <= 24 and 1 <= end_value <= 24):
-                raise ValueError(f"Invalid hour range: {start_value}-{end_value}")
-            if time_slice_type == "W" and not (1 <= start_value <= 7 and 1 <= end_value <= 7):
-                raise ValueError(f"Invalid weekday range: {start_value}-{end_value}")
-            if time_slice_type == "D" and not (1 <= start_value <= 31 and 1 <= end_value <= 31):
-                raise ValueError(f"Invalid day of month range: {start_value}-{end_value}")
+            label, max_value = TIMESLICE_LIMITS[time_slice_type]
+            if not (1 <= start_value <= max_value and 1 <= end_value <= max_value):
+                raise ValueError(f"Invalid {label} range: {start_value}-{end_value}")
 
             pattern_list.append((time_slice_type, list(range(start_value, end_value + 1))))
 
     return pattern_list
 
 
+TIMESLICE_PATTERN = re.compile(r"[MWDH]\d+(?:-\d+)?(?:,[MWDH]\d+(?:-\d+)?)*")
+
+
+@lru_cache(maxsize=16)
+def _get_calendar_arrays(start_hour: int, periods: int) -> dict[str, NDArray[np.int8]]:
+    """Return the calendar arrays of a contiguous hourly index that starts at `start_hour`."""
+    hours = np.arange(start_hour, start_hour + periods, dtype=np.int64).astype("datetime64[h]")
+    return _calendar_arrays(hours)
+
+
+def _calendar_arrays(hours: NDArray[np.datetime64]) -> dict[str, NDArray[np.int8]]:
+    days = hours.astype("datetime64[D]")
+    months = hours.astype("datetime64[M]")
+    calendar = {
+        "M": (months.astype(np.int64) % 12 + 1).astype(np.int8),
+        # 1970-01-01 was a Thursday. PLEXOS counts weekdays from Sunday (W1) to Saturday (W7).
+        "W": ((days.astype(np.int64) + 4) % 7 + 1).astype(np.int8),
+        "D": ((days - months.astype("datetime64[D]")).astype(np.int64) + 1).astype(np.int8),
+        # PLEXOS hours are hour ending, H1 is the first hour of the day.
+        "H": ((hours - days.astype("datetime64[h]")).astype(np.int64) + 1).astype(np.int8),
+    }
+    for array in calendar.values():
+        array.setflags(write=False)
+    return calendar
+
+
+def get_calendar_arrays(
+    hourly_time_index: pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime],
+) -> dict[str, NDArray[np.int8]]:
+    """Return the month, weekday, day of month and hour of each timestamp of an hourly index.
+
+    The arrays of contiguous hourly indices (e.g., the hourly index of the solve year) are cached, so every
+    timeslice of a model is resolved against the same calendar.
+
+    Parameters
+    ----------
+    hourly_time_index : pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime]
+        Dataframe containing a 'datetime' column for hourly time index.
+
+    Returns
+    -------
+    dict[str, NDArray[np.int8]]
+        Read-only arrays keyed by the timeslice symbol (`M`, `W`, `D` and `H`).
+
+    Examples
+    --------
+    >>> calendar = get_calendar_arrays([datetime(2024, 1, 1, 0), datetime(2024, 1, 1, 1)])
+    >>> calendar["W"], calendar["H"]
+    (array([2, 2], dtype=int8), array([1, 2], dtype=int8))
+    """
+    hours = _to_hourly_array(hourly_time_index)
+    if _is_contiguous(hours):
+        return _get_calendar_arrays(int(hours[0].astype(np.int64)), len(hours))
+    return _calendar_arrays(hours)
+
+
+def _to_hourly_array(
+    hourly_time_index: pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime],
+) -> NDArray[np.datetime64]:
+    if isinstance(hourly_time_index, pl.DataFrame):
+        hourly_time_index = hourly_time_index.to_numpy()
+    return np.asarray(hourly_time_index, dtype="datetime64[h]").ravel()
+
+
+def _is_contiguous(hours: NDArray[np.datetime64]) -> bool:
+    return len(hours) > 0 and bool(np.all(np.diff(hours.astype(np.int64)) == 1))
+
+
+@lru_cache(maxsize=1024)
+def _get_pattern_mask(pattern: str, start_hour: int, periods: int) -> NDArray[np.bool_]:
+    mask = get_pattern_mask(pattern, _get_calendar_arrays(start_hour, periods))
+    mask.setflags(write=False)
+    return mask
+
+
+def get_pattern_mask(pattern: str, calendar: dict[str, NDArray[np.int8]]) -> NDArray[np.bool_]:
+    """Return the boolean mask of the hours that belong to a timeslice pattern.
+
+    Patterns separated by `;` are combined as a union. Inside each pattern, the ranges of the same symbol
+    are combined as a union and the ranges of different symbols as an intersection, so `W2-6,H8-23`
+    selects the hours 8 to 23 of the weekdays.
+
+    Parameters
+    ----------
+    pattern : str
+        Timeslice pattern (e.g., 'M1-3;H1-6' or 'W1,H18-24').
+    calendar : dict[str, NDArray[np.int8]]
+        Calendar arrays returned by `get_calendar_arrays`.
+
+    Returns
+    -------
+    NDArray[np.bool_]
+        Mask with the same length as the calendar arrays.
+
+    Raises
+    ------
+    TypeError
+        If the pattern is not a string.
+    ValueError
+        If a range is outside of the values of its symbol (e.g., 'D40', 'H25').
+    NotImplementedError
+        If the pattern uses a symbol other than `M`, `W`, `D` or `H`.
+
+    Examples
+    --------
+    >>> calendar = get_calendar_arrays([datetime(2024, 1, 1, 0), datetime(2024, 1, 6, 0)])
+    >>> get_pattern_mask("W2,H1", calendar)
+    array([ True, False])
+    >>> get_pattern_mask("W2,H1;W7", calendar)
+    array([ True,  True])
+    """
+    if not isinstance(pattern, str):
+        raise TypeError(f"Expected 'pattern' to be a str, got {type(pattern).__name__}")
+
+    mask = np.zeros(len(calendar["M"]), dtype=bool)
+    for term in pattern.replace(" ", "").split(";"):
+        if not TIMESLICE_PATTERN.fullmatch(term):
+            raise NotImplementedError(f"Timeslice pattern {pattern} not yet supported.")
+        term_mask = np.ones_like(mask)
+        lookups: dict[str, NDArray[np.bool_]] = {}
+        for symbol, values in parse_patterns(term):
+            lookup = lookups.setdefault(symbol, np.zeros(TIMESLICE_LIMITS[symbol][1] + 1, dtype=bool))
+            lookup[values] = True
+        for symbol, lookup in lookups.items():
+            term_mask &= lookup[calendar[symbol]]
+        mask |= term_mask
+    return mask
+
+
 def time_slice_handler(
     records: list[dict[str, Any]],
     hourly_time_index: pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime],
@@ -404,6 +533,9 @@ def time_slice_handler(
 ) -> np.ndarray:
     """Deconstruct a dict of time slices and return a NumPy array representing a time series.
 
+    Records are applied in order, so a later record overrides the hours that it shares with a previous one.
+    Hours that do not belong to any pattern are set to zero.
+
     Parameters
     ----------
     records : dist[str, Any]
@@ -422,10 +554,12 @@ def time_slice_handler(
     ------
     TypeError
         If records are not a list or hourly_time_index is not a polars DataFrame.
-    ValueError
-        If the 'datetime' column is missing from hourly_time_index.
     NotImplementedError
-        If records do not contain valid month patterns starting with 'M'.
+        If a pattern uses a symbol other than `M`, `W`, `D` or `H`.
+
+    See Also
+    --------
+    time_slice_batch_handler : Resolve the records of several properties at once.
 
     Examples
     --------
@@ -437,36 +571,65 @@ def time_slice_handler(
     >>> datetime_index = tuple(start + i * delta for i in range((end - start) // delta))
     >>> time_slice_handler(records, datetime_index)
     """
-    if isinstance(hourly_time_index, pl.DataFrame):
-        hourly_time_index = hourly_time_index.to_numpy()
+    return time_slice_batch_handler({None: records}, hourly_time_index, pattern_key=pattern_key)[None]
+
+
+def time_slice_batch_handler(
+    records: Mapping[Any, list[dict[str, Any]]],
+    hourly_time_index: pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime],
+    pattern_key: str = "pattern",
+) -> dict[Any, np.ndarray]:
+    """Resolve the timeslice records of several properties with a single calendar.
 
-    if not all(isinstance(record, dict) for record in records):
+    Each distinct pattern is converted to a boolean mask once and shared by every property that uses it.
+
+    Parameters
+    ----------
+    records : Mapping[Any, list[dict[str, Any]]]
+        Timeslice records keyed by property (or any other hashable key).
+    hourly_time_index : pl.DataFrame | NDArray[np.datetime64] | Sequence[datetime]
+        Dataframe containing a 'datetime' column for hourly time index.
+    pattern_key : str, optional
+        Key used to extract patterns from records (default is 'pattern').
+
+    Returns
+    -------
+    dict[Any, np.ndarray]
+        Time series of each key, as returned by `time_slice_handler`.
+
+    Examples
+    --------
+    >>> records = {
+    ...     "rating": [{"pattern": "M1-3;M10-12", "value": 90}],
+    ...     "load": [{"pattern": "W2-6,H8-23", "value": 2}, {"pattern": "W1,W7", "value": 1}],
+    ... }
+    >>> series = time_slice_batch_handler(records, datetime_index)
+    """
+    if not all(isinstance(record, dict) for key_records in records.values() for record in key_records):
         raise TypeError("All records must be dictionaries")
 
-    if not all(record[pattern_key].startswith("M") for record in records if pattern_key in record):
-        raise NotImplementedError("All records must contain valid month patterns starting with 'M'")
-
-    if isinstance(hourly_time_index, np.ndarray):
-        hourly_time_index = hourly_time_index.astype(datetime).flatten().tolist()
-
-    months = np.array([dt.month for dt in hourly_time_index])
-    # hours = np.array([dt.hour for dt in hourly_time_index])
-    month_datetime_series = np.zeros(len(hourly_time_index), dtype=float)
-
-    for record in records:
-        patterns = parse_patterns(record[pattern_key])
-        for pattern in patterns:
-            match pattern[0]:
-                case "M":
-                    month_datetime_series[np.isin(months, pattern[1])] = (
-                        record["value"].magnitude
-                        if isinstance(record["value"], pint.Quantity)
-                        else record["value"]
-                    )
-                case _:
-                    raise NotImplementedError
-
-    return month_datetime_series
+    hours = _to_hourly_array(hourly_time_index)
+    contiguous = _is_contiguous(hours)
+    calendar = None if contiguous else _calendar_arrays(hours)
+    start_hour = int(hours[0].astype(np.int64)) if contiguous else 0
+
+    masks: dict[str, NDArray[np.bool_]] = {}
+    time_series = {}
+    for key, key_records in records.items():
+        series = np.zeros(len(hours), dtype=float)
+        for record in key_records:
+            pattern = record[pattern_key]
+            if (mask := masks.get(pattern)) is None:
+                mask = (
+                    _get_pattern_mask(pattern, start_hour, len(hours))
+                    if calendar is None
+                    else get_pattern_mask(pattern, calendar)
+                )
+                masks[pattern] = mask
+            value = record["value"]
+            series[mask] = value.magnitude if isinstance(value, pint.Quantity) else value
+        time_series[key] = series
+    return time_series
 
 
 def find_xml(directory: PathLike):
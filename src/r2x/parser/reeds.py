@@ -3,13 +3,11 @@
 import importlib
 from argparse import ArgumentParser
 from collections import defaultdict
+from collections.abc import Sequence
 from datetime import datetime, timedelta
-from itertools import repeat
-from operator import attrgetter
 
 import numpy as np
 import polars as pl
-import pyarrow as pa
 from infrasys.cost_curves import CostCurve, FuelCurve, UnitSystem
 from infrasys.function_data import LinearFunctionData
 from infrasys.time_series_models import SingleTimeSeries
@@ -44,8 +42,8 @@ from r2x.models.core import MinMax
 from r2x.models.costs import HydroGenerationCost, ThermalGenerationCost
 from r2x.models.generators import HydroDispatch, HydroEnergyReservoir, RenewableGen, ThermalGen
 from r2x.parser.handler import BaseParser, create_model_instance
-from r2x.units import ActivePower, EmissionRate, Energy, Percentage, Time, ureg
-from r2x.utils import get_enum_from_string, match_category, read_csv
+from r2x.units import ActivePower, EmissionRate, Energy, ureg
+from r2x.utils import get_enum_from_string, log_fuzzy_match_cache_info, match_category, read_csv
 
 from .polars_helpers import pl_left_multi_join
 
@@ -93,6 +91,13 @@ class ReEDSParser(BaseParser):
             f"{self.weather_year + 1}",
             dtype="datetime64[D]",
         )[:-1]  # Removing 1 day to match ReEDS convention and converting into a vector
+        # Zero-based month of each day and hour of the weather year.
+        self.month_of_day = self.daily_time_index.astype("datetime64[M]").astype(int) % 12
+        self.month_of_hour = self.hourly_time_index.astype("datetime64[M]").astype(int) % 12
+        self._hydro_data: pl.DataFrame | None = None
+        # Created by `_construct_reserves` and used to add the services of each generator.
+        self.reserve_map: ReserveMap | None = None
+        self.region_reserves: dict[str, list[Reserve]] = {}
 
     def build_system(self) -> System:
         """Create IS system for the ReEDS model."""
@@ -115,6 +120,7 @@ class ReEDSParser(BaseParser):
         self._construct_cf_time_series()
         self._construct_reserve_provision()
         self._construct_hybrid_systems()
+        log_fuzzy_match_cache_info()
 
         return self.system
 
@@ -168,7 +174,9 @@ class ReEDSParser(BaseParser):
                     )
                 )
         # Add reserve map
-        self.system.add_component(self._create_model_instance(ReserveMap, name="reserve_map"))
+        self.reserve_map = self._create_model_instance(ReserveMap, name="reserve_map")
+        self.system.add_component(self.reserve_map)
+        self.region_reserves = self.system.get_reserves_by_region()
 
     def _construct_branches(self):
         logger.info("Creating branch objects.")
@@ -176,35 +184,38 @@ class ReEDSParser(BaseParser):
         tx_loss = self.get_data("tx_losses")
 
         branch_data = pl_left_multi_join(branch_data, tx_loss)
+
+        # Pair every line with the first line of the same kind in the opposite direction.
+        reverse_data = branch_data.select(
+            "kind",
+            from_bus=pl.col("to_bus"),
+            to_bus=pl.col("from_bus"),
+            reverse_rating=pl.col("max_active_power"),
+            has_reverse=pl.lit(True),
+        ).unique(subset=["kind", "from_bus", "to_bus"], keep="first", maintain_order=True)
+        branch_data = branch_data.join(reverse_data, on=["kind", "from_bus", "to_bus"], how="left")
+        branch_data = branch_data.with_columns(
+            has_reverse=pl.col("has_reverse").fill_null(False),
+            rating_up=pl.col("max_active_power"),
+            rating_down=-pl.when(pl.col("has_reverse"))
+            .then(pl.col("reverse_rating"))
+            .otherwise(pl.col("max_active_power")),
+        )
+
         ext = {"Wheeling Charge": 0.001, "Wheeling Charge Back": 0.001}
         reverse_lines = set()
         for idx, branch in enumerate(branch_data.iter_rows(named=True)):
-            from_bus = self.system.get_component(ACBus, branch["from_bus"])
-            to_bus = self.system.get_component(ACBus, branch["to_bus"])
             branch_name = f"{idx + 1:>04}-{branch['from_bus']}-{branch['to_bus']}"
             reverse_key = (branch["kind"], branch["from_bus"], branch["to_bus"])
             if reverse_key in reverse_lines:
                 continue
 
-            # NOTE: Calulate the inverse branch to add it as a single line
-            # inverse_line_mask = (pl.col("to_bus") == from_bus.name) & (pl.col("from_bus") == to_bus.name)
-            # if not (branch_data.filter(inverse_line_mask).is_empty()):
-            #     rating_down = branch_data.filter(inverse_line_mask)["rating"]
-            reverse_row = branch_data.filter(
-                (pl.col("kind") == branch["kind"])
-                & (pl.col("from_bus") == branch["to_bus"])
-                & (pl.col("to_bus") == branch["from_bus"])
-            ).to_dicts()
-
-            if reverse_row:
-                reverse_row_dict = reverse_row[0]
-                rating_down = -reverse_row_dict["max_active_power"] * ureg.MW
-                reverse_lines.add(
-                    (reverse_row_dict["kind"], reverse_row_dict["from_bus"], reverse_row_dict["to_bus"])
-                )
-            else:
-                rating_down = -branch["max_active_power"] * ureg.MW
+            # NOTE: The reverse branch is added as the rating down of a single line.
+            if branch["has_reverse"]:
+                reverse_lines.add((branch["kind"], branch["to_bus"], branch["from_bus"]))
 
+            from_bus = self.system.get_component(ACBus, branch["from_bus"])
+            to_bus = self.system.get_component(ACBus, branch["to_bus"])
             losses = branch["losses"] if branch["losses"] else 0
             self.system.add_component(
                 self._create_model_instance(
@@ -213,8 +224,8 @@ class ReEDSParser(BaseParser):
                     name=branch_name,
                     from_bus=from_bus,
                     to_bus=to_bus,
-                    rating_up=branch["max_active_power"] * ureg.MW,
-                    rating_down=rating_down,
+                    rating_up=branch["rating_up"] * ureg.MW,
+                    rating_down=branch["rating_down"] * ureg.MW,
                     losses=losses * ureg.percent,
                     ext=ext,
                 ),
@@ -290,14 +301,23 @@ class ReEDSParser(BaseParser):
             ).alias("name"),
         )
 
+        generator_emissions = defaultdict(list)
+        for row in emit_rates.iter_rows(named=True):
+            generator_emissions[row["generator_name"]].append(row)
+        emission_types = {
+            emission_type: get_enum_from_string(emission_type, EmissionType)
+            for emission_type in emit_rates["emission_type"].unique()
+        }
+
         for generator in self.system.get_components(
-            Generator, filter_func=lambda x: x.name in emit_rates["generator_name"]
+            Generator, filter_func=lambda x: x.name in generator_emissions
         ):
-            generator_emission = emit_rates.filter(pl.col("generator_name") == generator.name)
-            for row in generator_emission.iter_rows(named=True):
-                row["rate"] = EmissionRate(row["rate"], "kg/MWh")
-                row["emission_type"] = get_enum_from_string(row["emission_type"], EmissionType)
-                emission_model = self._create_model_instance(Emission, **row)
+            for row in generator_emissions[generator.name]:
+                emission_fields = row | {
+                    "rate": EmissionRate(row["rate"], "kg/MWh"),
+                    "emission_type": emission_types[row["emission_type"]],
+                }
+                emission_model = self._create_model_instance(Emission, **emission_fields)
                 self.system.add_component(emission_model)
 
     def _construct_generators(self) -> None:  # noqa: C901
@@ -353,11 +373,11 @@ class ReEDSParser(BaseParser):
         )
 
         # NOTE: Populate fuel_price information for technologies that use bio_fuel
-        gen_data = gen_data.with_columns(
-            category=pl.col("tech").map_elements(
-                lambda row: match_category(row, category_map), return_dtype=pl.String
-            )
-        )
+        # Match each distinct technology once and map the categories back.
+        tech_category = {
+            tech: match_category(tech, category_map) for tech in gen_data["tech"].unique().drop_nulls()
+        }
+        gen_data = gen_data.with_columns(category=pl.col("tech").cast(pl.String).replace(tech_category))
 
         # Adding extra columns
         gen_data = gen_data.with_columns(
@@ -405,7 +425,18 @@ class ReEDSParser(BaseParser):
         cf_generators = self._aggregate_renewable_generators(cf_generators)
 
         combined_data = pl.concat([non_cf_generators, cf_generators], how="align")
+        combined_data = combined_data.with_columns(
+            must_run=pl.col("tech").is_in(self.reeds_config.defaults["commit_technologies"]).cast(pl.Int64)
+        )
+
+        # Lookups shared by every generator.
+        units = {key: ureg.Unit(unit) for key, unit in unit_definition.items()}
+        buses = {bus.name: bus for bus in self.system.get_components(ACBus)}
+        excluded_reserve_techs = set(self.reeds_config.defaults["excluded_reserve_techs"])
+        fuel_pm_types: dict[str, tuple[PrimeMoversType | None, ThermalFuels | None]] = {}
+        operation_costs: dict[tuple, ThermalGenerationCost | HydroGenerationCost] = {}
 
+        generators = []
         for row in combined_data.iter_rows(named=True):
             category = row["category"]
 
@@ -421,10 +452,9 @@ class ReEDSParser(BaseParser):
                 continue
 
             gen_model = getattr(R2X_MODELS, device_map)
-            for key, value in row.items():
-                if key in unit_definition:
-                    if value:
-                        row[key] = value * ureg.Unit(unit_definition[key])
+            for key, unit in units.items():
+                if value := row.get(key):
+                    row[key] = value * unit
             # NOTE: We can uncomment this if we define the units onf the REEDS mapping.
             #     if key in self.config.fmap:
             #         units = self.config.fmap[key].get("units", "")
@@ -440,37 +470,25 @@ class ReEDSParser(BaseParser):
 
             row["name"] = name
 
-            if not (fuel_pm := self.tech_to_fuel_pm.get(row["category"])) and not self.skip_validation:
-                msg = (
-                    f"Could not find a fuel and prime mover map for `{row['category']}`."
-                    " Check `reeds_input_config.json`"
-                )
-                raise ParserError(msg)
-
-            row["prime_mover_type"] = (
-                get_enum_from_string(fuel_pm["type"], PrimeMoversType) if fuel_pm.get("type") else None
-            )
-            row["fuel"] = get_enum_from_string(fuel_pm["fuel"], ThermalFuels) if fuel_pm["fuel"] else None
+            if category not in fuel_pm_types:
+                fuel_pm_types[category] = self._get_fuel_pm_types(category)
+            row["prime_mover_type"], row["fuel"] = fuel_pm_types[category]
 
-            bus = self.system.get_component(ACBus, name=row["region"])
+            bus = buses.get(row["region"]) or self.system.get_component(ACBus, name=row["region"])
             row["bus"] = bus
             bus_load_zone = bus.load_zone
             assert bus_load_zone is not None
 
             # Add reserves/services to generator if they are not excluded
-            if row["tech"] not in self.reeds_config.defaults["excluded_reserve_techs"]:
-                row["services"] = list(
-                    self.system.get_components(
-                        Reserve,
-                        filter_func=lambda x: x.region.name == bus_load_zone.name,
-                    )
-                )
-                reserve_map = self.system.get_component(ReserveMap, name="reserve_map")
+            if row["tech"] not in excluded_reserve_techs:
+                row["services"] = list(self.region_reserves.get(bus_load_zone.name, []))
                 for reserve_type in row["services"]:
-                    reserve_map.mapping[reserve_type.name].append(row["name"])
+                    assert self.reserve_map is not None
+                    self.reserve_map.mapping[reserve_type.name].append(row["name"])
 
             # Add operational cost data
-            # ReEDS model all the thermal generators assuming an average heat rate
+            # ReEDS model all the thermal generators assuming an average heat rate. Generators that share
+            # the same cost inputs share the same cost object.
             vom_price = row.get("vom_price", None) or 0.0
             if isinstance(vom_price, Quantity):
                 vom_price = vom_price.magnitude
@@ -483,62 +501,96 @@ class ReEDSParser(BaseParser):
                 if heat_rate := row.get("heat_rate"):
                     if isinstance(heat_rate, Quantity):
                         heat_rate = heat_rate.magnitude
-                    heat_rate_curve = AverageRateCurve(
-                        function_data=LinearFunctionData(
-                            proportional_term=heat_rate,
-                            constant_term=0,
-                        ),
-                        initial_input=heat_rate,
-                    )
-                    fuel_curve = FuelCurve(
-                        value_curve=heat_rate_curve,
-                        vom_cost=LinearCurve(vom_price),
-                        fuel_cost=fuel_price,
-                        power_units=UnitSystem.NATURAL_UNITS,
-                    )
-                    row["operation_cost"] = ThermalGenerationCost(
-                        variable=fuel_curve,
-                    )
+                    thermal_cost_key = (ThermalGenerationCost, heat_rate, vom_price, fuel_price)
+                    if thermal_cost_key not in operation_costs:
+                        operation_costs[thermal_cost_key] = self._thermal_generation_cost(
+                            heat_rate, vom_price, fuel_price
+                        )
+                    row["operation_cost"] = operation_costs[thermal_cost_key]
             if issubclass(gen_model, HydroGen):
-                row["operation_cost"] = HydroGenerationCost(
-                    variable=CostCurve(
-                        value_curve=LinearCurve(vom_price),
-                        power_units=UnitSystem.NATURAL_UNITS,
+                hydro_cost_key = (HydroGenerationCost, vom_price)
+                if hydro_cost_key not in operation_costs:
+                    operation_costs[hydro_cost_key] = HydroGenerationCost(
+                        variable=CostCurve(
+                            value_curve=LinearCurve(vom_price),
+                            power_units=UnitSystem.NATURAL_UNITS,
+                        )
                     )
-                )
-
-            row["must_run"] = 1 if row["tech"] in self.reeds_config.defaults["commit_technologies"] else 0
+                row["operation_cost"] = operation_costs[hydro_cost_key]
 
             # NOTE: If there is a point when ReEDs enforces minimum capacity for a technology here is where we
             # will need to change it.
             row["active_power_limits"] = MinMax(min=0, max=row["active_power"].magnitude)
 
-            row["ext"] = {}
             row["ext"] = {
                 "tech": row["tech"],
                 "reeds_tech": row["tech"],
                 "reeds_vintage": row["tech_vintage"],
             }
-            self.system.add_component(self._create_model_instance(gen_model, **row))
+            generators.append(self._create_model_instance(gen_model, **row))
+
+        self.system.add_components(*generators)
+        logger.debug(
+            "Added {} generators sharing {} operation cost objects", len(generators), len(operation_costs)
+        )
+
+    def _get_fuel_pm_types(self, category: str) -> tuple[PrimeMoversType | None, ThermalFuels | None]:
+        """Return the prime mover type and fuel enums of a ReEDS category."""
+        if not (fuel_pm := self.tech_to_fuel_pm.get(category)):
+            if not self.skip_validation:
+                msg = (
+                    f"Could not find a fuel and prime mover map for `{category}`."
+                    " Check `reeds_input_config.json`"
+                )
+                raise ParserError(msg)
+            return None, None
+
+        prime_mover_type = (
+            get_enum_from_string(fuel_pm["type"], PrimeMoversType) if fuel_pm.get("type") else None
+        )
+        fuel = get_enum_from_string(fuel_pm["fuel"], ThermalFuels) if fuel_pm["fuel"] else None
+        return prime_mover_type, fuel
+
+    def _thermal_generation_cost(
+        self, heat_rate: float, vom_price: float, fuel_price: float
+    ) -> ThermalGenerationCost:
+        """Return the average heat rate fuel cost of a thermal generator."""
+        heat_rate_curve = AverageRateCurve(
+            function_data=LinearFunctionData(
+                proportional_term=heat_rate,
+                constant_term=0,
+            ),
+            initial_input=heat_rate,
+        )
+        fuel_curve = FuelCurve(
+            value_curve=heat_rate_curve,
+            vom_cost=LinearCurve(vom_price),
+            fuel_cost=fuel_price,
+            power_units=UnitSystem.NATURAL_UNITS,
+        )
+        return ThermalGenerationCost(variable=fuel_curve)
 
     def _construct_load(self):
         logger.info("Adding load time series.")
 
         bus_data = self.get_data("hierarchy")
-        load_df = self.get_data("load").collect()
+        load_data = self.get_data("load")
         start = datetime(year=self.weather_year, month=1, day=1)
         resolution = timedelta(hours=1)
 
         # Calculate starting index for the weather year
-        if len(load_df) > 8760:
+        if len(load_data) > 8760:
             end_idx = 8760 * (self.weather_year - BASE_WEATHER_YEAR + 1)  # +1 to be inclusive.
         else:
             end_idx = 8760
+
+        # Only read the weather year of the buses on the system.
+        load_profiles = load_data.read(bus_data["region"].to_list(), start=end_idx - 8760, end=end_idx)
         for _, bus_data in enumerate(bus_data.iter_rows(named=True)):
             bus_name = bus_data["region"]
             bus = self.system.get_component(ACBus, name=bus_name)
             ts = SingleTimeSeries.from_array(
-                data=ActivePower(load_df[bus_name][end_idx - 8760 : end_idx].to_numpy(), "MW"),
+                data=ActivePower(load_profiles[bus_name], "MW"),
                 variable_name="max_active_power",
                 initial_time=start,
                 resolution=resolution,
@@ -556,11 +608,13 @@ class ReEDSParser(BaseParser):
         if not self.weather_year:
             raise AttributeError("Missing weather year from the configuration class.")
 
-        cf_data = self.get_data("cf").collect()
+        cf_data = self.get_data("cf")
         cf_adjustment = self.get_data("cf_adjustment")
         # NOTE: We take the median of  the seasonal adjustment since we
         # aggregate the generators by technology vintage
-        cf_adjustment = cf_adjustment.group_by("tech").agg(pl.col("cf_adj").median())
+        cf_adjustment = dict(
+            cf_adjustment.group_by("tech").agg(pl.col("cf_adj").median()).iter_rows()
+        )  # Dict is more useful here than series
         ilr = self.get_data("ilr")
         ilr = dict(
             ilr.group_by("tech").agg(pl.col("ilr").sum()).iter_rows()
@@ -574,40 +628,66 @@ class ReEDSParser(BaseParser):
         else:
             end_idx = 8760
 
-        counter = 0
         # NOTE: At some point, I would like to create a single time series per
         # BA instead of attaching one per generator. We would need to invert
         # the order of the loop and just use that to attach it to the different
+        generators = []
+        profile_names = []
         for generator in self.system.get_components(RenewableDispatch, RenewableNonDispatch):
             profile_name = generator.name  # .rsplit("_", 1)[0]
-            if "|" in cf_data.columns[1]:
+            if "|" in cf_data.columns[0]:
                 profile_name = "|".join(profile_name.rsplit("_", 1))
-            if profile_name not in cf_data.columns:
+            if profile_name not in cf_data:
                 msg = (
                     f"{generator.__class__.__name__}:{generator.name} do not "
                     "have a corresponding time series. Consider changing the model to `RenewableGen`"
                 )
                 logger.warning(msg)
                 continue
+            generators.append(generator)
+            profile_names.append(profile_name)
 
-            cf_adj = cf_adjustment.filter(pl.col("tech") == generator.ext["reeds_tech"])["cf_adj"]
-            ilr_value = ilr.get(generator.ext["reeds_tech"], 1)
-            rating_profile = (
-                generator.active_power
-                * ilr_value
-                * cf_adj
-                * cf_data[profile_name][end_idx - 8760 : end_idx].to_numpy()
-            )
+        if not generators:
+            logger.debug("Added {} time series objects", 0)
+            return
+
+        missing_cf_adj = {
+            generator.ext["reeds_tech"]
+            for generator in generators
+            if generator.ext["reeds_tech"] not in cf_adjustment
+        }
+        if missing_cf_adj:
+            logger.warning("Missing cf_adj for {}. Using 1 instead.", sorted(missing_cf_adj))
+
+        # Read each profile once as a (profiles, hours) matrix and map every generator to its row.
+        unique_profiles = list(dict.fromkeys(profile_names))
+        profile_index = {profile_name: idx for idx, profile_name in enumerate(unique_profiles)}
+        cf_profiles = np.ascontiguousarray(
+            cf_data.read_array(unique_profiles, start=end_idx - 8760, end=end_idx).T
+        )
+        scale = np.array(
+            [
+                generator.active_power.magnitude
+                * ilr.get(generator.ext["reeds_tech"], 1)
+                * cf_adjustment.get(generator.ext["reeds_tech"], 1)
+                for generator in generators
+            ],
+            dtype=np.float64,
+        )
+        # Rows of the (generators, hours) matrix are contiguous, so each time series is a view.
+        generator_rows = [profile_index[profile_name] for profile_name in profile_names]
+        rating_profiles = np.multiply(scale[:, None], cf_profiles[generator_rows], dtype=np.float64)
+
+        user_dict = {"solve_year": self.weather_year}
+        for generator, rating_profile in zip(generators, rating_profiles, strict=True):
             ts = SingleTimeSeries.from_array(
-                data=rating_profile,
+                data=ActivePower(rating_profile, generator.active_power.units),
                 variable_name="max_active_power",
                 initial_time=start,
                 resolution=resolution,
             )
-            user_dict = {"solve_year": self.weather_year}
             self.system.add_time_series(ts, generator, **user_dict)
-            counter += 1
-        logger.debug("Added {} time series objects", counter)
+        logger.debug("Added {} time series objects", len(generators))
 
     def _construct_reserve_provision(self):
         # NOTE: We need to re-think this chunk of code. The code is bad.
@@ -618,114 +698,39 @@ class ReEDSParser(BaseParser):
         # resolution of the generator time series
         start = datetime(year=self.weather_year, month=1, day=1)
         resolution = timedelta(hours=1)
+        region_provision = self._get_region_provision()
         for reserve in self.system.get_components(Reserve):
-            region = reserve.region
-            provision_objects = {}
-            provision_objects["solar"] = [
-                component
-                for component in self.system.get_components(
-                    RenewableDispatch,
-                    filter_func=lambda x: x.bus.load_zone.name == region.name
-                    and (
-                        x.prime_mover_type == PrimeMoversType.PV or x.prime_mover_type == PrimeMoversType.RTPV
-                    ),
-                )
-                if self.system.has_time_series(component)
-            ]
-            provision_objects["wind"] = [
-                component
-                for component in self.system.get_components(
-                    RenewableDispatch,
-                    filter_func=lambda x: x.bus.load_zone.name == region.name
-                    and (
-                        x.prime_mover_type == PrimeMoversType.WT or x.prime_mover_type == PrimeMoversType.WS
-                    ),
-                )
-                if self.system.has_time_series(component)
-            ]
-            provision_objects["load"] = [
-                component
-                for component in self.system.get_components(
-                    PowerLoad, filter_func=lambda x: x.bus.load_zone.name == region.name
-                )
-                if self.system.has_time_series(component)
-            ]
-            solar_names = list(map(attrgetter("name"), provision_objects["solar"]))
-            wind_names = list(map(attrgetter("name"), provision_objects["wind"]))
-            load_names = list(map(attrgetter("name"), provision_objects["load"]))
-            solar_reserves = list(
-                map(
-                    getattr,
-                    map(
-                        getattr,
-                        map(self.system.get_time_series, provision_objects["solar"]),
-                        repeat("data"),
-                    ),
-                    repeat("magnitude"),
-                )
-            )
-            solar_capacity = list(
-                map(
-                    lambda component: self.system.get_component_by_label(
-                        component.label
-                    ).active_power.magnitude,
-                    provision_objects["solar"],
-                )
-            )
-            wind_reserves = list(
-                map(
-                    getattr,
-                    map(
-                        getattr,
-                        map(self.system.get_time_series, provision_objects["wind"]),
-                        repeat("data"),
-                    ),
-                    repeat("magnitude"),
-                )
-            )
-            load_reserves = list(
-                map(
-                    getattr,
-                    map(
-                        getattr,
-                        map(self.system.get_time_series, provision_objects["load"]),
-                        repeat("data"),
-                    ),
-                    repeat("magnitude"),
+            provision = region_provision.get(reserve.region.name, {})
+            reserve_type = reserve.reserve_type.name
+
+            reserve_defaults = {
+                category: self.reeds_config.defaults[f"{category}_reserves"].get(reserve_type, 1)
+                for category in ("load", "solar", "wind")
+            }
+            reserve_provision = []
+            if "load" in provision:
+                reserve_provision.append(provision["load"] * reserve_defaults["load"])
+            if "solar" in provision:
+                reserve_provision.append(
+                    (provision["solar"] != 0).astype(np.int64)
+                    * provision["solar_capacity"]
+                    * reserve_defaults["solar"]
                 )
-            )
-            wind_provision = (
-                pa.Table.from_arrays(wind_reserves, names=wind_names)
-                .to_pandas()
-                .sum(axis=1)
-                .mul(self.reeds_config.defaults["wind_reserves"].get(reserve.reserve_type.name, 1))
-            )
-            solar_provision = (
-                pa.Table.from_arrays(solar_reserves, names=solar_names)
-                .to_pandas()
-                .sum(axis=1)
-                .apply(lambda x: 1 if x != 0 else 0)
-                .mul(sum(solar_capacity))
-                .mul(self.reeds_config.defaults["solar_reserves"].get(reserve.reserve_type.name, 1))
-            )
-            load_provision = (
-                pa.Table.from_arrays(load_reserves, names=load_names)
-                .to_pandas()
-                .sum(axis=1)
-                .mul(self.reeds_config.defaults["load_reserves"].get(reserve.reserve_type.name, 1))
-            )
-            total_provision = load_provision.add(solar_provision, fill_value=0).add(
-                wind_provision, fill_value=0
-            )
-            if total_provision.empty:
+            if "wind" in provision:
+                reserve_provision.append(provision["wind"] * reserve_defaults["wind"])
+
+            if reserve_provision:
+                total_provision = sum(reserve_provision[1:], start=reserve_provision[0])
+            else:
                 msg = (
                     f"Reserve provision for {reserve=} is zero."
                     "Check that renewable devices contribute to the reserve"
                 )
                 logger.warning(msg)
+                total_provision = np.array([], dtype=np.float64)
             self.system.add_time_series(
                 SingleTimeSeries.from_array(
-                    total_provision.to_numpy(),
+                    total_provision,
                     variable_name="requirement",
                     initial_time=start,
                     resolution=resolution,
@@ -735,51 +740,74 @@ class ReEDSParser(BaseParser):
             # Add total provision as requirement
             setattr(reserve, "max_requirement", total_provision.sum())
 
+    def _get_region_provision(self) -> dict[str, dict]:
+        """Return the aggregated solar, wind and load profiles of each region.
+
+        Each region maps to the hourly sum of the `solar`, `wind` and `load` profiles of the
+        components with a time series on that region, plus the total `solar_capacity`. Missing
+        categories are omitted.
+        """
+        region_profiles: dict[str, dict[str, list]] = defaultdict(lambda: defaultdict(list))
+        solar_capacity: dict[str, list[float]] = defaultdict(list)
+
+        def add_profile(component: RenewableDispatch | PowerLoad, category: str) -> str | None:
+            if not self.system.has_time_series(component):
+                return None
+            bus = component.bus
+            assert bus is not None and bus.load_zone is not None
+            region_name = bus.load_zone.name
+            region_profiles[region_name][category].append(
+                self.system.get_time_series(component).data.magnitude
+            )
+            return region_name
+
+        for load in self.system.get_components(PowerLoad):
+            add_profile(load, "load")
+        for generator in self.system.get_components(RenewableDispatch):
+            if generator.prime_mover_type in (PrimeMoversType.PV, PrimeMoversType.RTPV):
+                if (region_name := add_profile(generator, "solar")) is not None:
+                    solar_capacity[region_name].append(generator.active_power.magnitude)
+            elif generator.prime_mover_type in (PrimeMoversType.WT, PrimeMoversType.WS):
+                add_profile(generator, "wind")
+
+        region_provision = {}
+        for region_name, profiles in region_profiles.items():
+            # Missing values are skipped when adding the profiles.
+            region_provision[region_name] = {
+                category: np.nansum(np.stack(arrays), axis=0) for category, arrays in profiles.items()
+            }
+            if solar_capacity[region_name]:
+                region_provision[region_name]["solar_capacity"] = sum(solar_capacity[region_name])
+        return region_provision
+
     def _construct_hydro_budgets(self) -> None:
         """Hydro budgets in ReEDS."""
         logger.debug("Adding hydro budgets.")
-        month_hrs = read_csv("month_hrs.csv").collect()
-        month_map = self.reeds_config.defaults["month_map"]
-
-        hydro_cf = self.get_data("hydro_cf")
-        hydro_cf = hydro_cf.with_columns(
-            month=pl.col("month").map_elements(lambda row: month_map.get(row, row), return_dtype=pl.String)
-        )
-        month_hrs = month_hrs.rename({"szn": "season"})
-        hydro_data = pl_left_multi_join(
-            hydro_cf,
-            month_hrs,
+        # NOTE: Canadian imports need another file for the ratings, but we process it as
+        # HydroEnergyReservoir since it is the way ReEDS model it.
+        generators = [
+            generator
+            for generator in self.system.get_components(HydroDispatch)
+            if generator.category != "can-imports"
+        ]
+        if not generators:
+            return None
+
+        hydro_data = self._get_hydro_monthly_data(generators)
+        generator_idx = hydro_data["generator"].to_numpy()
+        month_idx = hydro_data["month"].to_numpy()
+        hrs = hydro_data["hrs"].to_numpy()
+        active_power = np.array([generator.active_power.magnitude for generator in generators])
+        monthly_budget = np.zeros((len(generators), 12), dtype=float)
+        monthly_budget[generator_idx, month_idx] = (
+            active_power[generator_idx] * hydro_data["hydro_cf"].to_numpy() * hrs / (hrs / 24)
         )
-        month_of_day = np.array(
-            [dt.astype("datetime64[M]").astype(int) % 12 + 1 for dt in self.daily_time_index]
-        )
-        initial_time = datetime(self.weather_year, 1, 1)
-        for generator in self.system.get_components(HydroDispatch):
-            # NOTE: Canadian imports need another file for the ratings, but we process it as
-            # HydroEnergyReservoir since it is the way ReEDS model it.
-            if generator.category == "can-imports":
-                continue
-            tech = generator.ext["reeds_tech"]
-            generator_bus = generator.bus
-            assert generator_bus
-            region = generator_bus.name
-            hydro_ratings = hydro_data.filter((pl.col("tech") == tech) & (pl.col("region") == region))
-
-            hourly_time_series = np.zeros(len(month_of_day), dtype=float)
-
-            for row in hydro_ratings.iter_rows(named=True):
-                month = row["month"]
-                if isinstance(month, str):
-                    month = int(month.removeprefix("M"))
-
-                month_max_budget = (
-                    generator.active_power * Percentage(row["hydro_cf"], "") * Time(row["hrs"], "h")
-                )
-                daily_max_budget = month_max_budget / (row["hrs"] / 24)
-                hourly_time_series[month_of_day == month] = daily_max_budget.magnitude
+        daily_budgets = monthly_budget[:, self.month_of_day]
 
+        initial_time = datetime(self.weather_year, 1, 1)
+        for generator, daily_budget in zip(generators, daily_budgets, strict=True):
             ts = SingleTimeSeries.from_array(
-                Energy(hourly_time_series / 1e3, "GWh"),
+                Energy(daily_budget / 1e3, "GWh"),
                 "hydro_budget",
                 initial_time=initial_time,
                 resolution=timedelta(days=1),
@@ -790,43 +818,28 @@ class ReEDSParser(BaseParser):
 
     def _construct_hydro_rating_profiles(self) -> None:
         logger.debug("Adding hydro rating profiles.")
-        month_hrs = read_csv("month_hrs.csv").collect()
-        month_map = self.reeds_config.defaults["month_map"]
-
-        hydro_cf = self.get_data("hydro_cf")
-        hydro_cf = hydro_cf.with_columns(
-            month=pl.col("month").map_elements(lambda row: month_map.get(row, row), return_dtype=pl.String)
-        )
-        month_hrs = month_hrs.rename({"szn": "season"})
-        hydro_data = pl_left_multi_join(
-            hydro_cf,
-            month_hrs,
-        )
-        month_of_hour = np.array(
-            [dt.astype("datetime64[M]").astype(int) % 12 + 1 for dt in self.hourly_time_index]
+        generators = list(self.system.get_components(HydroEnergyReservoir))
+        if not generators:
+            return None
+
+        hydro_data = self._get_hydro_monthly_data(generators)
+        generator_idx = hydro_data["generator"].to_numpy()
+        month_idx = hydro_data["month"].to_numpy()
+        active_power = np.array([generator.active_power.magnitude for generator in generators])
+        monthly_rating = np.zeros((len(generators), 12), dtype=float)
+        monthly_rating[generator_idx, month_idx] = (
+            active_power[generator_idx] * hydro_data["hydro_cf"].to_numpy()
         )
+        hourly_ratings = monthly_rating[:, self.month_of_hour]
+
         initial_time = datetime(self.weather_year, 1, 1)
-        for generator in self.system.get_components(HydroEnergyReservoir):
-            tech = generator.ext["reeds_tech"]
-            generator_bus = generator.bus
-            assert generator_bus is not None
-            region = generator_bus.name
+        for generator, hourly_rating in zip(generators, hourly_ratings, strict=True):
             generator.inflow = 0.0
             generator.initial_storage = generator.initial_energy
             generator.storage_capacity = Energy(0.0, "MWh")
             generator.storage_target = Energy(0.0, "MWh")
-
-            hourly_time_series = np.zeros(len(month_of_hour), dtype=float)
-            hydro_ratings = hydro_data.filter((pl.col("tech") == tech) & (pl.col("region") == region))
-            for row in hydro_ratings.iter_rows(named=True):
-                month = row["month"]
-                if isinstance(month, str):
-                    month = int(month.removeprefix("M"))
-                month_indices = month_of_hour == month
-                rating = generator.active_power * Percentage(row["hydro_cf"], "")
-                hourly_time_series[month_indices] = rating.magnitude
             ts = SingleTimeSeries.from_array(
-                ActivePower(hourly_time_series, "MW"),
+                ActivePower(hourly_rating, "MW"),
                 "max_active_power",
                 initial_time=initial_time,
                 resolution=timedelta(hours=1),
@@ -834,6 +847,41 @@ class ReEDSParser(BaseParser):
             self.system.add_time_series(ts, generator)
         return None
 
+    def _get_hydro_monthly_data(self, generators: Sequence[HydroGen]) -> pl.DataFrame:
+        """Return the monthly capacity factor and hours that apply to each generator.
+
+        The result has one row per generator and month with the position of the generator in
+        `generators`, the zero-based `month`, `hydro_cf` and `hrs` columns.
+        """
+        if self._hydro_data is None:
+            month_hrs = read_csv("month_hrs.csv").collect().rename({"szn": "season"})
+            month_map = self.reeds_config.defaults["month_map"]
+            hydro_cf = self.get_data("hydro_cf").with_columns(
+                month=pl.col("month").cast(pl.String).replace(month_map)
+            )
+            hydro_data = pl_left_multi_join(hydro_cf, month_hrs)
+            self._hydro_data = hydro_data.select(
+                tech=pl.col("tech").cast(pl.String),
+                region=pl.col("region").cast(pl.String),
+                month=pl.col("month").str.strip_prefix("M").cast(pl.Int64) - 1,
+                hydro_cf=pl.col("hydro_cf").cast(pl.Float64),
+                hrs=pl.col("hrs").cast(pl.Float64),
+            )
+            self._hydro_data = self._hydro_data.drop_nulls("month").unique(
+                subset=["tech", "region", "month"], keep="last", maintain_order=True
+            )
+
+        regions = []
+        for generator in generators:
+            generator_bus = generator.bus
+            assert generator_bus
+            regions.append(generator_bus.name)
+        generator_keys = pl.DataFrame(
+            {"tech": [generator.ext["reeds_tech"] for generator in generators], "region": regions},
+            schema={"tech": pl.String, "region": pl.String},
+        ).with_row_index("generator")
+        return generator_keys.join(self._hydro_data, on=["tech", "region"], how="inner")
+
     def _construct_hybrid_systems(self):
         """Create hybrid storage units and add them to the system."""
         hybrids = list(
@@ -2,18 +2,27 @@
 
 import importlib
 import inspect
+import multiprocessing
 import shutil
 import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from importlib.resources import files
 from pathlib import Path
 
+import rich
 from loguru import logger
+from rich.table import Table
 
 from r2x.exporter.handler import get_exporter
 
 from .api import System
 from .config_scenario import Scenario, get_scenario_configuration
+from .exceptions import ScenarioRunError
 from .exporter import exporter_list
+from .logger import setup_logging
 from .parser import parser_list
 from .parser.handler import BaseParser, get_parser_data
 from .upgrader import upgrade_handler
@@ -21,6 +30,39 @@ from .utils import (
     DEFAULT_PLUGIN_PATH,
 )
 
+try:
+    import resource
+except ImportError:  # Not available on Windows.
+    resource = None  # type: ignore[assignment]
+
+
+@dataclass
+class ScenarioResult:
+    """Summary of a scenario translation.
+
+    Attributes
+    ----------
+    name
+        Name of the scenario.
+    success
+        True if the translation finished without errors.
+    wall_time
+        Elapsed time of the translation in seconds.
+    peak_rss
+        Peak resident set size of the process in bytes. None if not available on the platform.
+    log_file
+        Log file of the scenario.
+    error
+        Traceback of the exception raised by the scenario, if any.
+    """
+
+    name: str
+    success: bool
+    wall_time: float
+    peak_rss: int | None = None
+    log_file: Path | None = None
+    error: str | None = None
+
 
 def run_parser(config: Scenario, **kwargs):
     """Call get parser for parser selected.
@@ -140,7 +182,8 @@ def run(cli_args: dict, user_dict: dict | None = None) -> None:
 
     This function takes the `cli_args` dictionary to create the configuratio and run the translation process.
     If the user specifies multiple scenarios, this function run the translation sequentially with
-    no specific order.
+    no specific order, unless `cli_args["jobs"]` is greater than one. In that case, the scenarios run in
+    parallel (see :func:`run_scenarios_parallel`) and a summary table is printed at the end.
 
     Parameters
     ----------
@@ -154,23 +197,155 @@ def run(cli_args: dict, user_dict: dict | None = None) -> None:
         get_config: Get configuration from arguments
         run_single_scenario: Run a single translation scenario
 
+    Raises
+    ------
+    ScenarioRunError
+        If any of the scenarios run in parallel failed.
+
     Notes
     -----
     Currently the scenario should only have a single year to run.
     """
     config_mgr = get_scenario_configuration(cli_args=cli_args, user_dict=user_dict)
     logger.info("Running {} scenarios", len(config_mgr))
-    for _, scenario in config_mgr.scenarios.items():
+    scenarios = list(config_mgr.scenarios.values())
+    for scenario in scenarios:
         # NOTE: We can pass multiple years from the CLI. In those cases we want to raise not implemented.
         if hasattr(scenario, "input_config") and isinstance(
             getattr(scenario.input_config, "solve_year", None), list
         ):
             msg = "Multi year runs from the CLI is not yet supported. Use scenarios instead."
             raise NotImplementedError(msg)
+
+    jobs = int(cli_args.get("jobs") or 1)
+    if jobs > 1 and len(scenarios) > 1 and not cli_args.get("inspect"):
+        results = run_scenarios_parallel(scenarios, jobs=jobs, verbosity=cli_args.get("verbose", 0))
+        print_run_summary(results)
+        if failed := [result.name for result in results if not result.success]:
+            msg = f"{len(failed)} of {len(results)} scenarios failed: {failed}. See the scenario log files."
+            raise ScenarioRunError(msg)
+        return
+
+    for scenario in scenarios:
         run_single_scenario(scenario)
     return
 
 
+def _get_peak_rss() -> int | None:
+    """Return the peak resident set size of the current process in bytes."""
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes while macOS reports bytes.
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def _run_scenario_process(scenario: Scenario, log_file: Path, verbosity: int = 0) -> ScenarioResult:
+    """Run a single scenario on a worker process and log to its own file."""
+    setup_logging(filename=log_file, verbosity=max(verbosity, 1), console=False)
+    start = time.perf_counter()
+    error = None
+    try:
+        run_single_scenario(scenario)
+    except Exception:
+        error = traceback.format_exc()
+        logger.error("Scenario {} failed:\n{}", scenario.name, error)
+    wall_time = time.perf_counter() - start
+    logger.info("Scenario {} finished in {:.2f}s", scenario.name, wall_time)
+    logger.complete()
+    logger.remove()
+    return ScenarioResult(
+        name=str(scenario.name),
+        success=error is None,
+        wall_time=wall_time,
+        peak_rss=_get_peak_rss(),
+        log_file=log_file,
+        error=error,
+    )
+
+
+def run_scenarios_parallel(scenarios: list[Scenario], jobs: int, verbosity: int = 0) -> list[ScenarioResult]:
+    """Run multiple scenarios in a process pool.
+
+    Each scenario runs on a fresh process, so a failing (or crashing) scenario does not affect the rest of
+    the batch and the reported peak memory belongs to that scenario alone. The logs of each scenario are
+    written to `{output_folder}/{name}.log`.
+
+    Parameters
+    ----------
+    scenarios
+        Scenarios to translate.
+    jobs
+        Maximum number of scenarios to run at the same time.
+    verbosity
+        Verbosity level of the scenario log files. The minimum level is INFO.
+
+    Returns
+    -------
+    list[ScenarioResult]
+        Result for each scenario in the same order as `scenarios`.
+    """
+    max_workers = min(jobs, len(scenarios))
+    logger.info("Running {} scenarios using {} processes", len(scenarios), max_workers)
+    results: dict[int, ScenarioResult] = {}
+    # Spawn is required to recycle the workers after each scenario.
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"), max_tasks_per_child=1
+    ) as executor:
+        start_times: dict[int, float] = {}
+        futures = {}
+        for idx, scenario in enumerate(scenarios):
+            log_file = Path(scenario.output_folder) / f"{scenario.name}.log"
+            start_times[idx] = time.perf_counter()
+            futures[executor.submit(_run_scenario_process, scenario, log_file, verbosity)] = idx
+
+        for future in as_completed(futures):
+            idx = futures[future]
+            scenario = scenarios[idx]
+            try:
+                result = future.result()
+            except Exception:
+                # The worker died before it could report back (e.g., killed by the OOM killer).
+                result = ScenarioResult(
+                    name=str(scenario.name),
+                    success=False,
+                    wall_time=time.perf_counter() - start_times[idx],
+                    log_file=Path(scenario.output_folder) / f"{scenario.name}.log",
+                    error=traceback.format_exc(),
+                )
+            if result.success:
+                logger.success("Scenario {} finished in {:.2f}s", result.name, result.wall_time)
+            else:
+                logger.error("Scenario {} failed. See {}", result.name, result.log_file)
+            results[idx] = result
+    return [results[idx] for idx in range(len(scenarios))]
+
+
+def print_run_summary(results: list[ScenarioResult]) -> None:
+    """Print a table with the wall time and peak memory of each scenario."""
+    summary_table = Table(
+        title="R2X Run Summary",
+        show_header=True,
+        title_justify="left",
+        title_style="bold",
+    )
+    summary_table.add_column("Scenario", style="green", justify="left", min_width=20)
+    summary_table.add_column("Status", justify="left")
+    summary_table.add_column("Wall time (s)", justify="right")
+    summary_table.add_column("Peak RSS (MB)", justify="right")
+    summary_table.add_column("Log file", justify="left")
+
+    for result in results:
+        summary_table.add_row(
+            result.name,
+            "[green]success[/green]" if result.success else "[red]failed[/red]",
+            f"{result.wall_time:.2f}",
+            f"{result.peak_rss / 1024**2:.1f}" if result.peak_rss is not None else "-",
+            str(result.log_file or "-"),
+        )
+    return rich.print(summary_table)
+
+
 def init(cli_args: dict) -> None:
     """Copy the default configuration file on the path that the user request.
 
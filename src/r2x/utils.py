@@ -16,6 +16,7 @@ import difflib
 from importlib.resources import files
 from pathlib import Path
 from itertools import islice
+from typing import Any
 
 # Third-party packages
 import numpy as np
@@ -596,7 +597,8 @@ def match_category(row, categories, cutoff=0.6):
     """Return the n_return closest match based on the cutoff.
 
     This is a wrapper function of the difflib.get_close_matches function,
-    except it just return the first value that if inds.
+    except it just return the first value that if inds. Matches are memoized
+    by (row, categories, cutoff).
 
     Args:
         row: String to match,
@@ -604,6 +606,11 @@ def match_category(row, categories, cutoff=0.6):
         n_return: number of matches to return,
         cutoff: Cutoff of the algorithm (0-1]. 1 being perfect match.
     """
+    return _match_category(row, tuple(categories), cutoff)
+
+
+@functools.lru_cache(maxsize=1024)
+def _match_category(row, categories: tuple, cutoff: float):
     from difflib import get_close_matches
 
     result = get_close_matches(row, categories, n=1, cutoff=cutoff)
@@ -613,6 +620,7 @@ def match_category(row, categories, cutoff=0.6):
     return row
 
 
+@functools.lru_cache(maxsize=1024)
 def get_enum_from_string(string: str, enum_class, prefix: str | None = None):
     max_similarity = 0.95
     closest_enum = None
@@ -632,6 +640,21 @@ def get_enum_from_string(string: str, enum_class, prefix: str | None = None):
     return closest_enum
 
 
+def log_fuzzy_match_cache_info() -> None:
+    """Log the hit rates of the memoized fuzzy matching functions."""
+    for func in (_match_category, get_enum_from_string):
+        info = func.cache_info()
+        calls = info.hits + info.misses
+        logger.trace(
+            "{} cache: {} hits, {} misses ({:.0%} hit rate), {} entries",
+            func.__name__,
+            info.hits,
+            info.misses,
+            info.hits / calls if calls else 0,
+            info.currsize,
+        )
+
+
 def custom_attrgetter(component, category_attribute):
     try:
         category = attrgetter(category_attribute)(component)
@@ -715,5 +738,15 @@ def haskey(base_dict: dict, path: list[str]) -> bool:
         return False
 
 
+def is_flag_enabled(value: Any) -> bool:
+    """Return True if a feature flag is set, handling string values from the CLI."""
+    return bool(value) and str(value).lower() not in {"false", "0", "no"}
+
+
+def get_max_workers(value: Any) -> int | None:
+    """Return the number of workers set by an enabled feature flag, or None to use the default."""
+    return int(value) if str(value).isdigit() else None
+
+
 DEFAULT_COLUMN_MAP = read_json("r2x/defaults/config.json").get("default_column_mapping")
 mapping_schema = json.loads(files("r2x.defaults").joinpath("mapping_schema.json").read_text())
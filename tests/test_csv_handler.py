@@ -1,10 +1,13 @@
 from pathlib import Path
+import time
 import pytest
 
 from tempfile import NamedTemporaryFile
 
+import numpy as np
 import polars as pl
 from r2x.parser.handler import csv_handler
+from r2x.parser.polars_helpers import pl_filter_year
 from r2x.parser.plexos_utils import (
     DATAFILE_COLUMNS,
     get_column_enum,
@@ -27,3 +30,61 @@ def test_csv_handler(expected_enum, csv_content):
         assert isinstance(df_csv, pl.DataFrame)
         column_type = get_column_enum(df_csv.columns)
         assert column_type == expected_enum
+
+
+def _write_profile_csv(fpath: Path, num_rows: int) -> Path:
+    rng = np.random.default_rng(42)
+    pl.DataFrame(
+        {
+            "Tech": rng.choice(["UPV", "Wind"], num_rows),
+            "R": rng.choice(["p1", "p2"], num_rows),
+            "T": rng.integers(2020, 2051, num_rows),
+            "Value": rng.random(num_rows),
+        }
+    ).write_csv(fpath)
+    return fpath
+
+
+def test_csv_handler_lazy_infers_schema_once(tmp_path, monkeypatch):
+    fpath = _write_profile_csv(tmp_path / "profile.csv", 1_000)
+    expected = pl_filter_year(csv_handler(fpath), year=2030)
+
+    inferring_reads = []
+
+    def spy(reader):
+        def wrapper(*args, **kwargs):
+            if kwargs.get("schema") is None:
+                inferring_reads.append(reader.__name__)
+            return reader(*args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(pl, "read_csv", spy(pl.read_csv))
+    monkeypatch.setattr(pl, "scan_csv", spy(pl.scan_csv))
+    data = pl_filter_year(csv_handler(fpath, lazy=True), year=2030)
+    assert isinstance(data, pl.LazyFrame)
+    assert data.collect().equals(expected)
+    assert inferring_reads == ["read_csv"]
+
+
+def test_csv_handler_lazy_header_only(tmp_path):
+    fpath = tmp_path / "empty.csv"
+    fpath.write_text("name,value\n")
+    assert csv_handler(fpath) is None
+    assert csv_handler(fpath, lazy=True) is None
+
+
+def test_csv_handler_lazy_is_not_slower(tmp_path):
+    fpath = _write_profile_csv(tmp_path / "profile.csv", 1_000_000)
+
+    def best_time(lazy: bool) -> float:
+        timings = []
+        for _ in range(2):
+            start = time.perf_counter()
+            data = pl_filter_year(csv_handler(fpath, lazy=lazy), year=2030)
+            if isinstance(data, pl.LazyFrame):
+                data = data.collect()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    assert best_time(lazy=True) <= best_time(lazy=False) * 1.1
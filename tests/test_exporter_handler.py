@@ -0,0 +1,115 @@
+import csv
+import gzip
+import warnings
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from r2x.exporter.handler import (
+    get_export_properties,
+    get_export_records,
+    write_records_table,
+    write_time_series_table,
+)
+from r2x.exporter.utils import apply_property_map
+
+
+@pytest.fixture
+def time_series_table():
+    datetime_array = pd.date_range(start="1/1/2030", periods=24, freq="60min").to_numpy()
+    names = ["gen_01", "gen_02"]
+    arrays = [np.linspace(0, 1, 24), np.arange(24, dtype=float)]
+    return datetime_array, names, arrays
+
+
+def test_write_time_series_csv(tmp_path, time_series_table):
+    datetime_array, names, arrays = time_series_table
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        fpath = write_time_series_table(tmp_path / "ts.csv", datetime_array, names, arrays)
+
+    lines = fpath.read_text().splitlines()
+    assert lines[0] == "DateTime,gen_01,gen_02"
+    assert lines[1] == "2030-01-01T00:00,0.0,0.0"
+    assert len(lines) == 25
+
+    data = pl.read_csv(fpath)
+    assert data.columns == ["DateTime", *names]
+    assert np.allclose(data["gen_01"].to_numpy(), arrays[0])
+
+
+def test_write_time_series_csv_precision_and_gzip(tmp_path, time_series_table):
+    datetime_array, names, arrays = time_series_table
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        fpath = write_time_series_table(
+            tmp_path / "ts.csv", datetime_array, names, arrays, float_precision=2, compression="gzip"
+        )
+    assert fpath.name == "ts.csv.gz"
+
+    with gzip.open(fpath, "rt") as f:
+        lines = f.read().splitlines()
+    assert lines[2] == "2030-01-01T01:00,0.04,1.00"
+
+    with pytest.raises(ValueError):
+        _ = write_time_series_table(tmp_path / "ts.csv", datetime_array, names, arrays, compression="zstd")
+
+
+def test_write_time_series_parquet(tmp_path, time_series_table):
+    datetime_array, names, arrays = time_series_table
+    fpath = write_time_series_table(tmp_path / "ts.csv", datetime_array, names, arrays, file_format="parquet")
+    assert fpath.suffix == ".parquet"
+
+    data = pl.read_parquet(fpath)
+    assert data.columns == ["DateTime", *names]
+    assert data["DateTime"].dtype == pl.Datetime
+    assert np.array_equal(data["gen_02"].to_numpy(), arrays[1])
+
+    with pytest.raises(ValueError):
+        _ = write_time_series_table(tmp_path / "ts.csv", datetime_array, names, arrays, file_format="h5")
+
+
+def test_write_records_table(tmp_path):
+    table = pl.DataFrame({"name": ["gen_01", "gen_02"], "rating": [10.0, 20.0]})
+    fpath = write_records_table(tmp_path / "gen.csv", table)
+    assert pl.read_csv(fpath).equals(table)
+
+    fpath = write_records_table(tmp_path / "gen.csv", table, file_format="parquet")
+    assert fpath.name == "gen.parquet"
+    assert pl.read_parquet(fpath).equals(table)
+
+    with pytest.raises(ValueError):
+        _ = write_records_table(tmp_path / "gen.csv", table, file_format="h5")
+
+
+def test_write_records_table_matches_dict_writer(tmp_path):
+    records = [
+        {"name": "gen_01", "available": True, "rating": 10.5, "bus": "bus, 1"},
+        {"name": "gen_02", "available": False, "rating": None, "bus": "bus_2"},
+    ]
+    fpath = write_records_table(tmp_path / "gen.csv", pl.DataFrame(records))
+
+    with open(tmp_path / "expected.csv", "w", newline="") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=list(records[0]))
+        writer.writeheader()
+        writer.writerows(records)
+    assert fpath.read_bytes() == (tmp_path / "expected.csv").read_bytes()
+
+
+def test_get_export_records_and_properties():
+    def rename(component):
+        return apply_property_map(component, {"rating": "Max Flow"})
+
+    def add_units(component):
+        component["units"] = "MW"
+        return component
+
+    records = [{"name": "line_01", "rating": 100}, {"name": "line_02", "rating": 200}]
+    assert get_export_records(records, rename, add_units) == [
+        {"name": "line_01", "Max Flow": 100, "units": "MW"},
+        {"name": "line_02", "Max Flow": 200, "units": "MW"},
+    ]
+    assert records[0] == {"name": "line_01", "rating": 100}
+    assert get_export_properties(records[1], rename) == {"name": "line_02", "Max Flow": 200}
@@ -1,7 +1,11 @@
+from functools import partial
+
 import pytest
 from pint import Quantity
 from r2x.exporter.utils import (
     apply_default_value,
+    apply_export_pipeline,
+    compile_export_pipeline,
     apply_extract_key,
     apply_flatten_key,
     apply_property_map,
@@ -9,7 +13,10 @@ from r2x.exporter.utils import (
     apply_valid_properties,
     apply_pint_deconstruction,
     get_property_magnitude,
+    records_to_frame,
+    required_fields,
 )
+from r2x.exceptions import FieldRemovalError
 
 
 @pytest.mark.exporter_utils
@@ -203,3 +210,143 @@ def test_extract_key():
     result = apply_extract_key(component, key="ext", keys_to_extract={"Test"})
     assert result is not None
     assert result == component
+
+
+@pytest.mark.exporter_utils
+def test_records_to_frame():
+    records = [
+        {
+            "name": "gen_01",
+            "bus": {"number": 1, "name": "bus_01"},
+            "active_power": Quantity(1.0, "GW"),
+            "limits": {"min": 0.0, "max": 1.0},
+        },
+        {"name": "gen_02", "bus": {"number": 2, "name": "bus_02"}, "active_power": Quantity(500.0, "MW")},
+    ]
+    table = records_to_frame(
+        records,
+        property_map={"bus": "bus_id"},
+        unit_map={"active_power": "MW"},
+        unnest_key_map={"bus_id": "number"},
+        keys_to_flatten={"limits"},
+        default_value_map={"fuel_price": 0.0},
+        fields=["name", "bus_id", "active_power", "limits_max", "fuel_price", "missing"],
+        restval="NA",
+    )
+    assert table.columns == ["name", "bus_id", "active_power", "limits_max", "fuel_price", "missing"]
+    assert table.rows() == [
+        ("gen_01", 1, 1000.0, "1.0", 0.0, "NA"),
+        ("gen_02", 2, 500.0, "NA", 0.0, "NA"),
+    ]
+
+
+@pytest.mark.exporter_utils
+def test_records_to_frame_matches_record_transforms():
+    records = [{"name": "bus_01", "zone": {"name": "z1"}, "voltage": Quantity(230, "kV")}]
+    table = records_to_frame(
+        records, property_map={"voltage": "base_voltage"}, unnest_key_map={"zone": "name"}
+    )
+
+    expected = apply_unnest_key(
+        apply_pint_deconstruction(apply_property_map(records[0], {"voltage": "base_voltage"}), {}),
+        {"zone": "name"},
+    )
+    assert table.to_dicts() == [expected]
+
+
+@pytest.mark.exporter_utils
+def test_compile_export_pipeline_matches_record_transforms():
+    record = {
+        "name": "gen_01",
+        "active_power": Quantity(1.0, "GW"),
+        "active_power_limits": {"min": 0.0, "max": 1.0},
+        "ext": {"Heat Rate": 10.0, "other": 1},
+        "category": "thermal",
+    }
+    property_map = {"active_power": "Max Capacity", "active_power_limits_max": "Max Load"}
+    valid_properties = ["Max Capacity", "Max Load", "Heat Rate"]
+    expected = apply_valid_properties(
+        apply_pint_deconstruction(
+            apply_property_map(
+                apply_flatten_key(apply_extract_key(record, "ext", {"Heat Rate"}), {"active_power_limits"}),
+                property_map,
+            ),
+            {"Max Capacity": "MW"},
+        ),
+        valid_properties,
+        add_name=True,
+    )
+
+    pipeline = compile_export_pipeline(
+        extract_key="ext",
+        keys_to_extract={"Heat Rate"},
+        keys_to_flatten={"active_power_limits"},
+        property_map=property_map,
+        unit_map={"Max Capacity": "MW"},
+        valid_properties=valid_properties,
+        add_name=True,
+    )
+    assert (
+        pipeline(record)
+        == expected
+        == {
+            "name": "gen_01",
+            "Max Capacity": 1000.0,
+            "Max Load": 1.0,
+            "Heat Rate": 10.0,
+        }
+    )
+    assert "Heat Rate" not in record
+
+
+@pytest.mark.exporter_utils
+def test_compile_export_pipeline_property_map_before_flatten():
+    record = {"name": "storage_01", "limits": {"min": 0.0, "max": Quantity(1.0, "GW")}}
+    property_map = {"limits": "active_power_limits"}
+    unit_map = {"active_power_limits_max": "MW"}
+    expected = apply_pint_deconstruction(
+        apply_flatten_key(apply_property_map(record, property_map), {"active_power_limits"}), unit_map
+    )
+
+    pipeline = compile_export_pipeline(
+        partial(apply_property_map, property_map=property_map),
+        keys_to_flatten={"active_power_limits"},
+        unit_map=unit_map,
+    )
+    assert (
+        pipeline(record)
+        == expected
+        == {
+            "name": "storage_01",
+            "active_power_limits_min": 0.0,
+            "active_power_limits_max": 1000.0,
+        }
+    )
+
+
+@pytest.mark.exporter_utils
+def test_apply_export_pipeline():
+    pipeline = compile_export_pipeline(
+        property_map={"bus": "bus_id"},
+        unnest_key_map={"bus_id": "number"},
+        default_value_map={"tap": 1.0},
+    )
+    records = [
+        {"name": "line_01", "bus": {"number": 1}},
+        {"name": "line_02", "bus": {"number": 2}, "tap": 0.9},
+    ]
+    assert apply_export_pipeline(records, pipeline) == [
+        {"name": "line_01", "bus_id": 1, "tap": 1.0},
+        {"name": "line_02", "bus_id": 2, "tap": 0.9},
+    ]
+
+
+@pytest.mark.exporter_utils
+def test_required_fields():
+    @required_fields("name")
+    def drop_key(component, key):
+        return {k: v for k, v in component.items() if k != key}
+
+    assert drop_key({"name": "gen_01", "rating": 1}, "rating") == {"name": "gen_01"}
+    with pytest.raises(FieldRemovalError):
+        drop_key({"name": "gen_01", "rating": 1}, "name")
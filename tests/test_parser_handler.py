@@ -1,9 +1,33 @@
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
+import h5py
+import numpy as np
+import polars as pl
 import pytest
 
-from r2x.parser.handler import file_handler
+from r2x.config_scenario import Scenario
+from r2x.parser.handler import ParsedData, file_handler, get_parser_data
+from r2x.parser.handler_utils import H5Reader, h5_handler
+from r2x.parser.reeds import ReEDSParser
+
+
+def _parse_reeds(run_folder, output_folder, feature_flags):
+    scenario = Scenario.from_kwargs(
+        name="parse",
+        input_model="reeds-US",
+        output_model="plexos",
+        run_folder=run_folder,
+        output_folder=output_folder,
+        solve_year=2050,
+        weather_year=2012,
+        feature_flags=feature_flags,
+    )
+    return get_parser_data(scenario, parser_class=ReEDSParser).data
+
+
+def _collect(data):
+    return data.collect() if isinstance(data, pl.LazyFrame) else data
 
 
 def test_file_handler():
@@ -14,3 +38,147 @@ def test_file_handler():
 
         with pytest.raises(NotImplementedError):
             _ = file_handler(Path(temp_file.name))
+
+
+def test_parse_data_cache(reeds_data_folder, tmp_path, monkeypatch):
+    import r2x.parser.handler as handler
+    from r2x.parser.handler import get_cache_key
+
+    def parse(feature_flags):
+        return _parse_reeds(reeds_data_folder, tmp_path, feature_flags)
+
+    cache_folder = tmp_path / "cache"
+    expected = parse({})
+    first = parse({"parser-cache": str(cache_folder)})
+    assert any(cache_folder.glob("*.parquet"))
+
+    # Second run should not read any csv.
+    def fail(*args, **kwargs):
+        raise AssertionError("File should come from the cache.")
+
+    monkeypatch.setattr(handler, "csv_handler", fail)
+    second = parse({"parser-cache": str(cache_folder)})
+
+    assert expected.keys() == first.keys() == second.keys()
+    for key, data in expected.items():
+        if isinstance(data, pl.DataFrame | pl.LazyFrame):
+            assert _collect(first[key]).equals(_collect(data)), key
+            assert _collect(second[key]).equals(_collect(data)), key
+            assert type(second[key]) is type(data)
+
+    fpath = tmp_path / "source.csv"
+    fpath.write_text("a,b\n1,2\n")
+    key = get_cache_key(fpath, solve_year=2050)
+    assert key != get_cache_key(fpath, solve_year=2040)
+    fpath.write_text("a,b\n1,2\n3,4\n")
+    assert key != get_cache_key(fpath, solve_year=2050)
+
+
+@pytest.mark.parametrize("parallel_parse", [True, "4", "on"])
+def test_parse_data_parallel(reeds_data_folder, tmp_path, parallel_parse):
+    expected = _parse_reeds(reeds_data_folder, tmp_path, {})
+    result = _parse_reeds(reeds_data_folder, tmp_path, {"parallel-parse": parallel_parse})
+
+    assert list(result) == list(expected)
+    for key, data in expected.items():
+        if isinstance(data, pl.DataFrame | pl.LazyFrame):
+            assert _collect(result[key]).equals(_collect(data)), key
+        else:
+            assert result[key] == data, key
+
+
+def test_parse_data_parallel_missing_file(reeds_data_folder, tmp_path):
+    scenario = Scenario.from_kwargs(
+        name="parse",
+        input_model="reeds-US",
+        output_model="plexos",
+        run_folder=reeds_data_folder,
+        output_folder=tmp_path,
+        solve_year=2050,
+        weather_year=2012,
+        feature_flags={"parallel-parse": True},
+    )
+    scenario.input_config.fmap["missing"] = {"fname": "missing.csv"}
+    with pytest.raises(FileNotFoundError):
+        _ = get_parser_data(scenario, parser_class=ReEDSParser)
+
+    scenario.input_config.fmap["missing"]["optional"] = True
+    parser = get_parser_data(scenario, parser_class=ReEDSParser)
+    assert "missing" not in parser.data
+
+
+def test_parse_data_lazy(reeds_data_folder, tmp_path):
+    expected = _parse_reeds(reeds_data_folder, tmp_path, {})
+    result = _parse_reeds(reeds_data_folder, tmp_path, {"lazy-parse": "true"})
+
+    assert isinstance(result, ParsedData)
+    assert isinstance(result._data["cost_vom"], pl.LazyFrame)
+    assert isinstance(result["cost_vom"], pl.DataFrame)
+    assert isinstance(result._data["cost_vom"], pl.DataFrame)
+
+    assert list(result) == list(expected)
+    for key, data in expected.items():
+        if isinstance(data, pl.DataFrame | pl.LazyFrame):
+            assert type(result[key]) is type(data), key
+            assert _collect(result[key]).equals(_collect(data)), key
+        else:
+            assert result[key] == data, key
+
+
+def test_parsed_data_collects_on_every_access():
+    def parsed_data():
+        data = ParsedData(eager=1)
+        data.set_lazy("lazy", pl.LazyFrame({"a": [1, 2]}))
+        return data
+
+    accessors = [
+        lambda data: data.get("lazy"),
+        lambda data: dict(data)["lazy"],
+        lambda data: {**data}["lazy"],
+        lambda data: dict(data.items())["lazy"],
+        lambda data: list(data.values())[1],
+        lambda data: data.setdefault("lazy", None),
+        lambda data: data.copy()["lazy"],
+        lambda data: data.pop("lazy"),
+    ]
+    for accessor in accessors:
+        assert isinstance(accessor(parsed_data()), pl.DataFrame)
+
+    data = parsed_data()
+    data.update(lazy=pl.DataFrame({"a": [3]}))
+    assert data["lazy"]["a"].to_list() == [3]
+    assert list(data) == ["eager", "lazy"]
+    assert parsed_data().copy()._pending == {"lazy"}
+
+
+@pytest.mark.parametrize("chunks", [None, (8, 2)])
+def test_h5_reader(tmp_path, chunks):
+    fpath = tmp_path / "recf.h5"
+    values = np.arange(48 * 4, dtype=np.float16).reshape(48, 4)
+    columns = ["upv_1|p1", "upv_1|p2", "wind-ons_1|p1", "wind-ons_1|p2"]
+    with h5py.File(fpath, "w") as f:
+        f.create_dataset("data", data=values, chunks=chunks, compression="gzip" if chunks else None)
+        f.create_dataset("columns", data=[column.encode("utf-8") for column in columns])
+
+    reader = h5_handler(fpath, parser_class="ReEDSParser")
+    assert isinstance(reader, H5Reader)
+    assert reader.columns == columns
+    assert len(reader) == 48
+    assert "upv_1|p2" in reader
+    assert "upv_2|p1" not in reader
+
+    profiles = reader.read(["wind-ons_1|p1", "upv_1|p1"], start=24, end=48)
+    assert list(profiles) == ["wind-ons_1|p1", "upv_1|p1"]
+    assert profiles["upv_1|p1"].dtype == np.float32
+    assert np.array_equal(profiles["wind-ons_1|p1"], values[24:48, 2])
+    assert np.array_equal(profiles["upv_1|p1"], values[24:48, 0])
+    assert np.array_equal(reader.read(columns[:3])["upv_1|p2"], values[:, 1])
+    assert np.array_equal(reader.read_array(["upv_1|p2", "upv_1|p1", "upv_1|p2"]), values[:, [1, 0, 1]])
+
+    with pytest.raises(KeyError):
+        _ = reader.read(["upv_2|p1"])
+
+    data = reader.collect()
+    assert data.columns == ["index", *columns]
+    assert data.schema == reader.collect_schema()
+    assert np.array_equal(data["upv_1|p2"].to_numpy(), values[:, 1])
@@ -1,10 +1,19 @@
 import pytest
+import numpy as np
 import polars as pl
 from datetime import datetime
 
+from infrasys.function_data import QuadraticFunctionData
+
+from r2x.models.core import MinMax
+from r2x.units import ureg
 from r2x.parser.parser_helpers import (
+    construct_pwl_batch_from_quadratic,
+    construct_pwl_from_quadtratic,
     field_filter,
     fill_missing_timestamps,
+    fit_monotone_pwl,
+    optimize_pwl,
     prepare_ext_field,
     reconcile_timeseries,
     resample_data_to_hourly,
@@ -207,3 +216,49 @@ def test_reconcile_timeseries_raises_assertion():
     # Check that AssertionError is raised
     with pytest.raises(AssertionError):
         reconcile_timeseries(data_file, hourly_time_index)
+
+
+def test_fit_monotone_pwl():
+    x, y = fit_monotone_pwl([1.0, 0.5], [-10.0, 2.0], [30.0, 0.0], [0.0, 10.0], [10.0, 20.0], 3)
+    assert np.allclose(x, [[0, 5, 10], [10, 15, 20]])
+    # First curve decreases on the first tranche, so the first two breakpoints are pooled.
+    assert np.allclose(y, [[17.5, 17.5, 30], [70, 142.5, 240]])
+
+    x_single, y_single = optimize_pwl(1.0, -10.0, 30.0, 0.0, 10.0, 3)
+    assert np.allclose(x_single, x[0])
+    assert np.allclose(y_single, y[0])
+
+    with pytest.raises(ValueError):
+        _ = optimize_pwl(1.0, -10.0, 30.0, 0.0, 10.0, 3, solver="gurobi")
+
+
+def test_construct_pwl_batch_from_quadratic():
+    fns = [
+        QuadraticFunctionData(quadratic_term=1.0, proportional_term=-10.0, constant_term=30.0),
+        QuadraticFunctionData(quadratic_term=0.5, proportional_term=2.0, constant_term=0.0),
+    ]
+    limits = [MinMax(0.0 * ureg.MW, 10.0 * ureg.MW), MinMax(10.0 * ureg.MW, 20.0 * ureg.MW)]
+    pwl_fns = construct_pwl_batch_from_quadratic(fns, x_min=[0.0, 10.0], x_max=[10.0, 20.0], num_tranches="3")
+    expected = [
+        construct_pwl_from_quadtratic(fn, {"active_power_limits": limit}, 3) for fn, limit in zip(fns, limits)
+    ]
+    assert pwl_fns == expected
+    assert construct_pwl_batch_from_quadratic([], [], []) == []
+
+
+def test_fit_monotone_pwl_matches_cvxpy():
+    pytest.importorskip("cvxpy")
+    rng = np.random.default_rng(42)
+    n_curves = 20
+    a = rng.normal(0, 0.01, n_curves)
+    b = rng.normal(5, 8, n_curves)
+    c = rng.uniform(0, 500, n_curves)
+    x_min = rng.uniform(0, 50, n_curves)
+    x_max = x_min + rng.uniform(10, 500, n_curves)
+
+    x, y = fit_monotone_pwl(a, b, c, x_min, x_max, 6)
+    assert np.all(np.diff(y, axis=1) >= 0)
+    for i in range(n_curves):
+        x_cvxpy, y_cvxpy = optimize_pwl(a[i], b[i], c[i], x_min[i], x_max[i], 6, solver="cvxpy")
+        assert np.allclose(x[i], x_cvxpy)
+        assert np.allclose(y[i], y_cvxpy, rtol=1e-6, atol=1e-6)
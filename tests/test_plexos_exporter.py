@@ -1,4 +1,8 @@
 import pytest
+from plexosdb import PlexosSQLite
+from plexosdb.enums import ClassEnum, CollectionEnum
+
+from r2x.api import System
 from r2x.config_scenario import Scenario
 from r2x.exporter.plexos import PlexosExporter
 from r2x.parser.handler import get_parser_data
@@ -56,3 +60,116 @@ def test_plexos_exporter_run(plexos_exporter, default_scenario, tmp_folder):
 
 @pytest.mark.plexos
 def test_plexos_operational_cost(reeds_system, plexos_exporter): ...
+
+
+@pytest.mark.plexos
+@pytest.mark.parametrize(
+    "feature_flags", [{"time-series-format": "parquet"}, {"time-series-compression": "gzip"}]
+)
+def test_plexos_exporter_rejects_time_series_flags(scenario_instance, data_folder, tmp_folder, feature_flags):
+    scenario_instance.feature_flags.update(feature_flags)
+    exporter = PlexosExporter(
+        config=scenario_instance,
+        system=System(),
+        database_manager=_example_db(data_folder),
+        plexos_scenario="MoreCapacity",
+        output_folder=tmp_folder,
+    )
+    with pytest.raises(ValueError, match="uncompressed csv"):
+        exporter.run()
+
+
+def _example_db(data_folder):
+    db = PlexosSQLite(xml_fname=str(data_folder / "2-bus_example.xml"))
+    # The example model does not include the master schema, so we add the minimum required to test.
+    with db._conn as conn:
+        conn.executemany(
+            "INSERT into t_class(class_id, name) values (?,?)", [(22, "Node"), (119, "Data File")]
+        )
+        conn.executemany(
+            "INSERT into t_collection(collection_id, parent_class_id, child_class_id, name) values (?,?,?,?)",
+            [(1, 1, 2, "Generators"), (12, 2, 22, "Nodes")],
+        )
+        conn.executemany(
+            "INSERT into t_property(property_id, collection_id, name, is_enabled) values (?,?,?,0)",
+            [(1, 1, "Max Capacity"), (2, 1, "Rating")],
+        )
+    return db
+
+
+def test_bulk_add_memberships_and_properties(scenario_instance, data_folder, tmp_folder):
+    db = _example_db(data_folder)
+    exporter = PlexosExporter(
+        config=scenario_instance,
+        system=System(),
+        database_manager=db,
+        plexos_scenario="MoreCapacity",
+        output_folder=tmp_folder,
+    )
+    memberships = [("SolarPV_01", "node_02"), ("ThermalCC_01", "node_01")]
+    records = [
+        {"name": "SolarPV_01", "property": "Rating", "value": 0, "text": {"Data File": "solar.csv"}},
+        {"name": "ThermalCC_01", "property": "Max Capacity", "value": 100},
+    ]
+    exporter.bulk_add_memberships(
+        memberships,
+        parent_class=ClassEnum.Generator,
+        child_class=ClassEnum.Node,
+        collection=CollectionEnum.Nodes,
+    )
+    exporter.bulk_add_properties(
+        records, object_class=ClassEnum.Generator, collection=CollectionEnum.Generators
+    )
+
+    expected_db = _example_db(data_folder)
+    for parent_name, child_name in memberships:
+        expected_db.add_membership(
+            parent_name,
+            child_name,
+            parent_class=ClassEnum.Generator,
+            child_class=ClassEnum.Node,
+            collection=CollectionEnum.Nodes,
+        )
+    for record in records:
+        expected_db.add_property(
+            record["name"],
+            record["property"],
+            record["value"],
+            object_class=ClassEnum.Generator,
+            collection=CollectionEnum.Generators,
+            scenario="MoreCapacity",
+            text=record.get("text"),
+        )
+    for table in ("t_membership", "t_data", "t_tag", "t_text", "t_property"):
+        assert db.query(f"SELECT * FROM {table}") == expected_db.query(f"SELECT * FROM {table}")
+
+    with pytest.raises(KeyError):
+        exporter.bulk_add_memberships(
+            [("SolarPV_01", "node_03")],
+            parent_class=ClassEnum.Generator,
+            child_class=ClassEnum.Node,
+            collection=CollectionEnum.Nodes,
+        )
+    with pytest.raises(KeyError):
+        exporter.bulk_add_properties(
+            [{"name": "SolarPV_01", "property": "Heat Rate", "value": 1}],
+            object_class=ClassEnum.Generator,
+            collection=CollectionEnum.Generators,
+        )
+
+    # The id reads and every insert and update of the batch run in one transaction.
+    statements: list[str] = []
+    db._conn.set_trace_callback(statements.append)
+    exporter.bulk_add_properties(
+        [{"name": "ThermalCC_01", "property": "Max Capacity", "value": 1, "text": {"Data File": "a.csv"}}],
+        object_class=ClassEnum.Generator,
+        collection=CollectionEnum.Generators,
+    )
+    db._conn.set_trace_callback(None)
+    begin = statements.index("BEGIN")
+    assert [statement for statement in statements[begin:] if statement in ("BEGIN", "COMMIT")] == [
+        "BEGIN",
+        "COMMIT",
+    ]
+    assert "MAX(data_id)" in statements[begin + 1]
+    assert statements[-1] == "COMMIT"
@@ -1,12 +1,19 @@
+import polars as pl
 import pytest
+from infrasys.function_data import QuadraticFunctionData
+from infrasys.value_curves import InputOutputCurve
 from plexosdb import XMLHandler
+from plexosdb.enums import ClassEnum, CollectionEnum
 from plexosdb.sqlite import PlexosSQLite
 
 from r2x.api import System
 from r2x.config_scenario import Scenario
 from r2x.exceptions import ParserError
+from r2x.models.core import MinMax
 from r2x.parser.handler import get_parser_data
+from r2x.parser.parser_helpers import construct_pwl_from_quadtratic
 from r2x.parser.plexos import PlexosParser
+from r2x.units import ureg
 
 DB_NAME = "2-bus_example.xml"
 MODEL_NAME = "main_model"
@@ -78,3 +85,144 @@ def test_parser_system(pjm_scenario):
     # PJM system has 48 components
     total_components = sum(1 for _ in system.iter_all_components())
     assert total_components == 48
+
+
+def test_data_file_cache(plexos_parser_instance, tmp_path):
+    data_file = tmp_path / "Rating.csv"
+    data_file.write_text("Name,Value\nGen_A,10\nGen_B,20\n")
+
+    assert plexos_parser_instance._data_file_handler("Gen_A", "Rating", str(data_file)) == 10
+    assert plexos_parser_instance._data_file_handler("Gen_B", "Rating", str(data_file)) == 20
+    assert plexos_parser_instance._data_file_handler("Gen_C", "Rating", str(data_file)) is None
+    assert plexos_parser_instance._data_file_cache_stats == {"hits": 2, "misses": 1}
+    assert len(plexos_parser_instance._data_file_cache) == 1
+
+    plexos_parser_instance._clear_data_file_cache()
+    assert not plexos_parser_instance._data_file_cache
+
+
+def test_property_index(plexos_parser_instance):
+    parser = plexos_parser_instance
+    parser.plexos_data = parser._polarize_data(parser._plexos_table_data())
+    parser._build_property_index()
+
+    generators = parser._get_class_data(ClassEnum.Generator)
+    expected = parser._get_model_data(
+        (pl.col("child_class_name") == ClassEnum.Generator.value)
+        & (pl.col("parent_class_name") == ClassEnum.System.value)
+    )
+    assert not generators.is_empty()
+    assert generators.equals(expected)
+
+    object_id = generators["object_id"][0]
+    assert parser._filter_by_object_id(object_id).equals(
+        parser._get_model_data(pl.col("object_id") == object_id)
+    )
+    assert parser._filter_by_object_id(-1).is_empty()
+    assert parser._get_class_data(ClassEnum.Line).is_empty()
+
+
+def test_parse_property_frame(plexos_parser_instance, tmp_path):
+    data_file = tmp_path / "Rating.csv"
+    data_file.write_text("Name,Value\nGen_A,10\n")
+    columns = ["name", "property_name", "property_value", "property_unit", "band", "text", "text_class_name"]
+    rows = [
+        ("Gen_A", "Max Capacity", 100.0, "MW", 1, None, None),
+        ("Gen_A", "Rating", 0.0, "MW", 1, str(data_file), "Data File"),
+        ("Gen_A", "Heat Rate", 9.0, "GJ/MWh", 1, None, None),
+        ("Gen_A", "Heat Rate", 10.0, "GJ/MWh", 2, None, None),
+        ("Gen_B", "Max Capacity", 50.0, "MW", 1, None, None),
+        ("Gen_B", "Units", 1.0, "-", 1, None, None),
+    ]
+    data = pl.DataFrame(rows, schema=columns, orient="row").with_columns(
+        pl.lit(None, dtype=pl.String).alias(column)
+        for column in ("tag_timeslice", "tag_datafile", "tag_variable", "action")
+    )
+
+    parsed = plexos_parser_instance._parse_property_frame(data)
+    for (name,), object_data in data.partition_by("name", as_dict=True).items():
+        assert parsed[name] == plexos_parser_instance._parse_property_data(object_data.to_dicts())
+
+    assert parsed["Gen_A"][0]["max_active_power"].magnitude == 10
+    assert parsed["Gen_A"][0]["heat_rate"].magnitude == 10
+    assert parsed["Gen_A"][1] == {"heat_rate"}
+    assert plexos_parser_instance._parse_property_frame(data.clear()) == {}
+
+
+def test_staged_property_data(plexos_parser_instance):
+    parser = plexos_parser_instance
+    parser.plexos_data = parser._polarize_data(parser._plexos_table_data())
+    parser._build_property_index()
+    parser._build_object_id_index()
+    parser.device_map = {"SolarPV_01": {"fuel": None, "type": "PV"}}
+    # The fuels of the example model do not define a price.
+    parser._class_index.pop((ClassEnum.Fuel.value, ClassEnum.System.value))
+
+    generator = parser._get_class_data(ClassEnum.Generator)["name"][0]
+    assert parser._get_object_id(generator.upper(), ClassEnum.Generator) == parser.db.get_object_id(
+        generator, class_name=ClassEnum.Generator
+    )
+    parser._duplicate_object_names.add((ClassEnum.Generator.value, "duplicated"))
+    with pytest.raises(ValueError):
+        parser._get_object_id("Duplicated", ClassEnum.Generator)
+    with pytest.raises(KeyError):
+        parser._get_object_id("not_a_generator", ClassEnum.Generator)
+
+    parser._stage_property_data(max_workers=2)
+    for class_enum in (ClassEnum.Node, ClassEnum.Generator, ClassEnum.Battery, ClassEnum.Region):
+        class_data = parser._get_class_data(class_enum)
+        if class_enum == ClassEnum.Generator:
+            class_data = class_data.filter(pl.col("name") == "SolarPV_01")
+        expected = parser._parse_property_frame(class_data)
+        staged = parser._get_parsed_properties(class_enum, class_data)
+        assert list(staged) == list(expected)
+        assert staged == expected
+    assert ClassEnum.Node.value not in parser._staged_properties
+
+
+def test_fit_quadratic_value_curves(plexos_parser_instance):
+    parser = plexos_parser_instance
+    parser.config.feature_flags["quad2pwl"] = 3
+    quadratic = QuadraticFunctionData(quadratic_term=1.0, proportional_term=-10.0, constant_term=30.0)
+    records = [
+        {"active_power_limits": MinMax(0.0 * ureg.MW, 10.0 * ureg.MW)},
+        {"active_power_limits": MinMax(10.0 * ureg.MW, 20.0 * ureg.MW)},
+    ]
+    value_curves = []
+    for record in records:
+        value_curves.append(InputOutputCurve(function_data=quadratic))
+        parser._quadratic_value_curves.append((value_curves[-1], record["active_power_limits"]))
+
+    parser._fit_quadratic_value_curves()
+    for value_curve, record in zip(value_curves, records):
+        assert value_curve.function_data == construct_pwl_from_quadtratic(quadratic, record, 3)
+    assert not parser._quadratic_value_curves
+
+
+def test_membership_index(plexos_parser_instance, monkeypatch):
+    memberships = [
+        ("Line", "Node", "Node From", "line_01", "node_01"),
+        ("Line", "Node", "Node To", "line_01", "node_02"),
+        ("Generator", "Node", "Nodes", "gen_01", "node_01"),
+        ("Reserve", "Generator", "Generators", "spin", "gen_01"),
+        ("Reserve", "Generator", "Generators", "reg_up", "gen_01"),
+    ]
+    monkeypatch.setattr(plexos_parser_instance.db, "query", lambda _: memberships)
+    parser = plexos_parser_instance
+    parser._build_membership_index()
+
+    assert parser._get_membership_children(
+        "line_01", ClassEnum.Line, ClassEnum.Node, CollectionEnum.NodeFrom
+    ) == ["node_01"]
+    assert parser._get_membership_children(
+        "line_01", ClassEnum.Line, ClassEnum.Node, CollectionEnum.NodeTo
+    ) == ["node_02"]
+    assert parser._get_membership_children(
+        "gen_01", ClassEnum.Generator, ClassEnum.Node, CollectionEnum.Nodes
+    ) == ["node_01"]
+    assert parser._get_membership_parents(
+        "gen_01", ClassEnum.Generator, ClassEnum.Reserve, CollectionEnum.Generators
+    ) == ["spin", "reg_up"]
+    assert not parser._get_membership_parents(
+        "gen_02", ClassEnum.Generator, ClassEnum.Reserve, CollectionEnum.Generators
+    )
@@ -1,7 +1,15 @@
 import pytest
 from datetime import datetime, timedelta
 import polars as pl
-from r2x.parser.plexos_utils import DATAFILE_COLUMNS, get_column_enum, time_slice_handler
+import numpy as np
+from r2x.parser.plexos_utils import (
+    DATAFILE_COLUMNS,
+    get_calendar_arrays,
+    get_column_enum,
+    get_pattern_mask,
+    time_slice_batch_handler,
+    time_slice_handler,
+)
 
 
 def test_get_column_enum():
@@ -91,6 +99,61 @@ def test_time_slice_handler_raises():
     with pytest.raises(TypeError):
         _ = time_slice_handler(records, datetime_index)
 
-    records = [{"pattern": "H1-2", "value": 200}, {"pattern": "M3-12", "value": 100}]
+    records = [{"pattern": "P1-2", "value": 200}, {"pattern": "M3-12", "value": 100}]
     with pytest.raises(NotImplementedError):
         _ = time_slice_handler(records, datetime_index)
+
+
+def test_calendar_arrays():
+    year = 2030
+    start = datetime(year, 1, 1)
+    datetime_index = tuple(start + i * timedelta(hours=1) for i in range(8760))
+    calendar = get_calendar_arrays(datetime_index)
+
+    assert np.array_equal(calendar["M"], [dt.month for dt in datetime_index])
+    assert np.array_equal(calendar["D"], [dt.day for dt in datetime_index])
+    assert np.array_equal(calendar["H"], [dt.hour + 1 for dt in datetime_index])
+    assert np.array_equal(calendar["W"], [dt.isoweekday() % 7 + 1 for dt in datetime_index])
+    assert get_calendar_arrays(np.array(datetime_index, dtype="datetime64[h]")) is calendar
+
+
+@pytest.mark.parametrize(
+    "pattern,expected",
+    [
+        ("M2", lambda dt: dt.month == 2),
+        ("H1-6,H18-24", lambda dt: dt.hour < 6 or dt.hour >= 17),
+        ("W1,H18-24", lambda dt: dt.isoweekday() == 7 and dt.hour >= 17),
+        ("M1-3;H1-6", lambda dt: dt.month <= 3 or dt.hour < 6),
+        ("D1,M6", lambda dt: dt.day == 1 and dt.month == 6),
+        ("W2-6,H8-23", lambda dt: dt.isoweekday() <= 5 and 7 <= dt.hour < 23),
+    ],
+)
+def test_pattern_mask(pattern, expected):
+    start = datetime(2030, 1, 1)
+    datetime_index = tuple(start + i * timedelta(hours=1) for i in range(8760))
+    mask = get_pattern_mask(pattern, get_calendar_arrays(datetime_index))
+    assert np.array_equal(mask, [expected(dt) for dt in datetime_index])
+
+
+def test_time_slice_batch_handler():
+    start = datetime(2030, 1, 1)
+    datetime_index = tuple(start + i * timedelta(hours=1) for i in range(8760))
+    records = {
+        "rating": [{"pattern": "M1-6", "value": 90}, {"pattern": "M7-12", "value": 80}],
+        "load": [{"pattern": "W2-6,H8-23", "value": 2}, {"pattern": "W1;W7", "value": 1}],
+    }
+    result = time_slice_batch_handler(records, datetime_index)
+
+    assert list(result) == ["rating", "load"]
+    for key, key_records in records.items():
+        assert np.array_equal(result[key], time_slice_handler(key_records, datetime_index))
+    assert result["load"][0] == 0  # Tuesday at hour ending 1
+    assert result["load"][7] == 2  # Tuesday at hour ending 8
+    assert result["load"][24 * 4] == 1  # Saturday
+
+
+@pytest.mark.parametrize("pattern", ["D40", "H25", "W8", "M0-3", "W2,H1-30"])
+def test_pattern_mask_raises_out_of_range(pattern):
+    calendar = get_calendar_arrays([datetime(2030, 1, 1)])
+    with pytest.raises(ValueError):
+        _ = get_pattern_mask(pattern, calendar)
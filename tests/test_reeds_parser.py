@@ -1,11 +1,26 @@
+import numpy as np
+import pandas as pd
+import polars as pl
 import pytest
 from infrasys.time_series_models import SingleTimeSeries
 
 from r2x.api import System
 from r2x.config_scenario import Scenario
-from r2x.models import MonitoredLine, Emission, Generator, PowerLoad
+from r2x.enums import PrimeMoversType
+from r2x.models import (
+    Emission,
+    Generator,
+    HydroDispatch,
+    HydroEnergyReservoir,
+    MonitoredLine,
+    PowerLoad,
+    RenewableDispatch,
+    Reserve,
+)
 from r2x.parser.handler import get_parser_data
+from r2x.parser.polars_helpers import pl_left_multi_join
 from r2x.parser.reeds import ReEDSParser
+from r2x.utils import read_csv
 
 
 @pytest.fixture
@@ -51,6 +66,16 @@ def test_construct_generators(reeds_parser_instance):
     )  # Total number of devices for the pacific scenario for 2050
 
 
+def test_construct_generators_without_reserves(reeds_parser_instance):
+    reeds_parser_instance.system = System(name="Test", auto_add_composed_components=True)
+    reeds_parser_instance._construct_buses()
+    reeds_parser_instance._construct_generators()
+    generators = list(reeds_parser_instance.system.get_components(Generator))
+    assert generators
+    assert reeds_parser_instance.reserve_map is None
+    assert not any(getattr(generator, "services", None) for generator in generators)
+
+
 def test_construct_load_time_series(reeds_parser_instance):
     load_df = reeds_parser_instance.get_data("load").collect()
     reeds_parser_instance.system = System(name="Test")
@@ -69,6 +94,37 @@ def test_construct_load_time_series(reeds_parser_instance):
     assert len(ts.data) == len(load_df[single_load.bus.name][end_idx - 8760 : end_idx])
 
 
+def test_construct_cf_time_series(reeds_parser_instance):
+    parser = reeds_parser_instance
+    parser.system = System(name="Test", auto_add_composed_components=True)
+    parser._construct_buses()
+    parser._construct_reserves()
+    parser._construct_generators()
+    parser._construct_cf_time_series()
+
+    cf_data = parser.get_data("cf")
+    cf_adjustment = parser.get_data("cf_adjustment")
+    ilr = parser.get_data("ilr")
+    end_idx = 8760 * (parser.config.weather_year - 2007 + 1) if len(cf_data) > 8760 else 8760
+    generators = list(parser.system.get_components(RenewableDispatch))
+    assert generators
+    for generator in generators:
+        tech = generator.ext["reeds_tech"]
+        profile_name = generator.name
+        if "|" in cf_data.columns[0]:
+            profile_name = "|".join(profile_name.rsplit("_", 1))
+        cf_adj = cf_adjustment.filter(tech=tech)["cf_adj"].median()
+        ilr_value = ilr.filter(tech=tech)["ilr"].sum() if tech in ilr["tech"] else 1
+        expected = (
+            generator.active_power.magnitude
+            * ilr_value
+            * cf_adj
+            * cf_data.read([profile_name], start=end_idx - 8760, end=end_idx)[profile_name].astype(np.float64)
+        )
+        ts = parser.system.get_time_series(generator)
+        assert np.array_equal(ts.data.magnitude, expected)
+
+
 @pytest.fixture
 def reeds_system(reeds_parser_instance):
     return reeds_parser_instance.build_system()
@@ -87,3 +143,93 @@ def test_construct_branches(reeds_system):
     branch_objects = [component for component in reeds_system.get_components(MonitoredLine)]
     assert all(isinstance(component, MonitoredLine) for component in branch_objects)
     assert len(branch_objects) == 17  # With rating on both direction
+
+
+def _expected_reserve_provision(system, reserve, defaults):
+    """Per reserve computation of the provision that the region index replaced."""
+
+    def profiles(component_type, prime_movers=None):
+        components = system.get_components(
+            component_type,
+            filter_func=lambda x: (
+                x.bus.load_zone.name == reserve.region.name
+                and (prime_movers is None or x.prime_mover_type in prime_movers)
+            ),
+        )
+        return pd.DataFrame(
+            {
+                component.name: system.get_time_series(component).data.magnitude
+                for component in components
+                if system.has_time_series(component)
+            }
+        )
+
+    solar = profiles(RenewableDispatch, (PrimeMoversType.PV, PrimeMoversType.RTPV))
+    solar_capacity = sum(
+        system.get_component(RenewableDispatch, name).active_power.magnitude for name in solar
+    )
+    wind = profiles(RenewableDispatch, (PrimeMoversType.WT, PrimeMoversType.WS))
+    load = profiles(PowerLoad)
+    reserve_type = reserve.reserve_type.name
+    wind_provision = wind.sum(axis=1).mul(defaults["wind_reserves"].get(reserve_type, 1))
+    solar_provision = (
+        solar.sum(axis=1)
+        .apply(lambda x: 1 if x != 0 else 0)
+        .mul(solar_capacity)
+        .mul(defaults["solar_reserves"].get(reserve_type, 1))
+    )
+    load_provision = load.sum(axis=1).mul(defaults["load_reserves"].get(reserve_type, 1))
+    return load_provision.add(solar_provision, fill_value=0).add(wind_provision, fill_value=0).to_numpy()
+
+
+def test_construct_reserve_provision(reeds_parser_instance, reeds_system):
+    reserves = list(reeds_system.get_components(Reserve))
+    assert reserves
+    for reserve in reserves:
+        expected = _expected_reserve_provision(
+            reeds_system, reserve, reeds_parser_instance.reeds_config.defaults
+        )
+        requirement = reeds_system.get_time_series(reserve, variable_name="requirement").data
+        assert len(requirement) == len(expected) > 0
+        np.testing.assert_allclose(requirement, expected, rtol=1e-12)
+        assert reserve.max_requirement == pytest.approx(expected.sum(), rel=1e-12)
+
+
+def _expected_hydro_profiles(parser, generator, time_index, daily):
+    """Per generator computation of the hydro profiles that the monthly matrices replaced."""
+    month_map = parser.reeds_config.defaults["month_map"]
+    hydro_cf = parser.get_data("hydro_cf").with_columns(
+        month=pl.col("month").map_elements(lambda row: month_map.get(row, row), return_dtype=pl.String)
+    )
+    month_hrs = read_csv("month_hrs.csv").collect().rename({"szn": "season"})
+    hydro_data = pl_left_multi_join(hydro_cf, month_hrs)
+    month_of_index = np.array([dt.astype("datetime64[M]").astype(int) % 12 + 1 for dt in time_index])
+
+    expected = np.zeros(len(month_of_index), dtype=float)
+    hydro_ratings = hydro_data.filter(
+        (pl.col("tech") == generator.ext["reeds_tech"]) & (pl.col("region") == generator.bus.name)
+    )
+    for row in hydro_ratings.iter_rows(named=True):
+        month = int(row["month"].removeprefix("M")) if isinstance(row["month"], str) else row["month"]
+        rating = generator.active_power.magnitude * row["hydro_cf"]
+        expected[month_of_index == month] = rating * row["hrs"] / (row["hrs"] / 24) if daily else rating
+    return expected
+
+
+def test_construct_hydro_profiles(reeds_parser_instance, reeds_system):
+    parser = reeds_parser_instance
+    budget_generators = list(
+        reeds_system.get_components(HydroDispatch, filter_func=lambda x: x.category != "can-imports")
+    )
+    rating_generators = list(reeds_system.get_components(HydroEnergyReservoir))
+    assert budget_generators or rating_generators
+
+    for generator in budget_generators:
+        expected = _expected_hydro_profiles(parser, generator, parser.daily_time_index, daily=True)
+        ts = reeds_system.get_time_series(generator, variable_name="hydro_budget")
+        np.testing.assert_allclose(ts.data.to("GWh").magnitude, expected / 1e3, rtol=1e-12)
+
+    for generator in rating_generators:
+        expected = _expected_hydro_profiles(parser, generator, parser.hourly_time_index, daily=False)
+        ts = reeds_system.get_time_series(generator, variable_name="max_active_power")
+        np.testing.assert_allclose(ts.data.to("MW").magnitude, expected, rtol=1e-12)
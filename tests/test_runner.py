@@ -1,4 +1,5 @@
 import pytest
+from r2x.exceptions import ScenarioRunError
 from r2x.runner import init, run
 
 
@@ -54,3 +55,26 @@ def test_init(tmp_path):
     cli_input = {"path": str(tmp_path)}
     _ = init(cli_input)
     assert (tmp_path / "user_dict.yaml").exists()
+
+
+def test_runner_parallel(tmp_path, reeds_data_folder):
+    cli_input = {
+        "weather_year": 2015,
+        "solve_year": [2055],
+        "input_model": "reeds-US",
+        "output_model": "infrasys",
+        "output_folder": str(tmp_path),
+        "jobs": 2,
+    }
+    user_dict = {
+        "scenarios": [
+            {"name": "Good", "run_folder": reeds_data_folder},
+            {"name": "Bad", "run_folder": str(tmp_path / "missing")},
+        ]
+    }
+
+    with pytest.raises(ScenarioRunError, match="Bad"):
+        _ = run(cli_input, user_dict)
+    assert (tmp_path / "Good.json").exists()
+    assert (tmp_path / "Good.log").exists()
+    assert "Traceback" in (tmp_path / "Bad.log").read_text()
@@ -1,3 +1,4 @@
+import json
 from typing import Any
 from infrasys.cost_curves import CostCurve, FuelCurve, UnitSystem
 from infrasys.function_data import PiecewiseLinearData, QuadraticFunctionData, XYCoords
@@ -53,6 +54,24 @@ def test_sienna_exporter_run(sienna_exporter, tmp_folder):
     assert any(ts_directory.iterdir())
 
 
+@pytest.mark.sienna
+@pytest.mark.parametrize(
+    "feature_flags, suffix",
+    [({"time-series-format": "parquet"}, ".parquet"), ({"time-series-compression": "gzip"}, ".csv.gz")],
+)
+def test_sienna_timeseries_pointers_format(sienna_exporter, tmp_folder, feature_flags, suffix):
+    sienna_exporter.config.feature_flags.update(feature_flags)
+    sienna_exporter.export_data_files(year=sienna_exporter.year)
+    sienna_exporter.create_timeseries_pointers()
+
+    with open(tmp_folder / "timeseries_pointers.json") as f:
+        ts_pointers = json.load(f)
+    assert ts_pointers
+    for ts_pointer in ts_pointers:
+        assert ts_pointer["data_file"].endswith(suffix)
+        assert (tmp_folder / ts_pointer["data_file"]).exists()
+
+
 def test_sienna_exporter_empty_storage(caplog, sienna_exporter):
     sienna_exporter.process_storage_data()
     assert "No storage devices found" in caplog.text
@@ -1,4 +1,11 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+import numpy as np
+from infrasys.time_series_models import SingleTimeSeries
+
 from r2x.api import System
+from r2x.models import Area
 
 
 def test_serialization(infrasys_test_system, tmp_path):
@@ -8,3 +15,41 @@ def test_serialization(infrasys_test_system, tmp_path):
 
     assert system._uuid == deserialized_system._uuid
     assert system._components.get_num_components() == deserialized_system._components.get_num_components()
+
+
+def test_get_reserves_by_region(infrasys_test_system):
+    system = infrasys_test_system
+    reserves_by_region = system.get_reserves_by_region()
+
+    assert list(reserves_by_region) == ["init"]
+    assert [reserve.name for reserve in reserves_by_region["init"]] == ["SpinUp-pjm"]
+    assert system.get_reserves_by_region(filter_func=lambda x: x.name != "SpinUp-pjm") == {}
+
+
+def test_add_time_series_deduplicates_identical_profiles():
+    system = System(name="test")
+    areas = [Area(name=name) for name in ("a", "b", "c")]
+    system.add_components(*areas)
+
+    def profile(values):
+        return SingleTimeSeries.from_array(
+            np.array(values, dtype=float),
+            variable_name="max_active_power",
+            initial_time=datetime(2024, 1, 1),
+            resolution=timedelta(hours=1),
+        )
+
+    system.add_time_series(profile([1.0, 2.0, 3.0]), areas[0])
+    system.add_time_series(profile([1.0, 2.0, 3.0]), areas[1])
+    system.add_time_series(profile([1.0, 2.0, 4.0]), areas[2])
+
+    ts_a, ts_b, ts_c = (system.get_time_series(area) for area in areas)
+    assert ts_a.uuid == ts_b.uuid
+    assert ts_a.uuid != ts_c.uuid
+    np.testing.assert_array_equal(ts_b.data, [1.0, 2.0, 3.0])
+
+    # The system only keeps the uuid of the stored series, and removed series can be added again.
+    assert all(isinstance(ts_uuid, UUID) for ts_uuid in system._time_series_uuids.values())
+    system.remove_time_series(areas[0], areas[1])
+    system.add_time_series(profile([1.0, 2.0, 3.0]), areas[0])
+    np.testing.assert_array_equal(system.get_time_series(areas[0]).data, [1.0, 2.0, 3.0])
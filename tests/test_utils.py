@@ -3,7 +3,17 @@ import json
 import pytest
 import yaml
 
-from r2x.utils import haskey, override_dict, read_user_dict
+from r2x.enums import ThermalFuels
+from r2x.utils import (
+    _match_category,
+    get_enum_from_string,
+    get_max_workers,
+    haskey,
+    is_flag_enabled,
+    match_category,
+    override_dict,
+    read_user_dict,
+)
 
 
 @pytest.mark.utils
@@ -136,3 +146,52 @@ def test_read_user_dict(tmp_path):
 def test_update_dict(original, override, expected):
     result = override_dict(original, override)
     assert result == expected
+
+
+@pytest.mark.utils
+def test_match_category_is_memoized():
+    _match_category.cache_clear()
+    categories = ["wind-ons", "wind-ofs", "upv"]
+    assert match_category("wind-ons_1", categories) == "wind-ons"
+    assert match_category("wind-ons_1", categories) == "wind-ons"
+    assert match_category("unknown-tech", categories) == "unknown-tech"
+    info = _match_category.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+
+
+@pytest.mark.utils
+def test_get_enum_from_string_is_memoized():
+    get_enum_from_string.cache_clear()
+    assert get_enum_from_string("coal", ThermalFuels) == ThermalFuels.COAL
+    assert get_enum_from_string("coal", ThermalFuels) == ThermalFuels.COAL
+    assert get_enum_from_string.cache_info().hits == 1
+    with pytest.raises(KeyError):
+        get_enum_from_string("not-a-fuel", ThermalFuels)
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    "flag, expected",
+    [
+        (None, False),
+        (False, False),
+        ("false", False),
+        ("0", False),
+        ("No", False),
+        (True, True),
+        ("on", True),
+        (4, True),
+    ],
+)
+def test_is_flag_enabled(flag, expected):
+    assert is_flag_enabled(flag) == expected
+
+
+@pytest.mark.utils
+@pytest.mark.parametrize(
+    "flag, expected",
+    [(True, None), ("true", None), ("yes", None), ("on", None), (4, 4), ("4", 4)],
+)
+def test_get_max_workers(flag, expected):
+    assert get_max_workers(flag) == expected